@@ -4,6 +4,7 @@ import asyncio
 import logging
 from pathlib import Path
 
+import voluptuous as vol
 from homeassistant.components import frontend, websocket_api
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.components.lovelace import _register_panel
@@ -16,7 +17,7 @@ from homeassistant.components.websocket_api.decorators import (
 from homeassistant.components.websocket_api.messages import result_message
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import floor_registry as fr
@@ -24,9 +25,13 @@ from homeassistant.helpers.icon import async_get_icons
 from homeassistant.helpers.translation import async_get_translations
 
 from custom_components.linus_dashboard import utils
-from custom_components.linus_dashboard.aggregate import DOMAIN_ACTIVE_STATES
+from custom_components.linus_dashboard.aggregate import (
+    DOMAIN_ACTIVE_STATES,
+    domain_profiles,
+)
 from custom_components.linus_dashboard.const import (
     CONF_ALARM_ENTITY_IDS,
+    CONF_COMPACT_GROUP_ATTRIBUTES,
     CONF_EMBEDDED_DASHBOARDS,
     CONF_EXCLUDED_DEVICE_CLASSES,
     CONF_EXCLUDED_DOMAINS,
@@ -40,6 +45,36 @@ from custom_components.linus_dashboard.const import (
     VERSION,
     is_logger_debug,
 )
+from custom_components.linus_dashboard.entity_group import (
+    DATA_COMPACT_GROUP_ATTRIBUTES,
+    MEMBER_FILTERS,
+    ExclusionConfig,
+    async_aggregate_snapshot,
+    async_get_exclusion_predicate,
+    async_get_member_lists,
+    async_schedule_group_updates,
+    member_page,
+)
+from custom_components.linus_dashboard.group_engine import (
+    async_get_aggregate_feed,
+    async_get_debounce_wheel,
+    async_get_propagation_engine,
+    async_setup_debounce_wheel,
+    async_setup_propagation_engine,
+    async_setup_state_dispatcher,
+    debounce_bounds,
+    priority_device_classes,
+)
+from custom_components.linus_dashboard.group_manager import (
+    async_run_options_callbacks,
+    async_setup_rebuild_scheduler,
+)
+from custom_components.linus_dashboard.hierarchy import (
+    async_setup_hierarchy_builder,
+)
+from custom_components.linus_dashboard.registry_index import (
+    async_setup_registry_index,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -57,6 +92,10 @@ PLATFORMS: list[Platform] = [
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# entry_id -> the ExclusionConfig the platforms were last built with, so
+# async_options_updated can tell an exclusion change from any other option.
+DATA_APPLIED_EXCLUSIONS = "applied_exclusions"
+
 
 async def async_setup(hass: HomeAssistant, _config: dict) -> bool:
     """Set up Linus Dashboard."""
@@ -65,7 +104,12 @@ async def async_setup(hass: HomeAssistant, _config: dict) -> bool:
 
     # Register WebSocket commands
     websocket_api.async_register_command(hass, websocket_get_entities)
-    _LOGGER.info("Registered WebSocket command: linus_dashboard/get_config")
+    websocket_api.async_register_command(hass, websocket_group_members)
+    websocket_api.async_register_command(hass, websocket_subscribe_aggregates)
+    _LOGGER.info(
+        "Registered WebSocket commands: linus_dashboard/get_config, "
+        "linus_dashboard/group_members, linus_dashboard/subscribe_aggregates"
+    )
 
     return True
 
@@ -317,6 +361,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})["icons"] = await async_get_icons(
         hass, "entity_component", list(DOMAIN_ACTIVE_STATES)
     )
+    # Compiled once into per-(domain, device_class) icon/color tables that
+    # every group recompute looks its outcome up in (aggregate.DomainProfile).
+    domain_profiles(hass)
 
     # Same reasoning, for names instead of icons: HA only auto-names an
     # unnamed entity after its device_class for binary_sensor
@@ -330,16 +377,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass, hass.config.language, "entity_component", list(DOMAIN_ACTIVE_STATES)
     )
 
-    # Forward platforms (aggregate sensors + area/floor/global group entities)
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Build the shared registry index once for this entry, before platforms
+    # load — every platform's scans (and rebuilds) query it instead of
+    # walking the whole entity registry. Kept current from registry events
+    # from here on; see registry_index.py.
+    async_setup_registry_index(hass, entry)
+    # The shared per-pass member scan every platform builds from (see
+    # hierarchy.py), and one coalescing rebuild queue shared by every group
+    # platform (see group_manager.RebuildScheduler) — both must exist
+    # before the platforms load.
+    hierarchy = async_setup_hierarchy_builder(hass, entry)
+    # The single state_changed listener every group and sensor subscribes
+    # its members through, the tick wheel all their debounces share, and
+    # the engine carrying a group's recompute up to its floor and global
+    # groups in one tick (see group_engine.py).
+    async_setup_state_dispatcher(hass, entry)
+    async_setup_debounce_wheel(hass, entry)
+    async_setup_propagation_engine(hass, entry)
+    async_setup_rebuild_scheduler(hass, entry)
+    hass.data[DOMAIN].setdefault(DATA_APPLIED_EXCLUSIONS, {})[entry.entry_id] = (
+        ExclusionConfig.from_config_entry(entry)
+    )
+    hass.data[DOMAIN][DATA_COMPACT_GROUP_ATTRIBUTES] = entry.options.get(
+        CONF_COMPACT_GROUP_ATTRIBUTES, False
+    )
+
+    # Forward platforms (aggregate sensors + area/floor/global group
+    # entities), every one of them building from the same scan.
+    with hierarchy.shared_pass():
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     await async_hide_group_entities_from_voice_assistants(hass, entry)
 
+    # Options are applied in place (async_options_updated), not by reloading
+    # the entry — a reload tore down and re-created every group entity.
+    entry.async_on_unload(entry.add_update_listener(async_options_updated))
+
     # Store the entry
     hass.data[DOMAIN][entry.entry_id] = DOMAIN
     return True
 
 
+async def async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """
+    Apply an options change without reloading the config entry.
+
+    Only the exclusion options shape which entities exist: when they change,
+    the shared ExclusionPredicate drops just the verdicts the diff touches
+    and every platform re-runs its rebuild through its idempotent factories,
+    so unaffected groups keep their entity (and their state history).
+    Everything else (weather, greeting, alarms, embedded dashboards) is read
+    live by the frontend through linus_dashboard/get_config and needs
+    nothing here; the voice-assistant option, the debounce bounds, the
+    priority device classes and compact group attributes are re-applied
+    directly.
+    """
+    applied = hass.data[DOMAIN].setdefault(DATA_APPLIED_EXCLUSIONS, {})
+    exclusions = ExclusionConfig.from_config_entry(entry)
+    if applied.get(entry.entry_id) != exclusions:
+        applied[entry.entry_id] = exclusions
+        async_get_exclusion_predicate(hass, exclusions)
+        await async_run_options_callbacks(hass, entry)
+        _LOGGER.debug("Applied exclusion changes in place")
+
+    async_get_debounce_wheel(hass).async_set_bounds(*debounce_bounds(entry.options))
+    async_get_propagation_engine(hass).async_set_priority_device_classes(
+        priority_device_classes(entry.options)
+    )
+    compact = entry.options.get(CONF_COMPACT_GROUP_ATTRIBUTES, False)
+    if hass.data[DOMAIN].get(DATA_COMPACT_GROUP_ATTRIBUTES, False) != compact:
+        hass.data[DOMAIN][DATA_COMPACT_GROUP_ATTRIBUTES] = compact
+        # Every group republishes its attributes, with or without the lists.
+        async_schedule_group_updates(hass)
+    await async_hide_group_entities_from_voice_assistants(hass, entry)
+
+
 async def async_hide_group_entities_from_voice_assistants(
     hass: HomeAssistant, entry: ConfigEntry
 ) -> None:
@@ -418,6 +530,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not unload_ok:
         return False
 
+    hass.data[DOMAIN].get(DATA_APPLIED_EXCLUSIONS, {}).pop(entry.entry_id, None)
+
     # Retrieve and remove the panel name
     panel_url = hass.data[DOMAIN].pop(entry.entry_id, None)
     if panel_url:
@@ -462,6 +576,10 @@ async def websocket_get_entities(
         CONF_EMBEDDED_DASHBOARDS: config_entries[0].options.get(
             CONF_EMBEDDED_DASHBOARDS, []
         ),
+        # Groups leave their member lists to linus_dashboard/group_members.
+        CONF_COMPACT_GROUP_ATTRIBUTES: config_entries[0].options.get(
+            CONF_COMPACT_GROUP_ATTRIBUTES, False
+        ),
         "debug": debug_enabled,
         "version": VERSION,  # Include version for frontend version check
     }
@@ -473,3 +591,76 @@ async def websocket_get_entities(
     )
 
     connection.send_message(result_message(msg["id"], config))
+
+
+@websocket_command({
+    "type": "linus_dashboard/group_members",
+    vol.Required("entity_id"): str,
+    vol.Optional("filter", default="all"): vol.In(MEMBER_FILTERS),
+    vol.Optional("search"): str,
+    vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+    vol.Optional("limit", default=100): vol.All(int, vol.Range(min=1, max=1000)),
+})
+@callback
+def websocket_group_members(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict
+) -> None:
+    """
+    One page of a group's or sensor's members, each with its state. The
+    lists are left out of the recorded state rows
+    (GROUP_UNRECORDED_ATTRIBUTES), and out of the state altogether with
+    CONF_COMPACT_GROUP_ATTRIBUTES; this is where dashboards page through
+    them instead.
+    """
+    lists = async_get_member_lists(hass, msg["entity_id"])
+    if lists is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            f"{msg['entity_id']} is not a Linus Dashboard group",
+        )
+        return
+    page = member_page(
+        hass,
+        lists,
+        member_filter=msg["filter"],
+        search=msg.get("search"),
+        offset=msg["offset"],
+        limit=msg["limit"],
+    )
+    connection.send_message(
+        result_message(msg["id"], {"entity_id": msg["entity_id"], **page})
+    )
+
+
+@websocket_command({
+    "type": "linus_dashboard/subscribe_aggregates",
+    vol.Optional("scope"): vol.In(("area", "floor", "global")),
+    vol.Optional("scope_id"): str,
+})
+@callback
+def websocket_subscribe_aggregates(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict
+) -> None:
+    """
+    Stream the value, active_count, total, icon and color of every group
+    and sensor — or of one scope's (an area, a floor, the global groups) —
+    instead of their full state on every write. The first event carries
+    the current fields; each later one, at most once per tick, only the
+    fields that changed, with None for a group that was removed.
+    """
+    msg_id = msg["id"]
+
+    @callback
+    def _send(changes: dict) -> None:
+        connection.send_message(
+            websocket_api.event_message(msg_id, {"changes": changes})
+        )
+
+    connection.send_message(result_message(msg_id))
+    connection.subscriptions[msg_id] = async_get_aggregate_feed(hass).async_subscribe(
+        _send,
+        async_aggregate_snapshot(hass),
+        tier=msg.get("scope"),
+        scope_id=msg.get("scope_id"),
+    )
@@ -1,5 +1,8 @@
 """Aggregate computation logic for Linus Dashboard sensors."""
 
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING
 
 from .const import DOMAIN
@@ -65,18 +68,106 @@ BINARY_SENSOR_COLORS: dict[str, dict[str, str]] = {
 
 def compute_active_count(entity_states: dict[str, str], domain: str) -> int:
     """Count entities in active states."""
-    active_states = DOMAIN_ACTIVE_STATES.get(domain, ["on"])
-    return sum(1 for state in entity_states.values() if state in active_states)
+    return _static_profile(domain).summarize(entity_states).active_count
 
 
 def compute_active_entity_ids(entity_states: dict[str, str], domain: str) -> list[str]:
     """Get list of entity IDs that are currently active."""
-    active_states = DOMAIN_ACTIVE_STATES.get(domain, ["on"])
-    return [eid for eid, state in entity_states.items() if state in active_states]
+    return _static_profile(domain).summarize(entity_states).active_entity_ids
+
+
+class ActiveMemberTracker:
+    """
+    A group's member states, kept in step one state_changed event at a time.
+
+    compute_group_attributes used to re-read every member from hass.states
+    on each debounced recompute, then walk the result three more times
+    (active ids, icon, color) — O(members) per event, with hundreds of
+    members in a global binary_sensor group. The tracker holds the usable
+    (not unavailable/unknown) state of each member, a count per state and
+    the set of active members: `update` applies one event in O(1), and only
+    a membership change costs a full `recount`.
+    """
+
+    def __init__(self, domain: str, active_states: Iterable[str] | None = None) -> None:
+        self.domain = domain
+        self.active_states = frozenset(
+            active_states
+            if active_states is not None
+            else DOMAIN_ACTIVE_STATES.get(domain, ["on"])
+        )
+        # Member -> position, so active ids come out in member order.
+        self._order: dict[str, int] = {}
+        self._states: dict[str, str] = {}
+        self._counts: dict[str, int] = {}
+        self._active: set[str] = set()
+
+    def recount(
+        self, member_entity_ids: Iterable[str], entity_states: Mapping[str, str]
+    ) -> None:
+        """Start over from the full member list and their current states."""
+        self._order = {
+            entity_id: index
+            for index, entity_id in enumerate(dict.fromkeys(member_entity_ids))
+        }
+        self._states = {}
+        self._counts = {}
+        self._active = set()
+        for entity_id in self._order:
+            self._set(entity_id, entity_states.get(entity_id))
+
+    def update(self, entity_id: str, state: str | None) -> bool:
+        """Apply one member's new state (None: gone); False if not a member."""
+        if entity_id not in self._order:
+            return False
+        self._set(entity_id, state)
+        return True
+
+    def _set(self, entity_id: str, state: str | None) -> None:
+        if state in ("unavailable", "unknown"):
+            state = None
+        old = self._states.get(entity_id)
+        if old == state:
+            return
+        if old is not None:
+            self._counts[old] -= 1
+            if not self._counts[old]:
+                del self._counts[old]
+        if state is None:
+            self._states.pop(entity_id, None)
+        else:
+            self._states[entity_id] = state
+            self._counts[state] = self._counts.get(state, 0) + 1
+        if state in self.active_states:
+            self._active.add(entity_id)
+        else:
+            self._active.discard(entity_id)
+
+    @property
+    def observed_states(self) -> Collection[str]:
+        """Every distinct usable state at least one member is in."""
+        return self._counts.keys()
+
+    @property
+    def active_count(self) -> int:
+        return len(self._active)
+
+    def active_entity_ids(self) -> list[str]:
+        """Active members, in member order: O(active), not O(members)."""
+        return sorted(self._active, key=self._order.__getitem__)
+
+    def active_states_by_id(self) -> dict[str, str]:
+        """entity_id -> state of the active members, in member order."""
+        return {
+            entity_id: self._states[entity_id] for entity_id in self.active_entity_ids()
+        }
 
 
 FALLBACK_ICON = "mdi:help-circle"
 
+# hass.data[DOMAIN] key of the DomainProfiles compiled from "icons".
+DATA_DOMAIN_PROFILES = "domain_profiles"
+
 
 def compute_icon(
     hass: "HomeAssistant",
@@ -105,26 +196,195 @@ def compute_icon(
     so state.get(target, default) is correct for every domain without
     needing to know which one "default" represents.
     """
-    domain_icons = hass.data.get(DOMAIN, {}).get("icons", {}).get(domain, {})
-    dc_data = domain_icons.get(device_class or "_") or domain_icons.get("_") or {}
-    state_icons = dc_data.get("state", {})
-    default_icon = dc_data.get("default", FALLBACK_ICON)
-
-    active_states = DOMAIN_ACTIVE_STATES.get(domain, ["on"])
-    observed = set(entity_states.values())
-
-    active_observed = [s for s in active_states if s in observed]
-    if active_observed:
-        target = active_observed[0]
-    else:
-        inactive_observed = [s for s in observed if s not in active_states]
-        target = next((s for s in inactive_observed if s in state_icons), None) or (
-            inactive_observed[0] if inactive_observed else None
+    return domain_profile(hass, domain, device_class).summarize(entity_states).icon
+
+
+def compute_icon_for_states(
+    hass: "HomeAssistant",
+    domain: str,
+    observed: Collection[str],
+    device_class: str | None = None,
+) -> str:
+    """compute_icon from just the distinct states the members are in."""
+    return domain_profile(hass, domain, device_class).icon(observed)
+
+
+@dataclass(slots=True)
+class GroupSummary:
+    """Everything a group displays about its members, from one pass."""
+
+    total: int
+    active_entity_ids: list[str]
+    # The state the icon was picked for (see DomainProfile.winner).
+    winner: str | None
+    icon: str
+    color: str
+
+    @property
+    def active_count(self) -> int:
+        return len(self.active_entity_ids)
+
+
+def summarize_members(
+    hass: "HomeAssistant",
+    domain: str,
+    entity_states: Mapping[str, str],
+    device_class: str | None = None,
+) -> GroupSummary:
+    """
+    The fused group kernel: total, active members, winning state, icon and
+    color in a single pass over `entity_states` (member -> state, in member
+    order). compute_active_count, compute_active_entity_ids, compute_icon
+    and compute_color are each one field of it.
+    """
+    return domain_profile(hass, domain, device_class).summarize(entity_states)
+
+
+class DomainProfile:
+    """
+    Precompiled icon and color of one (domain, device_class), by state.
+
+    Holds compute_icon's outcome for every state that can win (see winner),
+    so the icon costs one scan of the domain's active states over the
+    observed set and one dict lookup — rather than a walk of the nested
+    icon cache and temporary lists. The color is compute_color's: that of
+    the first active member, in member order, with a color of its own.
+    """
+
+    __slots__ = (
+        "_active_rank",
+        "_active_states",
+        "_colors",
+        "_icon_states",
+        "_icons",
+    )
+
+    def __init__(
+        self,
+        domain: str,
+        device_class: str | None,
+        icons: Mapping[str, Mapping],
+    ) -> None:
+        domain_icons = icons.get(domain, {})
+        dc_data = domain_icons.get(device_class or "_") or domain_icons.get("_") or {}
+        state_icons: Mapping[str, str] = dc_data.get("state", {})
+        default_icon = dc_data.get("default", FALLBACK_ICON)
+        self._active_states = tuple(DOMAIN_ACTIVE_STATES.get(domain, ["on"]))
+        self._active_rank = {state: i for i, state in enumerate(self._active_states)}
+        # Inactive states with an icon of their own.
+        self._icon_states = frozenset(state_icons) - set(self._active_states)
+        # Winning state (None: no member, or no state with its own icon) ->
+        # icon.
+        self._icons: dict[str | None, str] = {
+            state: state_icons.get(state, default_icon) for state in self._active_states
+        }
+        for state in self._icon_states:
+            self._icons[state] = state_icons[state]
+        self._icons[None] = default_icon
+        # Active state -> color, for the active states that have one.
+        colors = _color_map(domain, device_class)
+        self._colors = {
+            state: colors[state] for state in self._active_states if state in colors
+        }
+
+    def winner(self, observed: Collection[str]) -> str | None:
+        """
+        The state the group displays: the first of the domain's active states
+        any member is in, else an observed inactive state with its own icon.
+        """
+        for state in self._active_states:
+            if state in observed:
+                return state
+        for state in observed:
+            if state in self._icon_states:
+                return state
+        return None
+
+    def icon(self, observed: Collection[str]) -> str:
+        """The icon for the distinct states the members are in."""
+        return self._icons[self.winner(observed)]
+
+    def color(self, entity_states: Mapping[str, str]) -> str:
+        """The color of the first member (in order) in a colored active state."""
+        colors = self._colors
+        return next(
+            (colors[state] for state in entity_states.values() if state in colors),
+            "grey",
+        )
+
+    def summarize(self, entity_states: Mapping[str, str]) -> GroupSummary:
+        """summarize_members against this profile."""
+        # Both walks run at C speed (a comprehension and set()); a Python
+        # loop doing both at once measured slower past a few dozen members
+        # (scripts/benchmarks/bench_group_kernel.py).
+        active_rank = self._active_rank
+        active_ids = [
+            entity_id
+            for entity_id, state in entity_states.items()
+            if state in active_rank
+        ]
+        winner = self.winner(set(entity_states.values()))
+        # compute_color's rule, walking only the active members.
+        colors = self._colors
+        color = next(
+            (
+                colors[state]
+                for entity_id in active_ids
+                if (state := entity_states[entity_id]) in colors
+            ),
+            "grey",
         )
+        return GroupSummary(
+            len(entity_states), active_ids, winner, self._icons[winner], color
+        )
+
+
+class DomainProfiles:
+    """DomainProfile per (domain, device_class), compiled from one icon cache."""
+
+    def __init__(self, icons: Mapping[str, Mapping]) -> None:
+        self.icons = icons
+        self._profiles: dict[tuple[str, str | None], DomainProfile] = {}
+        for domain in DOMAIN_ACTIVE_STATES:
+            device_classes = set(icons.get(domain, {})) - {"_"}
+            if domain == "binary_sensor":
+                device_classes |= set(BINARY_SENSOR_COLORS)
+            for device_class in (None, *device_classes):
+                self.get(domain, device_class)
+
+    def get(self, domain: str, device_class: str | None) -> DomainProfile:
+        key = (domain, device_class)
+        profile = self._profiles.get(key)
+        if profile is None:
+            profile = self._profiles[key] = DomainProfile(
+                domain, device_class, self.icons
+            )
+        return profile
+
+
+def domain_profiles(hass: "HomeAssistant") -> DomainProfiles:
+    """
+    The profile tables for the current icon cache (hass.data[DOMAIN]["icons"]).
+    Compiled once per cache: replacing the cache recompiles them.
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    icons = data.get("icons", {})
+    profiles = data.get(DATA_DOMAIN_PROFILES)
+    if profiles is None or profiles.icons is not icons:
+        profiles = data[DATA_DOMAIN_PROFILES] = DomainProfiles(icons)
+    return profiles
+
+
+def domain_profile(
+    hass: "HomeAssistant", domain: str, device_class: str | None = None
+) -> DomainProfile:
+    return domain_profiles(hass).get(domain, device_class)
 
-    if target is None:
-        return default_icon
-    return state_icons.get(target, default_icon)
+
+@cache
+def _static_profile(domain: str, device_class: str | None = None) -> DomainProfile:
+    """A profile without icons, for the hass-less active-state/color helpers."""
+    return DomainProfile(domain, device_class, {})
 
 
 def resolve_device_class_name(
@@ -190,15 +450,103 @@ def resolve_numeric_aggregation_mode(
     return "average"
 
 
+@dataclass(slots=True)
+class NumericPartials:
+    """
+    Mergeable partial aggregate of numeric member values.
+
+    Area-level numeric sensors publish theirs (as_dict) alongside their
+    rounded state; floor and global sensors merge their children's instead
+    of re-aggregating those rounded outputs, so an average stays weighted by
+    the number of underlying sensors, and no tier re-parses a float.
+    """
+
+    total: float = 0.0
+    count: int = 0
+    minimum: float | None = None
+    maximum: float | None = None
+    sumsq: float = 0.0
+
+    @classmethod
+    def from_values(cls, values: Iterable[float]) -> "NumericPartials":
+        partials = cls()
+        for value in values:
+            partials.add(value)
+        return partials
+
+    @classmethod
+    def from_dict(cls, data: object) -> "NumericPartials | None":
+        """
+        Inverse of as_dict; None if `data` isn't a partials mapping.
+
+        Non-empty partials whose min/max are missing (None) or not numeric
+        come back empty, so merging them can never raise.
+        """
+        if not isinstance(data, Mapping):
+            return None
+        try:
+            total = float(data["sum"])
+            count = int(data["count"])
+            sumsq = float(data["sumsq"])
+            minimum, maximum = data["min"], data["max"]
+        except (KeyError, TypeError, ValueError):
+            return None
+        if count <= 0:
+            return cls()
+        try:
+            return cls(total, count, float(minimum), float(maximum), sumsq)
+        except (TypeError, ValueError):
+            return cls()
+
+    def add(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+        self.sumsq += value * value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other: "NumericPartials") -> None:
+        if not other.count:
+            return
+        self.total += other.total
+        self.count += other.count
+        self.sumsq += other.sumsq
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+
+    def value(self, mode: str) -> float | None:
+        """The aggregate for a resolved mode ("sum", "min", "average")."""
+        if not self.count:
+            return None
+        if mode == "sum":
+            return self.total
+        if mode == "min":
+            return self.minimum
+        return self.total / self.count
+
+    def as_dict(self) -> dict[str, float | int | None]:
+        return {
+            "sum": self.total,
+            "count": self.count,
+            "min": self.minimum,
+            "max": self.maximum,
+            "sumsq": self.sumsq,
+        }
+
+
 def compute_numeric_aggregate(values: list[float], mode: str) -> float | None:
     """Apply the resolved aggregation mode to a list of numeric member values."""
-    if not values:
-        return None
-    if mode == "sum":
-        return sum(values)
-    if mode == "min":
-        return min(values)
-    return sum(values) / len(values)
+    return NumericPartials.from_values(values).value(mode)
+
+
+def _color_map(domain: str, device_class: str | None) -> dict[str, str]:
+    if domain == "binary_sensor" and device_class:
+        return BINARY_SENSOR_COLORS.get(device_class, {"on": "grey"})
+    return DOMAIN_COLORS.get(domain, {"on": "grey"})
 
 
 def compute_color(
@@ -207,15 +555,4 @@ def compute_color(
     entity_states: dict[str, str],
 ) -> str:
     """Compute color based on domain, device_class, and entity states."""
-    if domain == "binary_sensor" and device_class:
-        color_map = BINARY_SENSOR_COLORS.get(device_class, {"on": "grey"})
-    else:
-        color_map = DOMAIN_COLORS.get(domain, {"on": "grey"})
-
-    active_states = DOMAIN_ACTIVE_STATES.get(domain, ["on"])
-
-    for entity_state in entity_states.values():
-        if entity_state in active_states and entity_state in color_map:
-            return color_map[entity_state]
-
-    return "grey"
+    return _static_profile(domain, device_class).color(entity_states)
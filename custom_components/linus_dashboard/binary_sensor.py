@@ -22,6 +22,8 @@ shared scanning/self-exclusion logic.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -31,28 +33,31 @@ from homeassistant.components.group.binary_sensor import (
     BinarySensorGroup as HABinarySensorGroup,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .aggregate import compute_color, compute_icon
-from .const import (
-    DOMAIN,
-    get_area_device_info,
-    get_floor_device_info,
-    get_global_device_info,
-)
+from .const import DOMAIN
 from .entity_group import (
+    GROUP_UNRECORDED_ATTRIBUTES,
+    PRESENCE_BREAKDOWN_KINDS,
     ExclusionConfig,
+    MemberBuckets,
     NestedGroupMixin,
+    RebuildScope,
     ScopedMembers,
+    apply_group_plan,
+    async_rebuild_groups,
     build_nested_device_class_groups,
+    compact_group_attributes,
     domain_is_excluded,
-    ensure_area_device_placed,
     resolve_floors_for_areas,
-    scan_domain_members,
 )
+from .group_engine import PropagationEngine
 from .group_manager import PlatformGroupManager
+from .group_plan import GroupPlan, PlannedGroup, plan_nested_groups
+from .hierarchy import async_get_hierarchy_builder
+from .registry_index import async_get_topology
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -70,6 +75,10 @@ class PresenceGroup(NestedGroupMixin, BinarySensorEntity):
 
     _attr_device_class = BinarySensorDeviceClass.OCCUPANCY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # The breakdown lists are member lists too: never recorded.
+    _unrecorded_attributes = GROUP_UNRECORDED_ATTRIBUTES | {
+        f"{kind}_entity_ids" for kind in PRESENCE_BREAKDOWN_KINDS
+    }
 
     def __init__(
         self,
@@ -97,35 +106,46 @@ class PresenceGroup(NestedGroupMixin, BinarySensorEntity):
         self._breakdown = breakdown or {}
 
     def _recompute(self) -> None:
-        active_ids: list[str] = []
-        entity_states: dict[str, str] = {}
-        for entity_id in self._member_entity_ids:
-            state_obj = self.hass.states.get(entity_id)
-            if not state_obj or state_obj.state in ("unavailable", "unknown"):
-                continue
-            entity_states[entity_id] = state_obj.state
-            if state_obj.state in ("on", "playing"):
-                active_ids.append(entity_id)
-
-        self._attr_is_on = len(active_ids) > 0
-        # icon/color reuse the exact member scan/state read above — no new
-        # entity lookups (in particular, never references the per-
-        # device_class motion/presence/occupancy groups binary_sensor.py
-        # also builds from the same raw sensors), so there's no risk of a
-        # dependency loop between this composite and them.
-        icon = compute_icon(self.hass, "binary_sensor", entity_states, "occupancy")
-        color = compute_color("binary_sensor", "occupancy", entity_states)
-        attrs = {
-            ATTR_ENTITY_ID: list(self._member_entity_ids),
-            "total": len(self._member_entity_ids),
-            "active_entity_ids": active_ids,
-            "icon": icon,
-            "color": color,
-        }
-        for key, entity_ids in self._breakdown.items():
-            attrs[f"{key}_entity_ids"] = entity_ids
+        # icon/color come from this group's own member states only — never
+        # from the per-device_class motion/presence/occupancy groups
+        # binary_sensor.py also builds from the same raw sensors, so there's
+        # no risk of a dependency loop between this composite and them.
+        attrs = self._group_attributes(
+            domain="binary_sensor",
+            device_class="occupancy",
+            active_states=("on", "playing"),
+        )
+        self._attr_is_on = attrs["active_count"] > 0
+        # Member lists like entity_id: left to group_members when compact.
+        if not compact_group_attributes(self.hass):
+            for key, entity_ids in self._breakdown.items():
+                attrs[f"{key}_entity_ids"] = entity_ids
         self._attr_extra_state_attributes = attrs
 
+    @callback
+    def async_set_members(
+        self,
+        member_entity_ids: list[str],
+        breakdown: dict[str, list[str]] | None = None,
+    ) -> bool:
+        """
+        Replace the member list and, if given, the per-kind breakdown; False
+        if neither changed. A breakdown-only change is recomputed and written
+        the same way a member change is.
+        """
+        breakdown_changed = breakdown is not None and breakdown != self._breakdown
+        if breakdown_changed:
+            self._breakdown = breakdown
+        if super().async_set_members(member_entity_ids):
+            return True
+        if breakdown_changed and self._subscriptions.active:
+            self._recompute()
+            self.async_write_ha_state()
+        return breakdown_changed
+
+    def member_lists(self) -> dict[str, list[str]]:
+        return {**super().member_lists(), **self._breakdown}
+
 
 class BinarySensorDeviceClassGroup(NestedGroupMixin, HABinarySensorGroup):
     """
@@ -171,6 +191,9 @@ class BinarySensorDeviceClassGroup(NestedGroupMixin, HABinarySensorGroup):
             domain="binary_sensor", device_class=self.device_class
         )
 
+    def _priority_lane(self, engine: PropagationEngine) -> bool:
+        return self.device_class in engine.priority_device_classes
+
 
 def _merge_presence_scans(
     scans: dict[str, ScopedMembers],
@@ -204,13 +227,13 @@ def _get_or_create_presence_group(
     breakdown: dict[str, list[str]] | None = None,
 ) -> PresenceGroup:
     """
-    Idempotent: reuse the existing entity for this unique_id (scheduling a
-    member-list update on it) instead of constructing a duplicate — lets the
+    Idempotent: reuse the existing entity for this unique_id (handing it the
+    new member list and breakdown, a no-op if unchanged) instead of constructing a duplicate — lets the
     caller tell genuinely new groups apart from ones that already exist.
     """
     existing = _PRESENCE_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids, breakdown)
         return existing
 
     group = PresenceGroup(
@@ -227,85 +250,68 @@ def _get_or_create_presence_group(
 
 
 async def _build_presence_groups(
-    hass: HomeAssistant, config_entry: ConfigEntry, exclusions: ExclusionConfig
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    exclusions: ExclusionConfig,
+    buckets: MemberBuckets,
+    scope: RebuildScope | None = None,
 ) -> list[PresenceGroup]:
-    """Build presence groups at area, floor and global scope (nested)."""
+    """
+    Build presence groups at area, floor and global scope (nested), through
+    the same plan/apply stages as every other hierarchy (see group_plan.py).
+    `scope`: targeted rebuild, see entity_group.RebuildScope.
+    """
     scans = {
-        "motion": scan_domain_members(
-            hass, domain="binary_sensor", device_class="motion", exclusions=exclusions
-        ),
-        "presence": scan_domain_members(
-            hass, domain="binary_sensor", device_class="presence", exclusions=exclusions
-        ),
-        "occupancy": scan_domain_members(
-            hass,
-            domain="binary_sensor",
-            device_class="occupancy",
-            exclusions=exclusions,
-        ),
-        "media": scan_domain_members(
-            hass, domain="media_player", device_class=None, exclusions=exclusions
-        ),
+        "motion": buckets.get("binary_sensor", "motion"),
+        "presence": buckets.get("binary_sensor", "presence"),
+        "occupancy": buckets.get("binary_sensor", "occupancy"),
+        "media": buckets.get("media_player"),
     }
     area_entities, area_names, area_breakdown = _merge_presence_scans(scans)
-
-    entry_id = config_entry.entry_id
-    entities: list[PresenceGroup] = []
-    area_group_ids: dict[str, str] = {}
-
-    for area_id, member_ids in area_entities.items():
-        if not member_ids:
-            continue
-        area_device_info = get_area_device_info(entry_id, area_id, area_names[area_id])
-        ensure_area_device_placed(hass, entry_id, area_id, area_device_info)
-        unique_id = f"{DOMAIN}_presence_detection_area_{area_id}"
-        group = _get_or_create_presence_group(
-            hass,
-            unique_id,
-            "presence_detection",
-            {"name": area_names[area_id]},
-            area_device_info,
-            member_ids,
-            breakdown=area_breakdown.get(area_id),
+    floor_areas, _floor_names = resolve_floors_for_areas(
+        hass, [area_id for area_id, ids in area_entities.items() if ids], exclusions
+    )
+    plan = GroupPlan(
+        plan_nested_groups(
+            async_get_topology(hass),
+            unique_id_prefix=f"{DOMAIN}_presence_detection",
+            area_entities=area_entities,
+            area_names=area_names,
+            floor_areas=floor_areas,
+            excluded_floor_ids=exclusions.excluded_floor_ids,
+            scope=scope,
+            existing_ids=_PRESENCE_GROUPS.keys(),
         )
-        entities.append(group)
-        area_group_ids[area_id] = group.entity_id
-
-    floor_areas, floor_names = resolve_floors_for_areas(
-        hass, set(area_group_ids), exclusions
     )
-    floor_group_ids: list[str] = []
-    for floor_id, areas_on_floor in floor_areas.items():
-        member_ids = [area_group_ids[a] for a in areas_on_floor if a in area_group_ids]
-        if not member_ids:
-            continue
-        unique_id = f"{DOMAIN}_presence_detection_floor_{floor_id}"
-        group = _get_or_create_presence_group(
+
+    def _make_group(planned: PlannedGroup, device_info: dict, member_ids: list[str]):
+        tier, scope_id = planned.scope
+        if tier == "global":
+            return _get_or_create_presence_group(
+                hass,
+                planned.unique_id,
+                "presence_detection_global",
+                None,
+                device_info,
+                member_ids,
+            )
+        return _get_or_create_presence_group(
             hass,
-            unique_id,
+            planned.unique_id,
             "presence_detection",
-            {"name": floor_names.get(floor_id, floor_id)},
-            get_floor_device_info(
-                entry_id, floor_id, floor_names.get(floor_id, floor_id)
-            ),
+            {"name": planned.name},
+            device_info,
             member_ids,
+            breakdown=area_breakdown.get(scope_id) if tier == "area" else None,
         )
-        entities.append(group)
-        floor_group_ids.append(group.entity_id)
 
-    if floor_group_ids:
-        unique_id = f"{DOMAIN}_presence_detection_global"
-        group = _get_or_create_presence_group(
-            hass,
-            unique_id,
-            "presence_detection_global",
-            None,
-            get_global_device_info(entry_id),
-            floor_group_ids,
-        )
-        entities.append(group)
-
-    return entities
+    return apply_group_plan(
+        hass,
+        config_entry.entry_id,
+        plan,
+        existing=_PRESENCE_GROUPS,
+        make_group=_make_group,
+    )
 
 
 def _make_device_class_group(
@@ -320,7 +326,7 @@ def _make_device_class_group(
     """Idempotent factory for build_nested_device_class_groups (entity_group.py)."""
     existing = _DEVICE_CLASS_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
 
     group = BinarySensorDeviceClassGroup(
@@ -337,7 +343,11 @@ def _make_device_class_group(
 
 
 async def _build_device_class_groups(
-    hass: HomeAssistant, config_entry: ConfigEntry, exclusions: ExclusionConfig
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    exclusions: ExclusionConfig,
+    buckets: MemberBuckets,
+    scope: RebuildScope | None = None,
 ) -> list[BinarySensorDeviceClassGroup]:
     """
     Build one group per binary_sensor device_class present, nested area/
@@ -355,9 +365,41 @@ async def _build_device_class_groups(
         domain="binary_sensor",
         unique_id_prefix=DOMAIN,
         entity_factory=_make_device_class_group,
+        buckets=buckets,
+        scope=scope,
+        existing=_DEVICE_CLASS_GROUPS,
     )
 
 
+async def _build_all_binary_sensor_groups(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    exclusions: ExclusionConfig,
+    scope: RebuildScope | None = None,
+) -> list:
+    """
+    Presence groups plus one set per device_class, from a single scan
+    (presence reads three binary_sensor device_classes plus media_player,
+    the device_class groups read every binary_sensor device_class). None at
+    all while the binary_sensor domain is excluded.
+    """
+    if domain_is_excluded("binary_sensor", exclusions):
+        _LOGGER.debug("binary_sensor domain excluded, skipping group creation")
+        return []
+
+    buckets = async_get_hierarchy_builder(hass, config_entry).buckets(
+        exclusions,
+        domains=("binary_sensor", "media_player"),
+        area_ids=scope.area_ids if scope else None,
+    )
+    return [
+        *await _build_presence_groups(hass, config_entry, exclusions, buckets, scope),
+        *await _build_device_class_groups(
+            hass, config_entry, exclusions, buckets, scope
+        ),
+    ]
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -365,56 +407,46 @@ async def async_setup_entry(
 ) -> None:
     """Set up Linus Dashboard binary_sensor groups (presence + per device_class)."""
     exclusions = ExclusionConfig.from_config_entry(config_entry)
-    if domain_is_excluded("binary_sensor", exclusions):
-        _LOGGER.debug("binary_sensor domain excluded, skipping group creation")
-        return
 
     # Module-level registries can hold stale entries from a previous load of
-    # this config entry (reload after an options change) — those entities
+    # this config entry (a manual reload) — those entities
     # were already torn down by HA, so start from a clean slate here rather
     # than in _rebuild.
     _PRESENCE_GROUPS.clear()
     _DEVICE_CLASS_GROUPS.clear()
 
-    entities: list = []
-    entities.extend(await _build_presence_groups(hass, config_entry, exclusions))
-    entities.extend(await _build_device_class_groups(hass, config_entry, exclusions))
-
+    # Set up (and register _rebuild below) even when the domain is excluded,
+    # so un-excluding it later through the options flow can bring the groups
+    # back without a reload.
+    entities = await _build_all_binary_sensor_groups(hass, config_entry, exclusions)
     if entities:
         async_add_entities(entities)
         _LOGGER.info("Created %d binary_sensor group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        """Full rescan + reconcile: update existing groups, add/remove as needed."""
-        before_ids = set(_PRESENCE_GROUPS.keys()) | set(_DEVICE_CLASS_GROUPS.keys())
-
-        new_presence = await _build_presence_groups(hass, config_entry, exclusions)
-        new_device_class = await _build_device_class_groups(
-            hass, config_entry, exclusions
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        """Rescan + reconcile: update existing groups, add/remove as needed."""
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
+            hass,
+            config_entry,
+            async_add_entities,
+            (_PRESENCE_GROUPS, _DEVICE_CLASS_GROUPS),
+            partial(
+                _build_all_binary_sensor_groups, hass, config_entry, exclusions, scope
+            ),
+            scope=scope,
         )
-        new_groups = [*new_presence, *new_device_class]
-
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
-
-        for registry in (_PRESENCE_GROUPS, _DEVICE_CLASS_GROUPS):
-            for uid in list(registry.keys()):
-                if uid not in after_ids:
-                    stale = registry.pop(uid)
-                    hass.async_create_task(stale.async_remove(force_remove=True))
-
-        if to_add:
-            async_add_entities(to_add)
-            # See light.py's _rebuild for why this is needed here too.
-            from . import async_hide_group_entities_from_voice_assistants
-
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
 
     platform_manager = PlatformGroupManager(
-        hass, monitored_domains=["binary_sensor", "media_player"]
+        hass,
+        monitored_domains=["binary_sensor", "media_player"],
+        config_entry=config_entry,
     )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
@@ -19,6 +19,8 @@ attribute), so that one stays a plain manual reduction.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -28,7 +30,6 @@ from homeassistant.components.climate import (
 )
 from homeassistant.components.group.util import find_state_attributes, reduce_attribute
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -36,8 +37,9 @@ from .const import DOMAIN
 from .entity_group import (
     ExclusionConfig,
     NestedGroupMixin,
+    RebuildScope,
+    async_rebuild_groups,
     build_nested_domain_groups,
-    compute_group_attributes,
     mean_float,
 )
 from .group_manager import PlatformGroupManager
@@ -86,12 +88,7 @@ class ClimateGroup(NestedGroupMixin, ClimateEntity):
         (our own turn_on/off use set_hvac_mode, not the members' turn_on/off
         service, so they don't depend on members declaring that feature).
         """
-        states = [
-            state
-            for entity_id in self._member_entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-            and state.state != STATE_UNAVAILABLE
-        ]
+        states = self._member_state_cache().available()
 
         mode_sets = [
             set(modes) for modes in find_state_attributes(states, "hvac_modes") if modes
@@ -116,12 +113,7 @@ class ClimateGroup(NestedGroupMixin, ClimateEntity):
     def _recompute(self) -> None:
         self._detect_modes_and_features()
 
-        states = [
-            state
-            for entity_id in self._member_entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-            and state.state != STATE_UNAVAILABLE
-        ]
+        states = self._member_state_cache().available()
         active_modes = [state.state for state in states if state.state != HVACMode.OFF]
 
         # Most common active mode across members, so a fleet mostly heating
@@ -150,12 +142,7 @@ class ClimateGroup(NestedGroupMixin, ClimateEntity):
             states, "max_temp", default=DEFAULT_MAX_TEMP, reduce=max
         )
 
-        attrs = compute_group_attributes(
-            self.hass,
-            domain="climate",
-            device_class=None,
-            member_entity_ids=self._member_entity_ids,
-        )
+        attrs = self._group_attributes(domain="climate")
         self._attr_extra_state_attributes = attrs
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -223,7 +210,7 @@ def _make_climate_group(
     """Idempotent factory — see light.py's _make_light_group for the full rationale."""
     existing = _CLIMATE_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
 
     group = ClimateGroup(
@@ -262,27 +249,34 @@ async def async_setup_entry(
         async_add_entities(entities)
         _LOGGER.info("Created %d climate group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        before_ids = set(_CLIMATE_GROUPS.keys())
-        new_groups = await build_nested_domain_groups(
-            hass, config_entry, exclusions, **build_kwargs
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        # See light.py's _rebuild for the scope.
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
+            hass,
+            config_entry,
+            async_add_entities,
+            (_CLIMATE_GROUPS,),
+            partial(
+                build_nested_domain_groups,
+                hass,
+                config_entry,
+                exclusions,
+                **build_kwargs,
+                scope=scope,
+                existing=_CLIMATE_GROUPS,
+            ),
+            scope=scope,
         )
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
 
-        for uid in before_ids - after_ids:
-            stale = _CLIMATE_GROUPS.pop(uid)
-            hass.async_create_task(stale.async_remove(force_remove=True))
-
-        if to_add:
-            async_add_entities(to_add)
-            from . import async_hide_group_entities_from_voice_assistants
-
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
-
-    platform_manager = PlatformGroupManager(hass, monitored_domains=["climate"])
+    platform_manager = PlatformGroupManager(
+        hass, monitored_domains=["climate"], config_entry=config_entry
+    )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
@@ -21,6 +21,9 @@ from homeassistant.helpers.selector import (
     BooleanSelector,
     EntitySelector,
     EntitySelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectSelector,
     SelectSelectorConfig,
     SelectSelectorMode,
@@ -33,6 +36,9 @@ from homeassistant.util import slugify
 
 from .const import (
     CONF_ALARM_ENTITY_IDS,
+    CONF_COMPACT_GROUP_ATTRIBUTES,
+    CONF_DEBOUNCE_MAX_MS,
+    CONF_DEBOUNCE_MIN_MS,
     CONF_EMBEDDED_DASHBOARDS,
     CONF_EXCLUDED_DEVICE_CLASSES,
     CONF_EXCLUDED_DOMAINS,
@@ -40,7 +46,11 @@ from .const import (
     CONF_EXCLUDED_TARGETS,
     CONF_HIDE_GREETING,
     CONF_HIDE_GROUPS_FROM_VOICE_ASSISTANTS,
+    CONF_PRIORITY_DEVICE_CLASSES,
     CONF_WEATHER_ENTITY,
+    DEFAULT_DEBOUNCE_MAX_MS,
+    DEFAULT_DEBOUNCE_MIN_MS,
+    DEFAULT_PRIORITY_DEVICE_CLASSES,
     DOMAIN,
 )
 
@@ -627,6 +637,54 @@ class LinusDashboardEditFlow(config_entries.OptionsFlow):
             ): self._create_selector_config(integration_options),
         }
 
+    def _build_performance_section(
+        self, current_options: dict[str, Any]
+    ) -> dict[vol.Optional, Any]:
+        """Build the debounce, priority lane and group attributes section."""
+        debounce_selector = NumberSelector(
+            NumberSelectorConfig(
+                min=50,
+                max=10000,
+                step=50,
+                unit_of_measurement="ms",
+                mode=NumberSelectorMode.BOX,
+            )
+        )
+        return {
+            vol.Optional(
+                CONF_DEBOUNCE_MIN_MS,
+                default=current_options.get(
+                    CONF_DEBOUNCE_MIN_MS, DEFAULT_DEBOUNCE_MIN_MS
+                ),
+            ): debounce_selector,
+            vol.Optional(
+                CONF_DEBOUNCE_MAX_MS,
+                default=current_options.get(
+                    CONF_DEBOUNCE_MAX_MS, DEFAULT_DEBOUNCE_MAX_MS
+                ),
+            ): debounce_selector,
+            vol.Optional(
+                CONF_COMPACT_GROUP_ATTRIBUTES,
+                default=current_options.get(CONF_COMPACT_GROUP_ATTRIBUTES, False),
+            ): BooleanSelector(),
+            vol.Optional(
+                CONF_PRIORITY_DEVICE_CLASSES,
+                default=list(
+                    current_options.get(
+                        CONF_PRIORITY_DEVICE_CLASSES, DEFAULT_PRIORITY_DEVICE_CLASSES
+                    )
+                ),
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=sorted(
+                        device_class.value for device_class in BinarySensorDeviceClass
+                    ),
+                    multiple=True,
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            ),
+        }
+
     async def _build_form_schema(self) -> vol.Schema:
         """Build the complete form schema organized by thematic sections."""
         # Get all dynamic options with translations
@@ -689,8 +747,10 @@ class LinusDashboardEditFlow(config_entries.OptionsFlow):
             device_class_options=device_class_options,
         )
 
+        performance_config = self._build_performance_section(current_options)
+
         # Combine all sections in logical order
-        complete_schema = {**basic_config, **exclusion_config}
+        complete_schema = {**basic_config, **exclusion_config, **performance_config}
 
         return vol.Schema(complete_schema)
 
@@ -698,7 +758,12 @@ class LinusDashboardEditFlow(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> config_entries.ConfigFlowResult:
         """Manage the options with thematic organization."""
-        if user_input is not None:
+        errors: dict[str, str] = {}
+        if user_input is not None and user_input.get(
+            CONF_DEBOUNCE_MAX_MS, DEFAULT_DEBOUNCE_MAX_MS
+        ) < user_input.get(CONF_DEBOUNCE_MIN_MS, DEFAULT_DEBOUNCE_MIN_MS):
+            errors[CONF_DEBOUNCE_MAX_MS] = "debounce_max_below_min"
+        elif user_input is not None:
             # Process embedded dashboards selection
             selected_labels = user_input.get(CONF_EMBEDDED_DASHBOARDS, [])
             embedded_dashboards = []
@@ -745,6 +810,7 @@ class LinusDashboardEditFlow(config_entries.OptionsFlow):
         return self.async_show_form(
             step_id="init",
             data_schema=schema,
+            errors=errors,
             description_placeholders={
                 "docs_url": "https://github.com/Thank-you-Linus/Linus-Dashboard"
             },
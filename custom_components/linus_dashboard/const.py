@@ -50,6 +50,28 @@ CONF_EMBEDDED_DASHBOARDS = "embedded_dashboards"
 # Area/floor/global group entities configuration
 CONF_HIDE_GROUPS_FROM_VOICE_ASSISTANTS = "hide_groups_from_voice_assistants"
 
+# Adaptive debounce window bounds of group/sensor recomputes, in ms (see
+# group_engine.DebounceWheel)
+CONF_DEBOUNCE_MIN_MS = "debounce_min_ms"
+CONF_DEBOUNCE_MAX_MS = "debounce_max_ms"
+DEFAULT_DEBOUNCE_MIN_MS = 100
+DEFAULT_DEBOUNCE_MAX_MS = 2000
+
+# Groups and sensors publish member counts only; their member lists are
+# paged through the linus_dashboard/group_members websocket command
+CONF_COMPACT_GROUP_ATTRIBUTES = "compact_group_attributes"
+
+# binary_sensor device_classes whose groups skip the debounce and propagate
+# area -> floor -> global at once (see group_engine.PropagationEngine)
+CONF_PRIORITY_DEVICE_CLASSES = "priority_device_classes"
+DEFAULT_PRIORITY_DEVICE_CLASSES = (
+    "smoke",
+    "gas",
+    "carbon_monoxide",
+    "moisture",
+    "tamper",
+)
+
 
 def get_area_device_info(entry_id: str, area_id: str, area_name: str) -> dict:
     """
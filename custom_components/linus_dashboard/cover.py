@@ -19,6 +19,8 @@ position. HA's own async_set_cover_position has no such filtering.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 from typing import Any
 
 from homeassistant.components.cover import ATTR_POSITION, CoverEntityFeature
@@ -32,10 +34,13 @@ from .const import DOMAIN
 from .entity_group import (
     ExclusionConfig,
     NestedGroupMixin,
+    RebuildScope,
+    async_rebuild_groups,
     build_nested_device_class_groups,
     build_nested_domain_groups,
 )
 from .group_manager import PlatformGroupManager
+from .hierarchy import async_get_hierarchy_builder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -142,7 +147,7 @@ def _make_cover_group(
     """
     existing = _COVER_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
     group = CoverGroup(
         hass,
@@ -158,9 +163,18 @@ def _make_cover_group(
 
 
 async def _build_all_cover_groups(
-    hass: HomeAssistant, config_entry: ConfigEntry, exclusions: ExclusionConfig
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    exclusions: ExclusionConfig,
+    scope: RebuildScope | None = None,
 ) -> list[CoverGroup]:
     """Flat 'all covers' groups plus one set per device_class present (gate, garage, shutter, ...)."""
+    # One scan serves both the flat and the per-device_class groups.
+    buckets = async_get_hierarchy_builder(hass, config_entry).buckets(
+        exclusions,
+        domains=("cover",),
+        area_ids=scope.area_ids if scope else None,
+    )
     entities: list[CoverGroup] = []
     entities.extend(
         await build_nested_domain_groups(
@@ -171,7 +185,10 @@ async def _build_all_cover_groups(
             unique_id_prefix=f"{DOMAIN}_all_covers",
             translation_key="cover_group",
             translation_key_global="cover_group_global",
+            buckets=buckets,
             entity_factory=_make_cover_group,
+            scope=scope,
+            existing=_COVER_GROUPS,
         )
     )
     entities.extend(
@@ -181,7 +198,10 @@ async def _build_all_cover_groups(
             exclusions,
             domain="cover",
             unique_id_prefix=DOMAIN,
+            buckets=buckets,
             entity_factory=_make_cover_group,
+            scope=scope,
+            existing=_COVER_GROUPS,
         )
     )
     return entities
@@ -201,26 +221,26 @@ async def async_setup_entry(
         async_add_entities(entities)
         _LOGGER.info("Created %d cover group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        before_ids = set(_COVER_GROUPS.keys())
-        new_groups = await _build_all_cover_groups(hass, config_entry, exclusions)
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
-
-        for uid in before_ids - after_ids:
-            stale = _COVER_GROUPS.pop(uid)
-            hass.async_create_task(stale.async_remove(force_remove=True))
-
-        if to_add:
-            async_add_entities(to_add)
-            # See light.py's _rebuild for why this is needed here too.
-            from . import async_hide_group_entities_from_voice_assistants
-
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        # See light.py's _rebuild for the scope.
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
+            hass,
+            config_entry,
+            async_add_entities,
+            (_COVER_GROUPS,),
+            partial(_build_all_cover_groups, hass, config_entry, exclusions, scope),
+            scope=scope,
+        )
 
-    platform_manager = PlatformGroupManager(hass, monitored_domains=["cover"])
+    platform_manager = PlatformGroupManager(
+        hass, monitored_domains=["cover"], config_entry=config_entry
+    )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
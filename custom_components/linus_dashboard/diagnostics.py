@@ -0,0 +1,41 @@
+"""Diagnostics support for Linus Dashboard."""
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .group_engine import (
+    DATA_AGGREGATE_FEED,
+    DATA_DEBOUNCE_WHEEL,
+    DATA_PROPAGATION_ENGINE,
+    DATA_STATE_DISPATCHER,
+    DATA_WRITE_STATS,
+)
+from .group_manager import async_get_rebuild_scheduler
+from .hierarchy import DATA_HIERARCHY_BUILDERS
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return runtime counters for the config entry."""
+    scheduler = async_get_rebuild_scheduler(hass, entry)
+    data = hass.data.get(DOMAIN, {})
+    hierarchy = data.get(DATA_HIERARCHY_BUILDERS, {}).get(entry.entry_id)
+    dispatcher = data.get(DATA_STATE_DISPATCHER)
+    wheel = data.get(DATA_DEBOUNCE_WHEEL)
+    engine = data.get(DATA_PROPAGATION_ENGINE)
+    writes = data.get(DATA_WRITE_STATS)
+    feed = data.get(DATA_AGGREGATE_FEED)
+    return {
+        "options": dict(entry.options),
+        "rebuild_scheduler": scheduler.as_dict() if scheduler else None,
+        "hierarchy": hierarchy.as_dict() if hierarchy else None,
+        "state_dispatcher": dispatcher.as_dict() if dispatcher else None,
+        "debounce_wheel": wheel.as_dict() if wheel else None,
+        "propagation": engine.as_dict() if engine else None,
+        "writes": writes.as_dict() if writes else None,
+        "aggregate_feed": feed.as_dict() if feed else None,
+    }
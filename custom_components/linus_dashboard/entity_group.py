@@ -7,13 +7,16 @@ climate.py and media_player.py to build the same three-tier hierarchy
 entity-registry scanning and exclusion-filtering logic in every platform.
 
 CRITICAL PATTERN - self-exclusion:
-When iterating over entity_registry.entities.values(), always skip entities
-created by this integration itself (entity.platform == DOMAIN). Area group
+When iterating over registry entities, always skip entities created by this
+integration itself (entity.platform == DOMAIN). Area group
 devices are placed in their real HA area, so their entities inherit that
 area_id — without this filter, a group would include itself as a member,
 causing perpetual recompute loops and, for controllable domains, recursive
 service calls. See Linus Brain's area_manager.py for the same documented
-pitfall this pattern is ported from.
+pitfall this pattern is ported from. Scans no longer walk the entity
+registry themselves — they query registry_index.py's RegistryIndex, which
+applies this filter (and hidden/disabled filtering) once, when an entity is
+indexed.
 
 NESTING:
 Floor-scope groups contain the area-scope group entity_ids of that floor as
@@ -22,33 +25,45 @@ entity_ids as members. This is a strict, one-directional hierarchy
 (global > floor > area > raw entities) — never the reverse, never circular.
 Only area-scope groups scan raw entities, so the self-exclusion risk above
 only applies at that level.
+
+PLAN / APPLY:
+Every builder runs in three stages: scan (scan_all_buckets), plan (pure,
+see group_plan.py: which groups should exist, with which members) and
+apply (apply_group_plan: build the missing groups, hand changed ones their
+new members, leave unchanged ones alone). async_rebuild_groups then adds
+the new entities and removes the ones no longer planned.
+
+TARGETED REBUILDS:
+An entity joining or leaving an area can only change that area's groups,
+its floor's groups and the global groups. The builders take an optional
+RebuildScope naming those areas: they then scan just those areas, plan
+just those tiers, and nest the untouched area/floor groups by their
+existing unique_ids instead of rebuilding them. async_rebuild_groups
+reconciles the result within the same scope.
 """
 
 import logging
-from collections.abc import Callable
+import time
+from collections.abc import Awaitable, Callable, Collection, Iterable, Mapping
 from dataclasses import dataclass, field
+from enum import IntFlag, auto
+from functools import partial
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers import (
-    area_registry as ar,
-)
+from homeassistant.core import Event, HomeAssistant, State, callback
 from homeassistant.helpers import (
     device_registry as dr,
 )
-from homeassistant.helpers import (
-    entity_registry as er,
-)
-from homeassistant.helpers import (
-    floor_registry as fr,
-)
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.helpers import entity_platform
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .aggregate import (
-    compute_active_entity_ids,
+    ActiveMemberTracker,
     compute_color,
-    compute_icon,
+    compute_icon_for_states,
+    summarize_members,
 )
 from .const import (
     DOMAIN,
@@ -56,6 +71,31 @@ from .const import (
     get_floor_device_info,
     get_global_device_info,
 )
+from .group_engine import (
+    AGGREGATE_ATTRIBUTES,
+    EventRate,
+    PropagationEngine,
+    async_get_aggregate_feed,
+    async_get_debounce_wheel,
+    async_get_propagation_engine,
+    async_get_state_dispatcher,
+    async_get_storm_detector,
+    async_get_write_stats,
+)
+from .group_plan import (
+    GLOBAL_SCOPE,
+    GroupPlan,
+    GroupScope,
+    PlannedGroup,
+    RebuildScope,
+    plan_nested_groups,
+)
+from .registry_index import (
+    IndexedEntity,
+    async_get_registry_index,
+    async_get_topology,
+)
+from .topology import TopologyCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -88,6 +128,144 @@ class ExclusionConfig:
         )
 
 
+DATA_EXCLUSION_PREDICATE = "exclusion_predicate"
+
+
+class ExclusionReason(IntFlag):
+    """Which of an ExclusionConfig's target kinds matched an entity."""
+
+    ENTITY = auto()
+    DEVICE = auto()
+    INTEGRATION = auto()
+    DEVICE_CLASS = auto()
+    AREA = auto()
+    FLOOR = auto()
+
+    # What drops an entity from a scan: an excluded floor only drops the
+    # floor tier there (see resolve_floors_for_areas), not the area's members.
+    SCAN = ENTITY | DEVICE | INTEGRATION | DEVICE_CLASS | AREA
+
+
+class ExclusionPredicate:
+    """
+    An ExclusionConfig compiled into one cached per-entity verdict.
+
+    verdict() returns the ExclusionReason flags matching an indexed entity,
+    computed once and then served from cache: the entity-level part (entity,
+    device, integration, device_class) is keyed by entity_id and stays valid
+    as long as the index still holds the very same IndexedEntity — the index
+    replaces that object whenever the entity's registry entry changes, so a
+    registry edit invalidates exactly that entity's verdict and nothing
+    else. The area-level part (area, floor) is cached per area and dropped
+    whenever the TopologyCache reports an area or floor change.
+
+    Shared by every scanner through async_get_exclusion_predicate(), and
+    re-pointed at new options with async_update_config(), which only drops
+    the verdicts a changed target could affect.
+    """
+
+    def __init__(self, config: ExclusionConfig, topology: TopologyCache) -> None:
+        self.config = config
+        self.topology = topology
+        self._topology_generation = topology.generation
+        self._entity_verdicts: dict[str, tuple[IndexedEntity, ExclusionReason]] = {}
+        self._area_verdicts: dict[str, ExclusionReason] = {}
+
+    def verdict(self, indexed: IndexedEntity) -> ExclusionReason:
+        cached = self._entity_verdicts.get(indexed.entity_id)
+        if cached is None or cached[0] is not indexed:
+            cached = (indexed, self._entity_reasons(indexed))
+            self._entity_verdicts[indexed.entity_id] = cached
+        if not indexed.area_id:
+            return cached[1]
+        return cached[1] | self._area_reasons(indexed.area_id)
+
+    def excludes(
+        self, indexed: IndexedEntity, reasons: ExclusionReason = ExclusionReason.SCAN
+    ) -> bool:
+        """Whether any of `reasons` matches this entity."""
+        return bool(self.verdict(indexed) & reasons)
+
+    @callback
+    def async_update_config(self, config: ExclusionConfig) -> None:
+        """Switch to new options, dropping only the verdicts they can change."""
+        old = self.config
+        self.config = config
+        entity_ids = old.excluded_entity_ids ^ config.excluded_entity_ids
+        device_ids = old.excluded_device_ids ^ config.excluded_device_ids
+        integrations = old.excluded_integrations ^ config.excluded_integrations
+        device_classes = old.excluded_device_classes ^ config.excluded_device_classes
+        if entity_ids or device_ids or integrations or device_classes:
+            for entity_id, (indexed, _reasons) in list(self._entity_verdicts.items()):
+                if (
+                    entity_id in entity_ids
+                    or indexed.device_id in device_ids
+                    or indexed.platform in integrations
+                    or indexed.device_class in device_classes
+                ):
+                    del self._entity_verdicts[entity_id]
+
+        area_ids = old.excluded_area_ids ^ config.excluded_area_ids
+        floor_ids = old.excluded_floor_ids ^ config.excluded_floor_ids
+        for area_id in list(self._area_verdicts):
+            if area_id in area_ids or self.topology.area_floor_id(area_id) in floor_ids:
+                del self._area_verdicts[area_id]
+
+    def _entity_reasons(self, indexed: IndexedEntity) -> ExclusionReason:
+        config = self.config
+        reasons = ExclusionReason(0)
+        if indexed.entity_id in config.excluded_entity_ids:
+            reasons |= ExclusionReason.ENTITY
+        if indexed.device_id and indexed.device_id in config.excluded_device_ids:
+            reasons |= ExclusionReason.DEVICE
+        if indexed.platform and indexed.platform in config.excluded_integrations:
+            reasons |= ExclusionReason.INTEGRATION
+        if (
+            indexed.device_class
+            and indexed.device_class in config.excluded_device_classes
+        ):
+            reasons |= ExclusionReason.DEVICE_CLASS
+        return reasons
+
+    def _area_reasons(self, area_id: str) -> ExclusionReason:
+        if self._topology_generation != self.topology.generation:
+            self._area_verdicts.clear()
+            self._topology_generation = self.topology.generation
+        reasons = self._area_verdicts.get(area_id)
+        if reasons is None:
+            reasons = ExclusionReason(0)
+            if area_id in self.config.excluded_area_ids:
+                reasons |= ExclusionReason.AREA
+            floor_id = self.topology.area_floor_id(area_id)
+            if floor_id and floor_id in self.config.excluded_floor_ids:
+                reasons |= ExclusionReason.FLOOR
+            self._area_verdicts[area_id] = reasons
+        return reasons
+
+
+@callback
+def async_get_exclusion_predicate(
+    hass: HomeAssistant, exclusions: ExclusionConfig
+) -> ExclusionPredicate:
+    """
+    The shared ExclusionPredicate, brought up to date with `exclusions`.
+
+    Every scanner resolves its ExclusionConfig from the same config entry
+    options, so in practice this is one predicate whose cache survives
+    across scans and platforms; a config that differs (options changed)
+    goes through async_update_config rather than a fresh, cold predicate.
+    """
+    topology = async_get_topology(hass)
+    data = hass.data.setdefault(DOMAIN, {})
+    predicate: ExclusionPredicate | None = data.get(DATA_EXCLUSION_PREDICATE)
+    if predicate is None or predicate.topology is not topology:
+        predicate = ExclusionPredicate(exclusions, topology)
+        data[DATA_EXCLUSION_PREDICATE] = predicate
+    elif predicate.config != exclusions:
+        predicate.async_update_config(exclusions)
+    return predicate
+
+
 @dataclass
 class ScopedMembers:
     """Result of scanning the registries for a domain (+ optional device_class)."""
@@ -102,17 +280,39 @@ class ScopedMembers:
     floor_names: dict[str, str]
 
 
-def _resolve_entity_area_id(
-    entity_entry: er.RegistryEntry, device_registry: dr.DeviceRegistry
-) -> str | None:
-    """Resolve an entity's area, falling back to its device's area."""
-    if entity_entry.area_id:
-        return entity_entry.area_id
-    if entity_entry.device_id:
-        device = device_registry.async_get(entity_entry.device_id)
-        if device:
-            return device.area_id
-    return None
+# (domain, device_class) — device_class None is the flat per-domain slice.
+BucketKey = tuple[str, str | None]
+
+
+@dataclass
+class MemberBuckets:
+    """Every ScopedMembers slice produced by one scan_all_buckets call."""
+
+    buckets: dict[BucketKey, ScopedMembers] = field(default_factory=dict)
+
+    def get(self, domain: str, device_class: str | None = None) -> ScopedMembers:
+        """One slice; empty if nothing in it survived the scan."""
+        scoped = self.buckets.get((domain, device_class))
+        if scoped is None:
+            return ScopedMembers({}, {}, {}, {})
+        return scoped
+
+    def device_classes(self, domain: str) -> list[str]:
+        """
+        Every device_class of `domain` with at least one member.
+
+        Used to build one set of area/floor/global groups per device_class
+        without a hardcoded list — a fixed list can't cover every
+        device_class an integration might report, and silently ignoring
+        unlisted ones is exactly the shape of bug this replaces (cover's
+        gate/garage groups never existed at all until device_class
+        discovery was generalized beyond binary_sensor).
+        """
+        return [
+            device_class
+            for bucket_domain, device_class in self.buckets
+            if bucket_domain == domain and device_class is not None
+        ]
 
 
 def domain_is_excluded(domain: str, exclusions: ExclusionConfig) -> bool:
@@ -133,8 +333,53 @@ def scan_domain_members(
     exclusions: ExclusionConfig,
 ) -> ScopedMembers:
     """
-    Scan entity/area/floor registries for entities of a domain (optionally
-    filtered to a single device_class), grouped by area and by floor.
+    Collect the entities of a domain (optionally filtered to a single
+    device_class), grouped by area and by floor.
+
+    Convenience wrapper around scan_all_buckets for callers that only need
+    one slice — anything needing several device_classes of the same domain
+    should call scan_all_buckets once and read every slice from that
+    instead. See scan_all_buckets for exactly what gets excluded.
+    """
+    return scan_all_buckets(hass, exclusions, domains=(domain,)).get(
+        domain, device_class
+    )
+
+
+def _is_scan_member(
+    hass: HomeAssistant,
+    indexed: IndexedEntity,
+    predicate: ExclusionPredicate,
+) -> bool:
+    """Per-entity half of scan_all_buckets' filtering (see its docstring)."""
+    if predicate.excludes(indexed):
+        return False
+
+    state_obj = hass.states.get(indexed.entity_id)
+    if not state_obj:
+        return False
+    # Foreign group exclusion: see scan_all_buckets' docstring.
+    return ATTR_ENTITY_ID not in state_obj.attributes
+
+
+def scan_all_buckets(
+    hass: HomeAssistant,
+    exclusions: ExclusionConfig,
+    *,
+    domains: Iterable[str] | None = None,
+    area_ids: Collection[str] | None = None,
+) -> MemberBuckets:
+    """
+    Collect every (domain, device_class) slice of `domains` (default: every
+    indexed domain) in a single walk over the RegistryIndex, plus each
+    domain's flat (domain, None) slice. `area_ids` limits the walk to those
+    areas (a targeted rebuild, see RebuildScope).
+
+    Replaces the discover-then-scan-per-device_class pattern, which walked
+    the same domain K+1 times for K device_classes and re-resolved the same
+    area/floor names on every walk; here each candidate is filtered once,
+    however many slices it ends up in, and area/floor names are read from
+    the shared TopologyCache (topology.py) rather than the registries.
 
     Always excludes this integration's own entities (entity.platform == DOMAIN),
     any *other* group entity (anything whose own state already carries an
@@ -146,90 +391,53 @@ def scan_domain_members(
     entities, entities without a current state, and anything matched by the
     configured exclusions.
     """
-    entity_reg = er.async_get(hass)
-    device_reg = dr.async_get(hass)
-    area_reg = ar.async_get(hass)
-    floor_reg = fr.async_get(hass)
-
-    area_entities: dict[str, list[str]] = {}
-    area_names: dict[str, str] = {}
-    floor_areas: dict[str, list[str]] = {}
-    floor_names: dict[str, str] = {}
-
-    for entity_entry in entity_reg.entities.values():
-        if entity_entry.domain != domain:
-            continue
-
-        # Self-exclusion: never let a Dashboard-created entity include itself.
-        if entity_entry.platform == DOMAIN:
-            continue
-
-        if entity_entry.hidden_by or entity_entry.disabled_by:
-            continue
-
-        entity_id = entity_entry.entity_id
-        if entity_id in exclusions.excluded_entity_ids:
-            continue
-        if (
-            entity_entry.device_id
-            and entity_entry.device_id in exclusions.excluded_device_ids
-        ):
-            continue
-        if (
-            entity_entry.platform
-            and entity_entry.platform in exclusions.excluded_integrations
-        ):
-            continue
-
-        state_obj = hass.states.get(entity_id)
-        if not state_obj:
-            continue
-
-        # Foreign group exclusion: see docstring above.
-        if ATTR_ENTITY_ID in state_obj.attributes:
-            continue
-
-        entity_device_class = state_obj.attributes.get("device_class")
-        if device_class is not None and entity_device_class != device_class:
-            continue
-        if (
-            entity_device_class
-            and entity_device_class in exclusions.excluded_device_classes
+    index = async_get_registry_index(hass)
+    topology = index.topology
+    predicate = async_get_exclusion_predicate(hass, exclusions)
+    area_members: dict[BucketKey, dict[str, list[str]]] = {}
+
+    for domain in index.domains() if domains is None else domains:
+        # Self-exclusion and hidden/disabled filtering already happened when
+        # the index was built; see registry_index.py.
+        for device_class, area_id, candidate_ids in index.iter_domain_buckets(
+            domain, area_ids
         ):
-            continue
-
-        area_id = _resolve_entity_area_id(entity_entry, device_reg)
-        if not area_id or area_id in exclusions.excluded_area_ids:
-            continue
-
-        area = area_reg.async_get_area(area_id)
-        if not area:
-            continue
-
-        area_entities.setdefault(area_id, []).append(entity_id)
-        area_names[area_id] = area.name
-
-        floor_id = area.floor_id
-        if floor_id and floor_id not in exclusions.excluded_floor_ids:
-            areas_on_floor = floor_areas.setdefault(floor_id, [])
-            if area_id not in areas_on_floor:
-                areas_on_floor.append(area_id)
-            if floor_id not in floor_names:
-                floor = floor_reg.async_get_floor(floor_id)
-                if floor:
-                    floor_names[floor_id] = floor.name
-
-    return ScopedMembers(
-        area_entities=area_entities,
-        area_names=area_names,
-        floor_areas=floor_areas,
-        floor_names=floor_names,
-    )
+            kept = [
+                entity_id
+                for entity_id in candidate_ids
+                if (indexed := index.get(entity_id)) is not None
+                and _is_scan_member(hass, indexed, predicate)
+            ]
+            if not kept:
+                continue
+            area_members.setdefault((domain, None), {}).setdefault(area_id, []).extend(
+                kept
+            )
+            if device_class is not None:
+                area_members.setdefault((domain, device_class), {}).setdefault(
+                    area_id, []
+                ).extend(kept)
+
+    buckets: dict[BucketKey, ScopedMembers] = {}
+    for key, area_entities in area_members.items():
+        # iter_domain_buckets only yields areas that exist, so every
+        # topology.area() here resolves.
+        area_names = {area_id: topology.area(area_id).name for area_id in area_entities}
+        floor_areas, floor_names = resolve_floors_for_areas(
+            hass, area_entities, exclusions
+        )
+        buckets[key] = ScopedMembers(
+            area_entities=area_entities,
+            area_names=area_names,
+            floor_areas=floor_areas,
+            floor_names=floor_names,
+        )
+    return MemberBuckets(buckets)
 
 
 def resolve_floors_for_areas(
     hass: HomeAssistant,
-    area_ids: set[str],
+    area_ids: Iterable[str],
     exclusions: ExclusionConfig,
 ) -> tuple[dict[str, list[str]], dict[str, str]]:
     """
@@ -239,19 +447,16 @@ def resolve_floors_for_areas(
     group (e.g. presence: motion + presence + occupancy + media_player) so
     floor grouping is computed once from the merged area set rather than
     reconciling floor_areas/floor_names across multiple separate scans.
+    Floors come back in the order their first area appears in `area_ids`.
     """
-    area_reg = ar.async_get(hass)
-    floor_reg = fr.async_get(hass)
+    topology = async_get_topology(hass)
 
     floor_areas: dict[str, list[str]] = {}
     floor_names: dict[str, str] = {}
 
     for area_id in area_ids:
-        area = area_reg.async_get_area(area_id)
-        if not area or not area.floor_id:
-            continue
-        floor_id = area.floor_id
-        if floor_id in exclusions.excluded_floor_ids:
+        floor_id = topology.area_floor_id(area_id)
+        if not floor_id or floor_id in exclusions.excluded_floor_ids:
             continue
 
         areas_on_floor = floor_areas.setdefault(floor_id, [])
@@ -259,9 +464,9 @@ def resolve_floors_for_areas(
             areas_on_floor.append(area_id)
 
         if floor_id not in floor_names:
-            floor = floor_reg.async_get_floor(floor_id)
-            if floor:
-                floor_names[floor_id] = floor.name
+            floor_name = topology.floor_name(floor_id)
+            if floor_name:
+                floor_names[floor_id] = floor_name
 
     return floor_areas, floor_names
 
@@ -272,6 +477,7 @@ def compute_group_attributes(
     domain: str,
     device_class: str | None,
     member_entity_ids: list[str],
+    tracker: ActiveMemberTracker | None = None,
 ) -> dict:
     """
     Build the standard extra_state_attributes for a group entity.
@@ -282,24 +488,53 @@ def compute_group_attributes(
     whether members are raw entities (area scope) or nested group entities
     (floor/global scope): both expose a plain HA state, so reading
     `hass.states.get(member_id).state` is valid either way.
+
+    With a `tracker` already holding the member states (see
+    NestedGroupMixin._group_attributes), nothing is re-read and only the
+    active members are walked.
+
+    With compact_group_attributes on, both member lists are left out: only
+    the counts, icon and color are published.
     """
-    entity_states: dict[str, str] = {}
-    for entity_id in member_entity_ids:
-        state_obj = hass.states.get(entity_id)
-        if state_obj and state_obj.state not in ("unavailable", "unknown"):
-            entity_states[entity_id] = state_obj.state
+    if tracker is not None:
+        active_states = tracker.active_states_by_id()
+        active_ids = list(active_states)
+        icon = compute_icon_for_states(
+            hass, domain, tracker.observed_states, device_class
+        )
+        color = compute_color(domain, device_class, active_states)
+    else:
+        entity_states: dict[str, str] = {}
+        for entity_id in member_entity_ids:
+            state_obj = hass.states.get(entity_id)
+            if state_obj and state_obj.state not in ("unavailable", "unknown"):
+                entity_states[entity_id] = state_obj.state
+        summary = summarize_members(hass, domain, entity_states, device_class)
+        active_ids, icon, color = summary.active_entity_ids, summary.icon, summary.color
+
+    attributes: dict = {}
+    if not compact_group_attributes(hass):
+        attributes[ATTR_ENTITY_ID] = list(member_entity_ids)
+        attributes["active_entity_ids"] = active_ids
+    attributes.update(
+        total=len(member_entity_ids),
+        active_count=len(active_ids),
+        icon=icon,
+        color=color,
+    )
+    return attributes
 
-    active_ids = compute_active_entity_ids(entity_states, domain)
-    icon = compute_icon(hass, domain, entity_states, device_class)
-    color = compute_color(domain, device_class, entity_states)
 
-    return {
-        ATTR_ENTITY_ID: list(member_entity_ids),
-        "total": len(member_entity_ids),
-        "active_entity_ids": active_ids,
-        "icon": icon,
-        "color": color,
-    }
+# hass.data[DOMAIN] key: CONF_COMPACT_GROUP_ATTRIBUTES as currently applied.
+DATA_COMPACT_GROUP_ATTRIBUTES = "compact_group_attributes"
+
+
+def compact_group_attributes(hass: HomeAssistant) -> bool:
+    """
+    Whether groups and sensors publish counts only, leaving their member
+    lists to the linus_dashboard/group_members websocket command.
+    """
+    return hass.data.get(DOMAIN, {}).get(DATA_COMPACT_GROUP_ATTRIBUTES, False)
 
 
 # Entity factory signature shared by every simple single-domain group
@@ -358,6 +593,193 @@ def ensure_area_device_placed(
         device_reg.async_update_device(device.id, area_id=area_id)
 
 
+def _shared_buckets(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    exclusions: ExclusionConfig,
+    domain: str,
+    scope: RebuildScope | None,
+) -> MemberBuckets:
+    """The entry's shared scan (hierarchy.py) when a builder got no buckets."""
+    # Imported here: hierarchy.py builds on this module's scan_all_buckets.
+    from .hierarchy import async_get_hierarchy_builder
+
+    return async_get_hierarchy_builder(hass, config_entry).buckets(
+        exclusions,
+        domains=(domain,),
+        area_ids=scope.area_ids if scope else None,
+    )
+
+
+def planned_device_info(entry_id: str, planned: PlannedGroup) -> dict:
+    """The area, floor or global device a planned group belongs to."""
+    tier, scope_id = planned.scope
+    if tier == "area":
+        return get_area_device_info(entry_id, scope_id, planned.name)
+    if tier == "floor":
+        return get_floor_device_info(entry_id, scope_id, planned.name)
+    return get_global_device_info(entry_id)
+
+
+def plan_domain_groups(
+    topology: TopologyCache,
+    exclusions: ExclusionConfig,
+    buckets: MemberBuckets,
+    *,
+    domain: str,
+    unique_id_prefix: str,
+    scope: RebuildScope | None = None,
+    existing_ids: Collection[str] = (),
+) -> GroupPlan:
+    """
+    Plan stage of build_nested_domain_groups: the area/floor/global
+    hierarchy of `domain`'s flat slice of an existing scan. Pure — see
+    group_plan.py.
+    """
+    scoped = buckets.get(domain)
+    return GroupPlan(
+        plan_nested_groups(
+            topology,
+            unique_id_prefix=unique_id_prefix,
+            area_entities=scoped.area_entities,
+            area_names=scoped.area_names,
+            floor_areas=scoped.floor_areas,
+            excluded_floor_ids=exclusions.excluded_floor_ids,
+            scope=scope,
+            existing_ids=existing_ids,
+        )
+    )
+
+
+def plan_device_class_groups(
+    topology: TopologyCache,
+    exclusions: ExclusionConfig,
+    buckets: MemberBuckets,
+    *,
+    domain: str,
+    unique_id_prefix: str,
+    device_classes: Iterable[str] = (),
+    scope: RebuildScope | None = None,
+    existing_ids: Collection[str] = (),
+) -> GroupPlan:
+    """
+    Plan stage of build_nested_device_class_groups: one hierarchy per
+    device_class in the scan, plus any of `device_classes` the scan didn't
+    see (a targeted scan only covers some areas, but a device_class absent
+    from them can still have floor/global tiers in scope). Pure — see
+    group_plan.py.
+    """
+    scanned = buckets.device_classes(domain)
+    plan = GroupPlan()
+    for device_class in [
+        *scanned,
+        *(dc for dc in device_classes if dc not in scanned),
+    ]:
+        scoped = buckets.get(domain, device_class)
+        plan.groups.extend(
+            plan_nested_groups(
+                topology,
+                unique_id_prefix=f"{unique_id_prefix}_{device_class}",
+                area_entities=scoped.area_entities,
+                area_names=scoped.area_names,
+                floor_areas=scoped.floor_areas,
+                excluded_floor_ids=exclusions.excluded_floor_ids,
+                scope=scope,
+                existing_ids=existing_ids,
+                device_class=device_class,
+            )
+        )
+    return plan
+
+
+# make_group(planned, device_info, member_entity_ids) for apply_group_plan:
+# construct one new group entity for a planned group.
+GroupMaker = Callable[[PlannedGroup, dict, list[str]], object]
+
+
+def apply_group_plan(
+    hass: HomeAssistant,
+    entry_id: str,
+    plan: GroupPlan,
+    *,
+    existing: Mapping[str, object],
+    make_group: GroupMaker,
+) -> list:
+    """
+    Apply stage: turn `plan` into group entities, diffed against the
+    platform's live groups (`existing`, unique_id -> entity).
+
+    Planned groups the platform doesn't have yet are built with
+    `make_group` (their area device placed first); existing ones are reused
+    as-is when their member set is unchanged, and otherwise get their new
+    members in one batch once the whole plan is resolved. Nested members
+    (child unique_ids) resolve to the child's live entity_id. Returns every
+    planned group's entity; adding the new ones and removing groups no
+    longer planned is async_rebuild_groups' job.
+    """
+    groups: dict[str, object] = {}
+    updates: list[tuple[object, list[str]]] = []
+
+    def _entity_id(unique_id: str) -> str | None:
+        group = groups.get(unique_id) or existing.get(unique_id)
+        return group.entity_id if group is not None else None
+
+    for planned in plan.groups:
+        if planned.nested:
+            member_ids = [
+                entity_id
+                for unique_id in planned.members
+                if (entity_id := _entity_id(unique_id))
+            ]
+        else:
+            member_ids = list(planned.members)
+
+        group = existing.get(planned.unique_id)
+        if group is None:
+            device_info = planned_device_info(entry_id, planned)
+            if not planned.nested:
+                ensure_area_device_placed(hass, entry_id, planned.scope[1], device_info)
+            group = make_group(planned, device_info, member_ids)
+        elif group.member_fingerprint != member_fingerprint(member_ids):
+            updates.append((group, member_ids))
+        group.group_scope = planned.scope
+        groups[planned.unique_id] = group
+
+    for group, member_ids in updates:
+        group.async_set_members(member_ids)
+    return list(groups.values())
+
+
+def _make_domain_group(
+    hass: HomeAssistant,
+    entity_factory: EntityFactory,
+    planned: PlannedGroup,
+    device_info: dict,
+    member_ids: list[str],
+    *,
+    translation_key: str,
+    translation_key_global: str,
+) -> object:
+    """apply_group_plan's make_group for build_nested_domain_groups."""
+    if planned.scope == GLOBAL_SCOPE:
+        return entity_factory(
+            hass,
+            planned.unique_id,
+            translation_key_global,
+            None,
+            device_info,
+            member_ids,
+        )
+    return entity_factory(
+        hass,
+        planned.unique_id,
+        translation_key,
+        {"name": planned.name},
+        device_info,
+        member_ids,
+    )
+
+
 async def build_nested_domain_groups(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -368,6 +790,9 @@ async def build_nested_domain_groups(
     translation_key: str,
     translation_key_global: str,
     entity_factory: EntityFactory,
+    buckets: MemberBuckets | None = None,
+    scope: RebuildScope | None = None,
+    existing: Mapping[str, object] | None = None,
 ) -> list:
     """
     Build area/floor/global group entities for a single-domain, no-device_class
@@ -377,101 +802,40 @@ async def build_nested_domain_groups(
     member_entity_ids)` must construct and return one group entity; this
     function only handles scanning, exclusion, and nesting — not the
     domain-specific control behavior (turn_on/turn_off/...), which stays in
-    each platform's entity class.
+    each platform's entity class. Without `buckets`, reads the entry's
+    shared scan (hierarchy.py's HierarchyBuilder); pass them when the
+    caller already holds a scan covering this domain. `existing` is the
+    platform's unique_id -> group registry (see apply_group_plan); with a
+    `scope`, only the groups in scope are returned (see RebuildScope).
     """
     if domain_is_excluded(domain, exclusions):
         return []
 
-    scoped = scan_domain_members(
-        hass, domain=domain, device_class=None, exclusions=exclusions
+    if buckets is None:
+        buckets = _shared_buckets(hass, config_entry, exclusions, domain, scope)
+    existing = existing or {}
+    plan = plan_domain_groups(
+        async_get_topology(hass),
+        exclusions,
+        buckets,
+        domain=domain,
+        unique_id_prefix=unique_id_prefix,
+        scope=scope,
+        existing_ids=existing.keys(),
     )
-    entry_id = config_entry.entry_id
-    entities: list = []
-    area_group_ids: dict[str, str] = {}
-
-    for area_id, member_ids in scoped.area_entities.items():
-        if not member_ids:
-            continue
-        area_device_info = get_area_device_info(
-            entry_id, area_id, scoped.area_names[area_id]
-        )
-        ensure_area_device_placed(hass, entry_id, area_id, area_device_info)
-        unique_id = f"{unique_id_prefix}_area_{area_id}"
-        entity = entity_factory(
-            hass,
-            unique_id,
-            translation_key,
-            {"name": scoped.area_names[area_id]},
-            area_device_info,
-            member_ids,
-        )
-        entities.append(entity)
-        area_group_ids[area_id] = entity.entity_id
-
-    floor_group_ids: list[str] = []
-    for floor_id, areas_on_floor in scoped.floor_areas.items():
-        member_ids = [area_group_ids[a] for a in areas_on_floor if a in area_group_ids]
-        if not member_ids:
-            continue
-        unique_id = f"{unique_id_prefix}_floor_{floor_id}"
-        entity = entity_factory(
-            hass,
-            unique_id,
-            translation_key,
-            {"name": scoped.floor_names.get(floor_id, floor_id)},
-            get_floor_device_info(
-                entry_id, floor_id, scoped.floor_names.get(floor_id, floor_id)
-            ),
-            member_ids,
-        )
-        entities.append(entity)
-        floor_group_ids.append(entity.entity_id)
-
-    if floor_group_ids:
-        unique_id = f"{unique_id_prefix}_global"
-        entity = entity_factory(
+    return apply_group_plan(
+        hass,
+        config_entry.entry_id,
+        plan,
+        existing=existing,
+        make_group=partial(
+            _make_domain_group,
             hass,
-            unique_id,
-            translation_key_global,
-            None,
-            get_global_device_info(entry_id),
-            floor_group_ids,
-        )
-        entities.append(entity)
-
-    return entities
-
-
-def discover_device_classes(
-    hass: HomeAssistant, domain: str, exclusions: ExclusionConfig
-) -> set[str]:
-    """
-    Find every device_class actually present among `domain`'s entities.
-
-    Used to build one set of area/floor/global groups per device_class
-    without a hardcoded list — a fixed list can't cover every device_class
-    an integration might report, and silently ignoring unlisted ones is
-    exactly the shape of bug this replaces (cover's gate/garage groups
-    never existed at all until device_class discovery was generalized
-    beyond binary_sensor).
-    """
-    entity_reg = er.async_get(hass)
-    device_classes: set[str] = set()
-    for entity_entry in entity_reg.entities.values():
-        if entity_entry.domain != domain or entity_entry.platform == DOMAIN:
-            continue
-        if entity_entry.hidden_by or entity_entry.disabled_by:
-            continue
-        state_obj = hass.states.get(entity_entry.entity_id)
-        if not state_obj:
-            continue
-        device_class = state_obj.attributes.get("device_class")
-        if not device_class:
-            continue
-        if device_class in exclusions.excluded_device_classes:
-            continue
-        device_classes.add(device_class)
-    return device_classes
+            entity_factory,
+            translation_key=translation_key,
+            translation_key_global=translation_key_global,
+        ),
+    )
 
 
 # Entity factory signature for build_nested_device_class_groups: like
@@ -482,6 +846,25 @@ DeviceClassEntityFactory = Callable[
 ]
 
 
+def _make_device_class_group(
+    hass: HomeAssistant,
+    entity_factory: DeviceClassEntityFactory,
+    planned: PlannedGroup,
+    device_info: dict,
+    member_ids: list[str],
+) -> object:
+    """apply_group_plan's make_group for build_nested_device_class_groups."""
+    return entity_factory(
+        hass,
+        planned.unique_id,
+        None,
+        None,
+        device_info,
+        member_ids,
+        planned.device_class,
+    )
+
+
 async def build_nested_device_class_groups(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -490,6 +873,9 @@ async def build_nested_device_class_groups(
     domain: str,
     unique_id_prefix: str,
     entity_factory: DeviceClassEntityFactory,
+    buckets: MemberBuckets | None = None,
+    scope: RebuildScope | None = None,
+    existing: Mapping[str, object] | None = None,
 ) -> list:
     """
     Build one set of area/floor/global group entities per device_class
@@ -502,79 +888,455 @@ async def build_nested_device_class_groups(
     HA falls back to its own core per-device_class entity name combined
     with the device's own name — see binary_sensor.py's
     BinarySensorDeviceClassGroup for why that's preferred over a hand-
-    rolled placeholder string.
+    rolled placeholder string. `buckets`, `scope`, `existing`: same as
+    build_nested_domain_groups.
     """
-    entry_id = config_entry.entry_id
-    entities: list = []
+    if buckets is None:
+        buckets = _shared_buckets(hass, config_entry, exclusions, domain, scope)
+    existing = existing or {}
+    plan = plan_device_class_groups(
+        async_get_topology(hass),
+        exclusions,
+        buckets,
+        domain=domain,
+        unique_id_prefix=unique_id_prefix,
+        device_classes=(
+            sorted(async_get_registry_index(hass).device_classes(domain))
+            if scope is not None
+            else ()
+        ),
+        scope=scope,
+        existing_ids=existing.keys(),
+    )
+    return apply_group_plan(
+        hass,
+        config_entry.entry_id,
+        plan,
+        existing=existing,
+        make_group=partial(_make_device_class_group, hass, entity_factory),
+    )
 
-    for device_class in discover_device_classes(hass, domain, exclusions):
-        scoped = scan_domain_members(
-            hass, domain=domain, device_class=device_class, exclusions=exclusions
-        )
-        area_group_ids: dict[str, str] = {}
 
-        for area_id, member_ids in scoped.area_entities.items():
-            if not member_ids:
+async def async_rebuild_groups(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    registries: Iterable[dict[str, object]],
+    build: Callable[[], Awaitable[list]],
+    *,
+    scope: RebuildScope | None = None,
+) -> None:
+    """
+    Every platform's _rebuild: run `build` (the platform's nested builders,
+    through its idempotent factories, so existing groups just get their
+    member list refreshed — or are left alone when it didn't change) and
+    reconcile the platform's group `registries`
+    with the result — add groups that didn't exist, remove the ones no
+    longer built. With a scope, only groups the scope covers are candidates
+    for removal; everything else was deliberately not rebuilt.
+    """
+    registries = list(registries)
+    before_ids = {
+        unique_id
+        for registry in registries
+        for unique_id, group in registry.items()
+        if scope is None or scope.covers(group.group_scope)
+    }
+    # Factories apply a changed member list synchronously (see
+    # NestedGroupMixin.async_set_members), so comparing fingerprints around
+    # build() tells exactly which existing groups it touched.
+    before_fingerprints = {
+        unique_id: group.member_fingerprint
+        for registry in registries
+        for unique_id, group in registry.items()
+    }
+
+    new_groups = await build()
+
+    after_ids = {group.unique_id for group in new_groups}
+    to_add = [group for group in new_groups if group.unique_id not in before_ids]
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        unchanged = changed = subscribed = unsubscribed = 0
+        for group in new_groups:
+            before = before_fingerprints.get(group.unique_id)
+            if before is None:
                 continue
-            area_device_info = get_area_device_info(
-                entry_id, area_id, scoped.area_names[area_id]
-            )
-            ensure_area_device_placed(hass, entry_id, area_id, area_device_info)
-            unique_id = f"{unique_id_prefix}_{device_class}_area_{area_id}"
-            entity = entity_factory(
-                hass,
-                unique_id,
-                None,
-                None,
-                area_device_info,
-                member_ids,
-                device_class,
+            after = group.member_fingerprint
+            if after == before:
+                unchanged += 1
+                continue
+            changed += 1
+            subscribed += len(after - before)
+            unsubscribed += len(before - after)
+        _LOGGER.debug(
+            "Rebuilt %d groups: %d unchanged (skipped), %d with new members "
+            "(+%d/-%d subscriptions), %d added, %d removed",
+            len(new_groups),
+            unchanged,
+            changed,
+            subscribed,
+            unsubscribed,
+            len(to_add),
+            len(before_ids - after_ids),
+        )
+
+    for unique_id in before_ids - after_ids:
+        for registry in registries:
+            stale = registry.pop(unique_id, None)
+            if stale is not None:
+                hass.async_create_task(stale.async_remove(force_remove=True))
+
+    if to_add:
+        async_add_entities(to_add)
+        # Entities created after initial setup (new area, entity moved in,
+        # ...) bypass the one-shot hide pass in async_setup_entry — without
+        # this they'd be exposed to voice assistants by default even with
+        # the option enabled.
+        from . import async_hide_group_entities_from_voice_assistants
+
+        await async_hide_group_entities_from_voice_assistants(hass, config_entry)
+
+
+def member_fingerprint(member_entity_ids: Iterable[str]) -> frozenset[str]:
+    """
+    Order-insensitive identity of a member list. A rebuild hands every
+    existing group its freshly scanned members; a group whose fingerprint
+    didn't change skips its resubscribe, recompute and state write.
+    """
+    return frozenset(member_entity_ids)
+
+
+class MemberSubscriptions:
+    """
+    One state-change subscription per member (on the shared
+    group_engine.StateDispatcher), kept in sync by diff: a member list
+    change only (un)subscribes the entity_ids that joined or left, instead
+    of tearing down and re-creating the whole subscription.
+    """
+
+    def __init__(self, hass: HomeAssistant, action: Callable[[Event], None]) -> None:
+        self.hass = hass
+        self._action = action
+        self._unsubs: dict[str, Callable[[], None]] | None = None
+
+    @property
+    def active(self) -> bool:
+        """Whether async_set has run since the last async_clear."""
+        return self._unsubs is not None
+
+    @property
+    def entity_ids(self) -> list[str]:
+        return list(self._unsubs or ())
+
+    @callback
+    def async_set(self, entity_ids: Iterable[str]) -> tuple[int, int]:
+        """Subscribe to exactly `entity_ids`; returns (added, removed)."""
+        if self._unsubs is None:
+            self._unsubs = {}
+        wanted = set(entity_ids)
+        removed = self._unsubs.keys() - wanted
+        for entity_id in removed:
+            self._unsubs.pop(entity_id)()
+        added = wanted - self._unsubs.keys()
+        dispatcher = async_get_state_dispatcher(self.hass)
+        for entity_id in added:
+            self._unsubs[entity_id] = dispatcher.async_subscribe(
+                entity_id, self._action
             )
-            entities.append(entity)
-            area_group_ids[area_id] = entity.entity_id
+        return len(added), len(removed)
 
-        floor_group_ids: list[str] = []
-        for floor_id, areas_on_floor in scoped.floor_areas.items():
-            member_ids = [
-                area_group_ids[a] for a in areas_on_floor if a in area_group_ids
-            ]
-            if not member_ids:
-                continue
-            unique_id = f"{unique_id_prefix}_{device_class}_floor_{floor_id}"
-            entity = entity_factory(
-                hass,
-                unique_id,
-                None,
-                None,
-                get_floor_device_info(
-                    entry_id, floor_id, scoped.floor_names.get(floor_id, floor_id)
-                ),
-                member_ids,
-                device_class,
+    @callback
+    def async_clear(self) -> None:
+        for unsub in (self._unsubs or {}).values():
+            unsub()
+        self._unsubs = None
+
+
+class MemberStateCache:
+    """
+    Member entity_id -> State, as last carried by a state_changed payload.
+
+    Recomputes used to call hass.states.get for every member on every
+    debounced event, although the event that triggered them already carries
+    the member's new State. Owners apply each event they receive and reduce
+    over the cache instead; `current` only re-reads hass.states after a
+    membership change (`invalidate`) or while the owner is not subscribed,
+    since nothing keeps the cache up to date then.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[str, State | None] = {}
+        self._stale = True
+
+    @callback
+    def invalidate(self) -> None:
+        self._stale = True
+
+    @callback
+    def current(
+        self, hass: HomeAssistant, entity_ids: Iterable[str], *, live: bool
+    ) -> "MemberStateCache":
+        """The cache, first fully re-read for `entity_ids` unless `live`."""
+        if self._stale or not live:
+            self._states = {
+                entity_id: hass.states.get(entity_id) for entity_id in entity_ids
+            }
+            self._stale = False
+        return self
+
+    @callback
+    def apply(self, event: Event) -> State | None:
+        """Take a member's new State from its state_changed event."""
+        entity_id = event.data["entity_id"]
+        new_state = event.data.get("new_state")
+        if entity_id in self._states:
+            self._states[entity_id] = new_state
+        return new_state
+
+    def get(self, entity_id: str) -> State | None:
+        return self._states.get(entity_id)
+
+    def states(self) -> list[State]:
+        """Every member with a State, in member order."""
+        return [state for state in self._states.values() if state is not None]
+
+    def available(self) -> list[State]:
+        """states(), minus unavailable members."""
+        return [
+            state
+            for state in self._states.values()
+            if state is not None and state.state != "unavailable"
+        ]
+
+
+def _event_time(event: Event) -> float:
+    """Wall-clock time a state_changed event was fired."""
+    return getattr(event, "time_fired_timestamp", None) or time.time()
+
+
+class AdaptiveDebounceMixin:
+    """
+    Member events -> one debounced `_async_debounced_update()` on the shared
+    DebounceWheel, with a window that follows this entity's own event rate.
+    """
+
+    _debounce_unsub: Callable[[], None] | None = None
+    _event_rate: EventRate | None = None
+
+    @callback
+    def _async_debounce(self) -> None:
+        """Count a member event; make sure an update is due within its window."""
+        wheel = async_get_debounce_wheel(self.hass)
+        if self._event_rate is None:
+            self._event_rate = wheel.async_event_rate(self.entity_id)
+        rate = self._event_rate.observe(self.hass.loop.time())
+        # Already due: this event rides along, and the window it started in
+        # stays the ceiling on its latency.
+        if self._debounce_unsub is not None:
+            return
+        storm = async_get_storm_detector(self.hass)
+        if storm.active:
+            # Held back until the storm passes (group_engine.StormDetector).
+            self._debounce_unsub = storm.async_defer(self._async_debounced_update)
+        else:
+            self._debounce_unsub = wheel.async_schedule(
+                self._async_debounced_update, rate
             )
-            entities.append(entity)
-            floor_group_ids.append(entity.entity_id)
-
-        if floor_group_ids:
-            unique_id = f"{unique_id_prefix}_{device_class}_global"
-            entity = entity_factory(
-                hass,
-                unique_id,
-                None,
-                None,
-                get_global_device_info(entry_id),
-                floor_group_ids,
-                device_class,
+
+
+class SkipUnchangedWriteMixin:
+    """
+    async_write_if_changed: a debounced recompute that came out identical
+    (same state, same attributes) writes nothing — no state_changed event,
+    no recorder row, no websocket push to every open dashboard.
+
+    Must come before the Entity class in the bases, so that every other
+    write (a service call, a member change, a registry update) goes through
+    async_write_ha_state below and invalidates the last signature. Every
+    write is also published to the AggregateFeed while a dashboard is
+    subscribed to it.
+    """
+
+    _last_written_signature: tuple | None = None
+    # Which area/floor/global the entity aggregates, for the feed's scope
+    # filter; set by the builders.
+    group_scope: GroupScope = GLOBAL_SCOPE
+
+    def _state_signature(self) -> tuple:
+        # Shallow copies: a later in-place edit of a written attributes
+        # dict must not also edit what it is compared against.
+        return (
+            self.available,
+            self.state,
+            _copy_mapping(self.capability_attributes),
+            _copy_mapping(self.state_attributes),
+            _copy_mapping(self.extra_state_attributes),
+        )
+
+    @callback
+    def async_write_if_changed(self) -> None:
+        signature = self._state_signature()
+        stats = async_get_write_stats(self.hass)
+        if signature == self._last_written_signature:
+            stats.suppressed += 1
+            return
+        stats.written += 1
+        self.async_write_ha_state()
+        self._last_written_signature = signature
+
+    def _aggregate_value(self) -> Any:
+        return self.state
+
+    def aggregate_fields(self) -> dict[str, Any]:
+        """What the AggregateFeed streams of this entity."""
+        attributes = self.extra_state_attributes or {}
+        fields = {"value": self._aggregate_value()}
+        for key in AGGREGATE_ATTRIBUTES:
+            if key in attributes:
+                fields[key] = attributes[key]
+        return fields
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        self._last_written_signature = None
+        super().async_write_ha_state()
+        feed = async_get_aggregate_feed(self.hass)
+        if feed.active:
+            feed.async_publish(
+                self.entity_id, self.group_scope, self.aggregate_fields()
             )
-            entities.append(entity)
 
-    return entities
+    async def async_will_remove_from_hass(self) -> None:
+        await super().async_will_remove_from_hass()
+        async_get_aggregate_feed(self.hass).async_remove(self.entity_id)
 
 
-DEBOUNCE_SECONDS = 0.1
+def _copy_mapping(mapping: Mapping | None) -> dict | None:
+    return None if mapping is None else dict(mapping)
 
 
-class NestedGroupMixin:
+# Attributes the recorder leaves out of every group's state rows: the
+# member lists (kilobytes on a global group, rewritten on every change)
+# and what's derived from them. The live state keeps them (unless
+# compact_group_attributes); member lists are also served on demand
+# (member_lists / async_get_member_lists / member_page).
+GROUP_UNRECORDED_ATTRIBUTES = frozenset({
+    ATTR_ENTITY_ID,
+    "active_entity_ids",
+    "total",
+    "active_count",
+    "icon",
+    "color",
+})
+
+
+@callback
+def async_get_member_lists(
+    hass: HomeAssistant, entity_id: str
+) -> dict[str, list[str]] | None:
+    """
+    The member lists of one of this integration's groups or sensors, read
+    from the entity itself; None if `entity_id` isn't one of them.
+    """
+    for platform in entity_platform.async_get_platforms(hass, DOMAIN):
+        entity = platform.entities.get(entity_id)
+        if entity is not None and hasattr(entity, "member_lists"):
+            return entity.member_lists()
+    return None
+
+
+@callback
+def async_aggregate_snapshot(
+    hass: HomeAssistant,
+) -> list[tuple[str, GroupScope, dict[str, Any]]]:
+    """Every added group and sensor with its current AggregateFeed fields."""
+    return [
+        (entity.entity_id, entity.group_scope, entity.aggregate_fields())
+        for platform in entity_platform.async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+        if isinstance(entity, SkipUnchangedWriteMixin)
+    ]
+
+
+@callback
+def async_schedule_group_updates(hass: HomeAssistant) -> None:
+    """Schedule a debounced recompute of every group and sensor."""
+    for platform in entity_platform.async_get_platforms(hass, DOMAIN):
+        for entity in platform.entities.values():
+            if isinstance(entity, AdaptiveDebounceMixin):
+                entity._async_debounce()
+
+
+# Breakdown of an area presence group's members (binary_sensor.PresenceGroup),
+# published as "<kind>_entity_ids" and served as member_lists too.
+PRESENCE_BREAKDOWN_KINDS = ("motion", "presence", "occupancy", "media")
+
+# Filters of member_page: every member, or one of the member_lists.
+MEMBER_FILTERS = ("all", "active", "unavailable", *PRESENCE_BREAKDOWN_KINDS)
+
+
+def member_page(
+    hass: HomeAssistant,
+    lists: Mapping[str, list[str]],
+    *,
+    member_filter: str = "all",
+    search: str | None = None,
+    offset: int = 0,
+    limit: int = 100,
+) -> dict[str, Any]:
+    """
+    One page of a member_lists result, each member with its current state.
+
+    "active"/"unavailable" use the entity's own list when it has one (the
+    health sensor's unavailable members are raw entities, not its children);
+    otherwise "unavailable" is read from the members' states and "active"
+    is empty. A presence breakdown kind that the entity has no list for is
+    empty too. `search` matches entity_id or friendly name, case-insensitive.
+    """
+    if member_filter == "all":
+        entity_ids = lists["members"]
+    elif member_filter in lists:
+        entity_ids = lists[member_filter]
+    elif member_filter == "unavailable":
+        entity_ids = [
+            entity_id
+            for entity_id in lists["members"]
+            if (state := hass.states.get(entity_id)) is None
+            or state.state in ("unavailable", "unknown")
+        ]
+    else:
+        entity_ids = []
+
+    active = set(lists.get("active", ()))
+    needle = search.casefold() if search else None
+    members = []
+    for entity_id in entity_ids:
+        state = hass.states.get(entity_id)
+        name = state.name if state is not None else entity_id
+        if (
+            needle
+            and needle not in entity_id.casefold()
+            and needle not in name.casefold()
+        ):
+            continue
+        members.append({
+            "entity_id": entity_id,
+            "name": name,
+            "state": state.state if state is not None else None,
+            "active": entity_id in active,
+        })
+
+    return {
+        "total": len(lists["members"]),
+        "active_count": len(active),
+        "count": len(members),
+        "offset": offset,
+        "members": members[offset : offset + limit],
+    }
+
+
+class NestedGroupMixin(AdaptiveDebounceMixin, SkipUnchangedWriteMixin):
     """
     Shared plumbing for a group entity living at area/floor/global scope.
 
@@ -591,7 +1353,7 @@ class NestedGroupMixin:
     instead of hand-rolling it — see _sync_ha_group_state below. Those core
     classes are themselves built on GroupEntity, whose own
     async_added_to_hass sets up an *undebounced* subscription — exactly what
-    this mixin's own debounce (DEBOUNCE_SECONDS) exists to avoid (see PR
+    this mixin's own debounce (group_engine.DebounceWheel) exists to avoid (see PR
     #152's "flatline" performance issue). async_added_to_hass below
     deliberately does not call super() to avoid ever reaching that
     ancestor's version through the MRO.
@@ -600,6 +1362,10 @@ class NestedGroupMixin:
     _attr_has_entity_name = True
     _attr_should_poll = False
     _attr_entity_registry_visible_default = True
+    _unrecorded_attributes = GROUP_UNRECORDED_ATTRIBUTES
+    # Set by the nested builders (see GroupScope); read by
+    # async_rebuild_groups to keep a targeted rebuild within its scope.
+    group_scope: GroupScope = GLOBAL_SCOPE
 
     def _init_group(
         self,
@@ -621,41 +1387,109 @@ class NestedGroupMixin:
         self._attr_device_info = device_info
         self.entity_id = f"{entity_id_prefix}.{unique_id}"
         self._member_entity_ids: list[str] = list(member_entity_ids)
-        self._unsub_state_changed: Callable[[], None] | None = None
+        self._member_fingerprint = member_fingerprint(member_entity_ids)
+        self._subscriptions = MemberSubscriptions(hass, self._async_state_changed)
         self._debounce_unsub: Callable[[], None] | None = None
+        # Member states fed by _async_state_changed (see _member_state_cache
+        # and _group_attributes).
+        self._member_states = MemberStateCache()
+        self._tracker: ActiveMemberTracker | None = None
+        self._tracker_stale = True
+        # Wall-clock time of the member event that started the pending
+        # debounce, for the engine's per-lane latency.
+        self._pending_since: float | None = None
 
     def is_empty(self) -> bool:
         """Whether this group has no members (used to trigger auto-removal)."""
         return len(self._member_entity_ids) == 0
 
-    async def async_update_members(self, member_entity_ids: list[str]) -> None:
-        """Replace the member list and recompute state (dynamic refresh)."""
+    def member_lists(self) -> dict[str, list[str]]:
+        """Members and active members, for async_get_member_lists."""
+        return {
+            "members": list(self._member_entity_ids),
+            "active": self._tracker.active_entity_ids() if self._tracker else [],
+        }
+
+    @property
+    def member_fingerprint(self) -> frozenset[str]:
+        return self._member_fingerprint
+
+    @callback
+    def async_set_members(self, member_entity_ids: list[str]) -> bool:
+        """
+        Replace the member list in place; False (and nothing done) if it's
+        the same member set. Only the members that actually joined or left
+        are (un)subscribed. Before async_added_to_hass nothing is subscribed
+        or written yet — that happens there, with whatever list is current.
+        """
+        fingerprint = member_fingerprint(member_entity_ids)
+        if fingerprint == self._member_fingerprint:
+            return False
         self._member_entity_ids = list(member_entity_ids)
-        await self._async_resubscribe()
-        self._recompute()
-        if self.hass:
+        self._member_fingerprint = fingerprint
+        self._member_states.invalidate()
+        self._tracker_stale = True
+        if self._subscriptions.active:
+            old_members = self._subscriptions.entity_ids
+            self._subscriptions.async_set(self._member_entity_ids)
+            self._async_track_children(old_members)
+            self._recompute()
             self.async_write_ha_state()
+        return True
 
-    async def _async_resubscribe(self) -> None:
-        if self._unsub_state_changed:
-            self._unsub_state_changed()
-        self._unsub_state_changed = async_track_state_change_event(
-            self.hass, self._member_entity_ids, self._async_state_changed
-        )
+    async def async_update_members(self, member_entity_ids: list[str]) -> None:
+        """Replace the member list and recompute state (dynamic refresh)."""
+        self.async_set_members(member_entity_ids)
 
     @callback
-    def _async_state_changed(self, _event) -> None:
-        if self._debounce_unsub:
-            self._debounce_unsub()
-        self._debounce_unsub = async_call_later(
-            self.hass, DEBOUNCE_SECONDS, self._async_debounced_update
+    def _async_track_children(self, old_members: Iterable[str] = ()) -> None:
+        """Tell the propagation engine what a floor/global group nests."""
+        if self.group_scope[0] == "area":
+            return
+        async_get_propagation_engine(self.hass).async_set_children(
+            self, old_members, self._member_entity_ids
         )
 
     @callback
-    def _async_debounced_update(self, _now=None) -> None:
+    def _async_state_changed(self, event) -> None:
+        new_state = self._member_states.apply(event)
+        if self._tracker is not None:
+            self._tracker.update(
+                event.data["entity_id"],
+                new_state.state if new_state is not None else None,
+            )
+        engine = async_get_propagation_engine(self.hass)
+        # A child written by the engine's running flush, which recomputes
+        # this group right after it: nothing to wait for.
+        if engine.in_flush(self):
+            return
+        if self._priority_lane(engine):
+            engine.async_propagate_now(self, since=_event_time(event))
+            return
+        if self._debounce_unsub is None:
+            self._pending_since = _event_time(event)
+        self._async_debounce()
+
+    def _priority_lane(self, engine: PropagationEngine) -> bool:
+        """Whether this group skips the debounce (see async_propagate_now)."""
+        return False
+
+    @callback
+    def _async_debounced_update(self) -> None:
         self._debounce_unsub = None
+        # This group and every group above it, in one tick (group_engine.py).
+        async_get_propagation_engine(self.hass).async_mark_dirty(
+            self, since=self._pending_since
+        )
+
+    @callback
+    def async_flush_update(self) -> None:
+        """Recompute and write now; called by the propagation engine."""
+        if self._debounce_unsub:
+            self._debounce_unsub()
+            self._debounce_unsub = None
         self._recompute()
-        self.async_write_ha_state()
+        self.async_write_if_changed()
 
     async def async_added_to_hass(self) -> None:
         """
@@ -666,14 +1500,19 @@ class NestedGroupMixin:
         skipping the chain entirely here is simpler than fighting the MRO to
         bypass just that one ancestor.
         """
-        await self._async_resubscribe()
+        self._subscriptions.async_set(self._member_entity_ids)
+        self._async_track_children()
+        self._member_states.invalidate()
+        self._tracker_stale = True
         self._recompute()
 
     async def async_will_remove_from_hass(self) -> None:
         await super().async_will_remove_from_hass()
-        if self._unsub_state_changed:
-            self._unsub_state_changed()
-            self._unsub_state_changed = None
+        if self.group_scope[0] != "area":
+            async_get_propagation_engine(self.hass).async_set_children(
+                self, self._subscriptions.entity_ids, ()
+            )
+        self._subscriptions.async_clear()
         if self._debounce_unsub:
             self._debounce_unsub()
             self._debounce_unsub = None
@@ -681,6 +1520,44 @@ class NestedGroupMixin:
     def _recompute(self) -> None:
         raise NotImplementedError
 
+    @callback
+    def _member_state_cache(self) -> MemberStateCache:
+        """Member States to reduce over, kept current by member events."""
+        return self._member_states.current(
+            self.hass, self._member_entity_ids, live=self._subscriptions.active
+        )
+
+    def _group_attributes(
+        self,
+        *,
+        domain: str,
+        device_class: str | None = None,
+        active_states: Iterable[str] | None = None,
+    ) -> dict:
+        """
+        compute_group_attributes from this group's ActiveMemberTracker.
+        The tracker is recounted (from the member state cache) only after a
+        membership change, or while nothing is subscribed to keep it
+        current; every other recompute reuses what member events applied.
+        """
+        if self._tracker is None:
+            self._tracker = ActiveMemberTracker(domain, active_states)
+            self._tracker_stale = True
+        if self._tracker_stale or not self._subscriptions.active:
+            cache = self._member_state_cache()
+            self._tracker.recount(
+                self._member_entity_ids,
+                {state.entity_id: state.state for state in cache.states()},
+            )
+            self._tracker_stale = False
+        return compute_group_attributes(
+            self.hass,
+            domain=domain,
+            device_class=device_class,
+            member_entity_ids=self._member_entity_ids,
+            tracker=self._tracker,
+        )
+
     def _sync_ha_group_state(
         self, *, domain: str, device_class: str | None = None
     ) -> None:
@@ -706,21 +1583,18 @@ class NestedGroupMixin:
           is mixed into.
         - compute_group_attributes() then *replaces*
           extra_state_attributes wholesale with our own entity_id/total/
-          active_entity_ids/icon/color, same as every non-HA-inherited
+          active_entity_ids/icon/color (from the group's ActiveMemberTracker,
+          see _group_attributes), same as every non-HA-inherited
           platform (climate.py, media_player.py, siren.py) — it already
           covers everything HA's own init sets there (just entity_id), so
           there's nothing worth preserving from it.
         """
         self._entity_ids = self._member_entity_ids
+        cache = self._member_state_cache()
         for entity_id in self._member_entity_ids:
-            self.async_update_supported_features(
-                entity_id, self.hass.states.get(entity_id)
-            )
+            self.async_update_supported_features(entity_id, cache.get(entity_id))
         self.async_update_group_state()
 
-        self._attr_extra_state_attributes = compute_group_attributes(
-            self.hass,
-            domain=domain,
-            device_class=device_class,
-            member_entity_ids=self._member_entity_ids,
+        self._attr_extra_state_attributes = self._group_attributes(
+            domain=domain, device_class=device_class
         )
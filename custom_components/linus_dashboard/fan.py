@@ -18,6 +18,8 @@ current on/off state.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 from typing import Any
 
 from homeassistant.components.fan import (
@@ -28,12 +30,18 @@ from homeassistant.components.fan import (
 from homeassistant.components.group.fan import FanGroup as HAFanGroup
 from homeassistant.components.group.util import find_state_attributes
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON, STATE_UNAVAILABLE
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity_group import ExclusionConfig, NestedGroupMixin, build_nested_domain_groups
+from .entity_group import (
+    ExclusionConfig,
+    NestedGroupMixin,
+    RebuildScope,
+    async_rebuild_groups,
+    build_nested_domain_groups,
+)
 from .group_manager import PlatformGroupManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,12 +80,7 @@ class FanGroup(NestedGroupMixin, HAFanGroup):
         # from its own SUPPORTED_FLAGS) — same intersection-for-features/
         # union-for-values pattern as the rest of this integration, just
         # filled in by hand since HA's doesn't cover it.
-        states = [
-            state
-            for entity_id in self._member_entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-            and state.state != STATE_UNAVAILABLE
-        ]
+        states = self._member_state_cache().available()
 
         presets: list[str] = []
         for preset_list in find_state_attributes(states, "preset_modes"):
@@ -212,7 +215,7 @@ def _make_fan_group(
     """Idempotent factory — see light.py's _make_light_group for the full rationale."""
     existing = _FAN_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
     group = FanGroup(
         hass,
@@ -250,28 +253,34 @@ async def async_setup_entry(
         async_add_entities(entities)
         _LOGGER.info("Created %d fan group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        before_ids = set(_FAN_GROUPS.keys())
-        new_groups = await build_nested_domain_groups(
-            hass, config_entry, exclusions, **build_kwargs
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        # See light.py's _rebuild for the scope.
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
+            hass,
+            config_entry,
+            async_add_entities,
+            (_FAN_GROUPS,),
+            partial(
+                build_nested_domain_groups,
+                hass,
+                config_entry,
+                exclusions,
+                **build_kwargs,
+                scope=scope,
+                existing=_FAN_GROUPS,
+            ),
+            scope=scope,
         )
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
 
-        for uid in before_ids - after_ids:
-            stale = _FAN_GROUPS.pop(uid)
-            hass.async_create_task(stale.async_remove(force_remove=True))
-
-        if to_add:
-            async_add_entities(to_add)
-            # See light.py's _rebuild for why this is needed here too.
-            from . import async_hide_group_entities_from_voice_assistants
-
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
-
-    platform_manager = PlatformGroupManager(hass, monitored_domains=["fan"])
+    platform_manager = PlatformGroupManager(
+        hass, monitored_domains=["fan"], config_entry=config_entry
+    )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
@@ -0,0 +1,980 @@
+"""
+Central state-change dispatch for every Linus Dashboard group and sensor.
+
+Each group entity and aggregate/health sensor used to call
+async_track_state_change_event for its own members, so a raw light sat in
+one tracker list per group it belongs to (its area light group, the
+presence group, a device_class group, the health sensor...) and every one
+of its state changes walked all of them. The StateDispatcher listens to
+EVENT_STATE_CHANGED exactly once and keeps a reverse index from each
+member entity_id to the callbacks of the groups depending on it, so an
+event costs one dict lookup plus one call per actual dependent, however
+many groups exist.
+
+Debouncing goes through one shared DebounceWheel rather than an
+async_call_later timer per group, cancelled and re-created on every member
+event. A dirty group joins a fixed tick boundary of the wheel and every
+group due at that boundary is flushed together, so a burst of events costs
+one armed timer per tick however many events or groups it involves.
+
+How far away that boundary is adapts to each group's own traffic: every
+group keeps an EventRate, and the wheel turns it into a window between the
+configured bounds (CONF_DEBOUNCE_MIN_MS / CONF_DEBOUNCE_MAX_MS). A quiet
+group is recomputed at the minimum window; a group fed by power sensors
+reporting every second widens towards the maximum, which is also the
+hard ceiling on how long any member change waits.
+
+The PropagationEngine then carries a recompute up the nested hierarchy.
+A floor group's members are area group entities and the global group's
+are floor groups, so a member change used to climb through three chained
+debounces (and three rounds of write, broadcast, wait). Instead, when an
+area group's debounce fires, the engine marks it and every group above it
+dirty and recomputes them all in tier order (area, floor, global) in one
+loop tick. Each parent ignores its children's writes while it is part of
+that flush, since it is about to be recomputed anyway, and then reads
+those children's results straight back: async_write_ha_state lands in the
+state machine synchronously, so within the tick they are already current.
+
+Safety-critical groups (smoke, gas, carbon_monoxide, moisture, tamper by
+default; CONF_PRIORITY_DEVICE_CLASSES) take a priority lane instead: no
+debounce, no waiting for the next loop tick — the member event itself
+recomputes the area, floor and global groups before anything queued runs.
+Every other group stays batched. The end-to-end latency of each lane,
+from the first member event to the last group written, is kept for
+diagnostics.
+
+During an event storm (a restart, a Zigbee or MQTT reconnect) the
+dispatcher's StormDetector suspends all of that: updates are deferred
+until the storm passes, then every dirty group is recomputed once.
+
+What comes out of those writes also reaches dashboards through the
+AggregateFeed (linus_dashboard/subscribe_aggregates): only the fields a
+chip reads (value, active_count, total, icon, color), only those that
+changed, once per tick, and only for the scope a client asked for —
+rather than every full attribute dict of every group on state_changed.
+
+All three are owned by the config entry (async_setup_state_dispatcher,
+async_setup_debounce_wheel, async_setup_propagation_engine) and shared
+through their async_get_* accessors, same pattern as registry_index.py.
+"""
+
+import asyncio
+import logging
+import math
+import time
+import weakref
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+from typing import Any, Protocol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .const import (
+    CONF_DEBOUNCE_MAX_MS,
+    CONF_DEBOUNCE_MIN_MS,
+    CONF_PRIORITY_DEVICE_CLASSES,
+    DEFAULT_DEBOUNCE_MAX_MS,
+    DEFAULT_DEBOUNCE_MIN_MS,
+    DEFAULT_PRIORITY_DEVICE_CLASSES,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_STATE_DISPATCHER = "state_dispatcher"
+DATA_DEBOUNCE_WHEEL = "debounce_wheel"
+DATA_WRITE_STATS = "write_stats"
+DATA_PROPAGATION_ENGINE = "propagation_engine"
+DATA_AGGREGATE_FEED = "aggregate_feed"
+
+# Granularity of the debounce wheel; every window is rounded down to it.
+DEBOUNCE_TICK_SECONDS = 0.05
+# Seconds of debounce window each event/s of sustained member traffic adds
+# on top of the minimum window.
+DEBOUNCE_RATE_GAIN = 0.5
+# Time constant of the EventRate moving average, in seconds.
+EVENT_RATE_HORIZON = 10.0
+
+# Event storms (see StormDetector): tracked member events per second that
+# start one, the rate it must fall back under to end, and how long deferred
+# recomputes may wait if it never does.
+STORM_START_EVENTS_PER_SECOND = 200
+STORM_END_EVENTS_PER_SECOND = 40
+STORM_CHECK_SECONDS = 1.0
+STORM_MAX_DEFER_SECONDS = 30.0
+
+StateAction = Callable[[Event], None]
+
+
+class StateDispatcher:
+    """entity_id -> dependent callbacks, behind a single bus listener."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # entity_id -> {action: None}: an insertion-ordered set, so
+        # dependents are called in subscription order.
+        self._dependents: dict[str, dict[StateAction, None]] = {}
+        self._unsub_bus: CALLBACK_TYPE | None = None
+        self.storm = StormDetector(hass)
+        # Diagnostics counters.
+        self.events = 0
+        self.dispatches = 0
+
+    @callback
+    def async_subscribe(self, entity_id: str, action: StateAction) -> CALLBACK_TYPE:
+        """Call `action(event)` on every state change of `entity_id`."""
+        self._dependents.setdefault(entity_id, {})[action] = None
+        self._async_ensure_listening()
+
+        @callback
+        def _unsubscribe() -> None:
+            self._async_unsubscribe(entity_id, action)
+
+        return _unsubscribe
+
+    @callback
+    def async_track(
+        self, entity_ids: Iterable[str], action: StateAction
+    ) -> CALLBACK_TYPE:
+        """async_subscribe for several entity_ids, undone by one callable."""
+        entity_ids = list(dict.fromkeys(entity_ids))
+        for entity_id in entity_ids:
+            self._dependents.setdefault(entity_id, {})[action] = None
+        self._async_ensure_listening()
+
+        @callback
+        def _unsubscribe() -> None:
+            for entity_id in entity_ids:
+                self._async_unsubscribe(entity_id, action)
+
+        return _unsubscribe
+
+    @callback
+    def _async_unsubscribe(self, entity_id: str, action: StateAction) -> None:
+        actions = self._dependents.get(entity_id)
+        if actions is None:
+            return
+        actions.pop(action, None)
+        if not actions:
+            del self._dependents[entity_id]
+        if not self._dependents and self._unsub_bus is not None:
+            self._unsub_bus()
+            self._unsub_bus = None
+
+    @callback
+    def _async_ensure_listening(self) -> None:
+        if self._unsub_bus is None and self._dependents:
+            self._unsub_bus = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_dispatch,
+                event_filter=self._async_filter,
+            )
+
+    @callback
+    def _async_filter(self, event_data: Any) -> bool:
+        return event_data["entity_id"] in self._dependents
+
+    @callback
+    def _async_dispatch(self, event: Event) -> None:
+        actions = self._dependents.get(event.data["entity_id"])
+        if not actions:
+            return
+        self.events += 1
+        self.storm.async_observe()
+        # Copied: a dependent may (un)subscribe while being dispatched to.
+        for action in tuple(actions):
+            self.dispatches += 1
+            try:
+                action(event)
+            except Exception:
+                _LOGGER.exception("Error dispatching %s to %s", event, action)
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub_bus is not None:
+            self._unsub_bus()
+            self._unsub_bus = None
+        self._dependents.clear()
+        self.storm.async_stop()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "listening": self._unsub_bus is not None,
+            "entities": len(self._dependents),
+            "subscriptions": sum(len(a) for a in self._dependents.values()),
+            "events": self.events,
+            "dispatches": self.dispatches,
+            "storm": self.storm.as_dict(),
+        }
+
+
+class StormDetector:
+    """
+    Notices event storms across all tracked members and holds recomputes
+    back until they pass.
+
+    After an HA restart or a Zigbee/MQTT reconnect, thousands of members
+    change state within seconds and every group would recompute once per
+    debounce window all along. Past STORM_START_EVENTS_PER_SECOND, groups
+    and sensors defer their update here instead of scheduling it on the
+    wheel; once the rate falls under STORM_END_EVENTS_PER_SECOND, every
+    deferred update runs once, in one bulk pass (nested groups through one
+    propagation flush). A storm that never calms down still gets a bulk
+    pass every STORM_MAX_DEFER_SECONDS. The priority lane never waits.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        start_rate: float = STORM_START_EVENTS_PER_SECOND,
+        end_rate: float = STORM_END_EVENTS_PER_SECOND,
+    ) -> None:
+        self.hass = hass
+        self.start_rate = start_rate
+        self.end_rate = end_rate
+        # Events in the current whole loop-time second.
+        self._second = 0
+        self._second_events = 0
+        # Only while a storm lasts: events since the last check, when it
+        # (or the last bulk pass) began, and the deferred updates.
+        self._window_events = 0
+        self._started = 0.0
+        self._flushed = 0.0
+        self._check: asyncio.TimerHandle | None = None
+        self._deferred: dict[Callable[[], None], None] = {}
+        # (deferred_events, bulk_recomputes) when the storm began, for its
+        # end-of-storm report.
+        self._session = (0, 0)
+        # Diagnostics counters.
+        self.storms = 0
+        self.deferred_events = 0
+        self.bulk_recomputes = 0
+
+    @property
+    def active(self) -> bool:
+        return self._check is not None
+
+    @callback
+    def async_observe(self) -> None:
+        """Count one tracked member event."""
+        if self._check is not None:
+            self._window_events += 1
+            return
+        second = int(self.hass.loop.time())
+        if second != self._second:
+            self._second = second
+            self._second_events = 0
+        self._second_events += 1
+        if self._second_events >= self.start_rate:
+            self._async_start()
+
+    @callback
+    def async_defer(self, action: Callable[[], None]) -> CALLBACK_TYPE:
+        """Run `action` in the storm's bulk pass; returns its cancel."""
+        self.deferred_events += 1
+        self._deferred[action] = None
+        return partial(self._deferred.pop, action, None)
+
+    @callback
+    def _async_start(self) -> None:
+        self.storms += 1
+        self._started = self._flushed = self.hass.loop.time()
+        self._window_events = 0
+        self._session = (self.deferred_events, self.bulk_recomputes)
+        self._check = self.hass.loop.call_later(STORM_CHECK_SECONDS, self._async_tick)
+        _LOGGER.info(
+            "Event storm: over %d member events/s, holding group updates back",
+            self.start_rate,
+        )
+
+    @callback
+    def _async_tick(self) -> None:
+        now = self.hass.loop.time()
+        rate = self._window_events / STORM_CHECK_SECONDS
+        self._window_events = 0
+        if rate < self.end_rate:
+            self._check = None
+            self._async_bulk_recompute()
+            deferred = self.deferred_events - self._session[0]
+            recomputes = self.bulk_recomputes - self._session[1]
+            _LOGGER.info(
+                "Event storm over after %.1fs: %d deferred member updates "
+                "took %d recomputes (%d saved)",
+                now - self._started,
+                deferred,
+                recomputes,
+                deferred - recomputes,
+            )
+            return
+        if now - self._flushed >= STORM_MAX_DEFER_SECONDS:
+            self._flushed = now
+            self._async_bulk_recompute()
+        self._check = self.hass.loop.call_later(STORM_CHECK_SECONDS, self._async_tick)
+
+    @callback
+    def _async_bulk_recompute(self) -> None:
+        deferred, self._deferred = self._deferred, {}
+        for action in deferred:
+            self.bulk_recomputes += 1
+            try:
+                action()
+            except Exception:
+                _LOGGER.exception("Error running deferred update %s", action)
+
+    @callback
+    def async_stop(self) -> None:
+        if self._check is not None:
+            self._check.cancel()
+            self._check = None
+        self._deferred.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "active": self.active,
+            "storms": self.storms,
+            "deferred_updates": self.deferred_events,
+            "bulk_recomputes": self.bulk_recomputes,
+            "recomputes_saved": self.deferred_events - self.bulk_recomputes,
+        }
+
+
+@callback
+def async_get_state_dispatcher(hass: HomeAssistant) -> StateDispatcher:
+    """
+    The shared dispatcher for this integration's config entry.
+
+    Normally created by async_setup_state_dispatcher at entry setup; created
+    on demand if something subscribes before that — only ever the case
+    outside a real config entry setup.
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    dispatcher = data.get(DATA_STATE_DISPATCHER)
+    if dispatcher is None:
+        dispatcher = data[DATA_STATE_DISPATCHER] = StateDispatcher(hass)
+    return dispatcher
+
+
+@callback
+def async_get_storm_detector(hass: HomeAssistant) -> StormDetector:
+    """The shared dispatcher's storm detector."""
+    return async_get_state_dispatcher(hass).storm
+
+
+@callback
+def async_setup_state_dispatcher(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> StateDispatcher:
+    """Create the entry's dispatcher; stopped and dropped with the entry."""
+    dispatcher = StateDispatcher(hass)
+    hass.data.setdefault(DOMAIN, {})[DATA_STATE_DISPATCHER] = dispatcher
+
+    @callback
+    def _drop_dispatcher() -> None:
+        dispatcher.async_stop()
+        if hass.data.get(DOMAIN, {}).get(DATA_STATE_DISPATCHER) is dispatcher:
+            hass.data[DOMAIN].pop(DATA_STATE_DISPATCHER)
+
+    entry.async_on_unload(_drop_dispatcher)
+    return dispatcher
+
+
+class EventRate:
+    """A group's recent member event rate: an exponentially decaying count."""
+
+    __slots__ = ("__weakref__", "_last", "_score")
+
+    def __init__(self) -> None:
+        self._score = 0.0
+        self._last = 0.0
+
+    def _decayed(self, now: float) -> float:
+        if not self._score:
+            return 0.0
+        return self._score * math.exp((self._last - now) / EVENT_RATE_HORIZON)
+
+    def observe(self, now: float) -> float:
+        """Count one event at loop time `now`; returns the new rate."""
+        self._score = self._decayed(now) + 1.0
+        self._last = now
+        return self._score / EVENT_RATE_HORIZON
+
+    def per_second(self, now: float) -> float:
+        return self._decayed(now) / EVENT_RATE_HORIZON
+
+
+class DebounceWheel:
+    """Pending debounced callbacks, fired together at fixed tick boundaries."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        tick: float = DEBOUNCE_TICK_SECONDS,
+        *,
+        min_window: float = DEFAULT_DEBOUNCE_MIN_MS / 1000,
+        max_window: float = DEFAULT_DEBOUNCE_MAX_MS / 1000,
+    ) -> None:
+        self.hass = hass
+        self.tick = tick
+        self.min_window = min_window
+        self.max_window = max_window
+        # Tick index -> {action: None}: insertion-ordered sets, each slot
+        # fired in schedule order.
+        self._slots: dict[int, dict[Callable[[], None], None]] = {}
+        self._slot_of: dict[Callable[[], None], int] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._armed_slot: int | None = None
+        # entity_id -> EventRate, for diagnostics only.
+        self._rates: weakref.WeakValueDictionary[str, EventRate] = (
+            weakref.WeakValueDictionary()
+        )
+        # Diagnostics counters.
+        self.ticks = 0
+        self.scheduled = 0
+        self.fired = 0
+
+    @callback
+    def async_set_bounds(self, min_window: float, max_window: float) -> None:
+        """Apply the options flow's window bounds (seconds)."""
+        self.min_window = max(min_window, self.tick)
+        self.max_window = max(max_window, self.min_window)
+
+    def window(self, rate: float) -> float:
+        """Debounce window for a group seeing `rate` member events/s."""
+        return min(self.min_window + rate * DEBOUNCE_RATE_GAIN, self.max_window)
+
+    @callback
+    def async_event_rate(self, entity_id: str) -> EventRate:
+        """A new EventRate for `entity_id`, listed in diagnostics while alive."""
+        rate = self._rates[entity_id] = EventRate()
+        return rate
+
+    @callback
+    def async_schedule(
+        self, action: Callable[[], None], rate: float = 0.0
+    ) -> CALLBACK_TYPE:
+        """
+        Call `action()` once this group's window — see window() — has
+        passed; returns its cancel. An action already pending keeps its
+        slot, so a member change never waits longer than the window it
+        started: callers avoid even this call by holding on to the returned
+        cancel until their action has run.
+        """
+        if action not in self._slot_of:
+            now = self.hass.loop.time()
+            # Rounded down to a boundary: the wait never exceeds the window.
+            slot = math.floor((now + self.window(rate)) / self.tick)
+            self._slots.setdefault(slot, {})[action] = None
+            self._slot_of[action] = slot
+            self.scheduled += 1
+            if self._armed_slot is None or slot < self._armed_slot:
+                self._async_arm(slot)
+        return partial(self._async_cancel, action)
+
+    @callback
+    def _async_arm(self, slot: int) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._armed_slot = slot
+        self._timer = self.hass.loop.call_at(slot * self.tick, self._async_tick)
+
+    @callback
+    def _async_disarm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._armed_slot = None
+
+    @callback
+    def _async_cancel(self, action: Callable[[], None]) -> None:
+        slot = self._slot_of.pop(action, None)
+        if slot is None:
+            return
+        actions = self._slots[slot]
+        actions.pop(action)
+        if actions:
+            return
+        del self._slots[slot]
+        if slot == self._armed_slot:
+            if self._slots:
+                self._async_arm(min(self._slots))
+            else:
+                self._async_disarm()
+
+    @callback
+    def _async_tick(self) -> None:
+        armed, self._timer, self._armed_slot = self._armed_slot, None, None
+        due = sorted(slot for slot in self._slots if armed is None or slot <= armed)
+        # Taken out, and the next slot armed, first: an action may schedule
+        # itself again.
+        batches = [self._slots.pop(slot) for slot in due]
+        for actions in batches:
+            for action in actions:
+                del self._slot_of[action]
+        if self._slots:
+            self._async_arm(min(self._slots))
+        self.ticks += 1
+        for actions in batches:
+            for action in actions:
+                self.fired += 1
+                try:
+                    action()
+                except Exception:
+                    _LOGGER.exception("Error running debounced %s", action)
+
+    @callback
+    def async_stop(self) -> None:
+        self._async_disarm()
+        self._slots.clear()
+        self._slot_of.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        now = self.hass.loop.time()
+        return {
+            "tick_seconds": self.tick,
+            "min_window_seconds": self.min_window,
+            "max_window_seconds": self.max_window,
+            "pending": len(self._slot_of),
+            "ticks": self.ticks,
+            "scheduled": self.scheduled,
+            "fired": self.fired,
+            # Only the groups currently debounced above the minimum.
+            "widened_windows": {
+                entity_id: round(window, 3)
+                for entity_id, rate in sorted(self._rates.items())
+                if (window := self.window(rate.per_second(now))) > self.min_window
+            },
+        }
+
+
+def priority_device_classes(options: Mapping[str, Any]) -> list[str]:
+    """binary_sensor device_classes on the priority lane, from the options."""
+    return list(
+        options.get(CONF_PRIORITY_DEVICE_CLASSES, DEFAULT_PRIORITY_DEVICE_CLASSES)
+    )
+
+
+def debounce_bounds(options: Mapping[str, Any]) -> tuple[float, float]:
+    """(min, max) debounce window in seconds from the entry's options."""
+    min_ms = options.get(CONF_DEBOUNCE_MIN_MS, DEFAULT_DEBOUNCE_MIN_MS)
+    max_ms = options.get(CONF_DEBOUNCE_MAX_MS, DEFAULT_DEBOUNCE_MAX_MS)
+    return float(min_ms) / 1000, float(max_ms) / 1000
+
+
+@callback
+def async_get_debounce_wheel(hass: HomeAssistant) -> DebounceWheel:
+    """The shared wheel; created on demand, like async_get_state_dispatcher."""
+    data = hass.data.setdefault(DOMAIN, {})
+    wheel = data.get(DATA_DEBOUNCE_WHEEL)
+    if wheel is None:
+        wheel = data[DATA_DEBOUNCE_WHEEL] = DebounceWheel(hass)
+    return wheel
+
+
+@callback
+def async_setup_debounce_wheel(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> DebounceWheel:
+    """Create the entry's wheel; stopped and dropped with the entry."""
+    wheel = DebounceWheel(hass)
+    wheel.async_set_bounds(*debounce_bounds(entry.options))
+    hass.data.setdefault(DOMAIN, {})[DATA_DEBOUNCE_WHEEL] = wheel
+
+    @callback
+    def _drop_wheel() -> None:
+        wheel.async_stop()
+        if hass.data.get(DOMAIN, {}).get(DATA_DEBOUNCE_WHEEL) is wheel:
+            hass.data[DOMAIN].pop(DATA_DEBOUNCE_WHEEL)
+
+    entry.async_on_unload(_drop_wheel)
+    return wheel
+
+
+class WriteStats:
+    """How many debounced state writes went out, and how many were no-ops."""
+
+    def __init__(self) -> None:
+        self.written = 0
+        self.suppressed = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"written": self.written, "suppressed": self.suppressed}
+
+
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> WriteStats:
+    """The shared write counters (entity_group.SkipUnchangedWriteMixin)."""
+    data = hass.data.setdefault(DOMAIN, {})
+    stats = data.get(DATA_WRITE_STATS)
+    if stats is None:
+        stats = data[DATA_WRITE_STATS] = WriteStats()
+    return stats
+
+
+# Topological order of the nested hierarchy: children always sit in a lower
+# tier than the groups nesting them (see entity_group.py's NESTING).
+TIER_ORDER = {"area": 0, "floor": 1, "global": 2}
+
+
+class PropagatingGroup(Protocol):
+    """What the engine needs from a group (entity_group.NestedGroupMixin)."""
+
+    entity_id: str
+    group_scope: tuple[str, str | None]
+
+    def async_flush_update(self) -> None:
+        """Recompute and write state now, dropping any pending debounce."""
+
+
+LANE_PRIORITY = "priority"
+LANE_BATCHED = "batched"
+
+
+class LaneLatency:
+    """End-to-end latency of one lane: first member event -> last write."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "propagations": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 1) if self.count else None,
+            "max_ms": round(self.max * 1000, 1),
+        }
+
+
+class PropagationEngine:
+    """Dirty-marks groups bottom-up and flushes them in tier order."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # Groups of these binary_sensor device_classes skip the debounce and
+        # the batched flush (see async_propagate_now).
+        self.priority_device_classes: frozenset[str] = frozenset(
+            DEFAULT_PRIORITY_DEVICE_CLASSES
+        )
+        # child entity_id -> nested groups listing it as a member.
+        self._parents: dict[str, set[PropagatingGroup]] = {}
+        self._dirty: set[PropagatingGroup] = set()
+        # Wall-clock time of the earliest member event behind this flush.
+        self._dirty_since: float | None = None
+        self._flushing: set[PropagatingGroup] = set()
+        self._flush_scheduled = False
+        # Diagnostics counters.
+        self.flushes = 0
+        self.recomputes = 0
+        self.latency = {LANE_PRIORITY: LaneLatency(), LANE_BATCHED: LaneLatency()}
+
+    @callback
+    def async_set_priority_device_classes(self, device_classes: Iterable[str]) -> None:
+        self.priority_device_classes = frozenset(device_classes)
+
+    @callback
+    def async_set_children(
+        self,
+        group: PropagatingGroup,
+        old_children: Iterable[str],
+        new_children: Iterable[str],
+    ) -> None:
+        """Record which entities a nested group is computed from."""
+        for entity_id in old_children:
+            parents = self._parents.get(entity_id)
+            if parents is not None:
+                parents.discard(group)
+                if not parents:
+                    del self._parents[entity_id]
+        for entity_id in new_children:
+            self._parents.setdefault(entity_id, set()).add(group)
+
+    def in_flush(self, group: PropagatingGroup) -> bool:
+        """Whether `group` is about to be recomputed by the running flush."""
+        return group in self._flushing
+
+    def _with_ancestors(
+        self, group: PropagatingGroup, seen: set[PropagatingGroup]
+    ) -> None:
+        pending = [group]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            pending.extend(self._parents.get(current.entity_id, ()))
+
+    @callback
+    def async_mark_dirty(
+        self, group: PropagatingGroup, since: float | None = None
+    ) -> None:
+        """
+        Queue `group` and every group above it for this tick's flush.
+        `since`: wall-clock time of the member event that started it all.
+        """
+        self._with_ancestors(group, self._dirty)
+        if since is not None and (
+            self._dirty_since is None or since < self._dirty_since
+        ):
+            self._dirty_since = since
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.hass.loop.call_soon(self._async_flush)
+
+    @callback
+    def async_propagate_now(
+        self, group: PropagatingGroup, since: float | None = None
+    ) -> None:
+        """
+        The priority lane: recompute `group` and every group above it right
+        now, inside the member event's own dispatch — ahead of every queued
+        debounce and batched flush, which stay as they are.
+        """
+        batch: set[PropagatingGroup] = set()
+        self._with_ancestors(group, batch)
+        self._async_run(batch, LANE_PRIORITY, since)
+
+    @callback
+    def _async_flush(self) -> None:
+        self._flush_scheduled = False
+        batch, self._dirty = self._dirty, set()
+        since, self._dirty_since = self._dirty_since, None
+        self._async_run(batch, LANE_BATCHED, since)
+
+    @callback
+    def _async_run(
+        self, groups: set[PropagatingGroup], lane: str, since: float | None
+    ) -> None:
+        batch = sorted(groups, key=lambda g: TIER_ORDER[g.group_scope[0]])
+        # A priority run may happen within another: only take out what this
+        # run put in, so ancestors the outer run still has to recompute stay
+        # in flush.
+        added = groups - self._flushing
+        self._flushing |= added
+        self.flushes += 1
+        try:
+            for group in batch:
+                self.recomputes += 1
+                try:
+                    group.async_flush_update()
+                except Exception:
+                    _LOGGER.exception("Error recomputing %s", group.entity_id)
+                if group in added:
+                    self._flushing.discard(group)
+        finally:
+            self._flushing -= added
+        if since is not None:
+            self.latency[lane].record(max(time.time() - since, 0.0))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "nested_children": len(self._parents),
+            "flushes": self.flushes,
+            "recomputes": self.recomputes,
+            "priority_device_classes": sorted(self.priority_device_classes),
+            "latency": {lane: stats.as_dict() for lane, stats in self.latency.items()},
+        }
+
+
+@callback
+def async_get_propagation_engine(hass: HomeAssistant) -> PropagationEngine:
+    """The shared engine; created on demand, like async_get_state_dispatcher."""
+    data = hass.data.setdefault(DOMAIN, {})
+    engine = data.get(DATA_PROPAGATION_ENGINE)
+    if engine is None:
+        engine = data[DATA_PROPAGATION_ENGINE] = PropagationEngine(hass)
+    return engine
+
+
+@callback
+def async_setup_propagation_engine(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> PropagationEngine:
+    """Create the entry's engine; dropped with the entry."""
+    engine = PropagationEngine(hass)
+    engine.async_set_priority_device_classes(priority_device_classes(entry.options))
+    hass.data.setdefault(DOMAIN, {})[DATA_PROPAGATION_ENGINE] = engine
+
+    @callback
+    def _drop_engine() -> None:
+        if hass.data.get(DOMAIN, {}).get(DATA_PROPAGATION_ENGINE) is engine:
+            hass.data[DOMAIN].pop(DATA_PROPAGATION_ENGINE)
+
+    entry.async_on_unload(_drop_engine)
+    return engine
+
+
+# What the AggregateFeed streams of each group or sensor: its value (the
+# state, or a sensor's native value) and these attributes, when present.
+AGGREGATE_ATTRIBUTES = ("active_count", "total", "icon", "color")
+
+AggregateChanges = dict[str, dict[str, Any] | None]
+
+
+def scope_matches(
+    group_scope: tuple[str, str | None], tier: str | None, scope_id: str | None
+) -> bool:
+    """Whether a group belongs to a subscription's scope (None: any)."""
+    return (tier is None or group_scope[0] == tier) and (
+        scope_id is None or group_scope[1] == scope_id
+    )
+
+
+class AggregateFeed:
+    """
+    Per-tick deltas of every group's aggregate fields, for the dashboards
+    subscribed to them (see module docstring).
+
+    Groups publish on each write (entity_group.SkipUnchangedWriteMixin);
+    the feed keeps their last fields only while someone is subscribed, and
+    collects what changed until the next tick. A removed group is sent as
+    None.
+    """
+
+    def __init__(self, hass: HomeAssistant, tick: float = DEBOUNCE_TICK_SECONDS):
+        self.hass = hass
+        self.tick = tick
+        self._subscribers: dict[
+            int, tuple[str | None, str | None, Callable[[AggregateChanges], None]]
+        ] = {}
+        self._next_id = 0
+        self._scopes: dict[str, tuple[str, str | None]] = {}
+        self._current: dict[str, dict[str, Any]] = {}
+        self._pending: AggregateChanges = {}
+        self._timer: asyncio.TimerHandle | None = None
+        # Diagnostics counters.
+        self.pushes = 0
+        self.fields_sent = 0
+        self.unchanged_writes = 0
+
+    @property
+    def active(self) -> bool:
+        return bool(self._subscribers)
+
+    @callback
+    def async_subscribe(
+        self,
+        send: Callable[[AggregateChanges], None],
+        snapshot: Iterable[tuple[str, tuple[str, str | None], dict[str, Any]]],
+        *,
+        tier: str | None = None,
+        scope_id: str | None = None,
+    ) -> CALLBACK_TYPE:
+        """
+        Send the scope's current fields (from `snapshot`), then its changes
+        every tick until the returned callback unsubscribes.
+        """
+        for entity_id, group_scope, fields in snapshot:
+            self._scopes[entity_id] = group_scope
+            self._current[entity_id] = fields
+        subscriber_id = self._next_id
+        self._next_id += 1
+        self._subscribers[subscriber_id] = (tier, scope_id, send)
+        send({
+            entity_id: dict(fields)
+            for entity_id, fields in self._current.items()
+            if scope_matches(self._scopes[entity_id], tier, scope_id)
+        })
+
+        @callback
+        def _unsubscribe() -> None:
+            self._subscribers.pop(subscriber_id, None)
+            if not self._subscribers:
+                # Nobody to diff for: stop tracking until the next subscribe.
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._scopes.clear()
+                self._current.clear()
+                self._pending.clear()
+
+        return _unsubscribe
+
+    @callback
+    def async_publish(
+        self,
+        entity_id: str,
+        group_scope: tuple[str, str | None],
+        fields: dict[str, Any],
+    ) -> None:
+        """Record a group's fields as written; queue whatever changed."""
+        if not self._subscribers:
+            return
+        last = self._current.get(entity_id)
+        if last is None:
+            changed = dict(fields)
+        else:
+            changed = {
+                key: value for key, value in fields.items() if last.get(key) != value
+            }
+            changed.update(dict.fromkeys(last.keys() - fields.keys()))
+        if not changed:
+            self.unchanged_writes += 1
+            return
+        self._scopes[entity_id] = group_scope
+        self._current[entity_id] = fields
+        pending = self._pending.get(entity_id)
+        if pending is None:
+            self._pending[entity_id] = changed
+        else:
+            pending.update(changed)
+        self._async_arm()
+
+    @callback
+    def async_remove(self, entity_id: str) -> None:
+        """Tell subscribers a group is gone."""
+        if self._current.pop(entity_id, None) is not None:
+            self._pending[entity_id] = None
+            self._async_arm()
+
+    @callback
+    def _async_arm(self) -> None:
+        if self._timer is None:
+            self._timer = self.hass.loop.call_later(self.tick, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        self._timer = None
+        pending, self._pending = self._pending, {}
+        for tier, scope_id, send in list(self._subscribers.values()):
+            changes = {
+                entity_id: delta
+                for entity_id, delta in pending.items()
+                if scope_matches(self._scopes[entity_id], tier, scope_id)
+            }
+            if changes:
+                send(changes)
+                self.pushes += 1
+                self.fields_sent += sum(len(delta or ()) for delta in changes.values())
+        for entity_id, delta in pending.items():
+            if delta is None and entity_id not in self._current:
+                self._scopes.pop(entity_id, None)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "subscribers": len(self._subscribers),
+            "groups": len(self._current),
+            "pushes": self.pushes,
+            "fields_sent": self.fields_sent,
+            "unchanged_writes": self.unchanged_writes,
+        }
+
+
+@callback
+def async_get_aggregate_feed(hass: HomeAssistant) -> AggregateFeed:
+    """
+    The shared feed. Not tied to a config entry: its subscriptions belong
+    to websocket connections, which end them (same as async_get_write_stats).
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    feed = data.get(DATA_AGGREGATE_FEED)
+    if feed is None:
+        feed = data[DATA_AGGREGATE_FEED] = AggregateFeed(hass)
+    return feed
@@ -14,18 +14,379 @@ cold-restart race condition this pattern exists to avoid.
 Used by:
 - binary_sensor.py (presence + per-device_class groups)
 - light.py, switch.py, fan.py, cover.py, siren.py (domain groups)
+
+Also holds the per-config-entry list of platform rebuild callbacks that
+__init__.py's options update listener runs to apply an exclusion change in
+place (async_register_options_callback / async_run_options_callbacks), and
+the per-config-entry RebuildScheduler every PlatformGroupManager hands its
+registry-triggered rebuilds to.
 """
 
+import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Collection, Iterable
 from typing import Any
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
 
+from .const import DOMAIN
+from .hierarchy import HierarchyBuilder, async_get_hierarchy_builder
+from .registry_index import async_get_registry_index
+
 _LOGGER = logging.getLogger(__name__)
 
+DATA_OPTIONS_CALLBACKS = "options_callbacks"
+DATA_REBUILD_SCHEDULERS = "rebuild_schedulers"
+
+# How long RebuildScheduler keeps gathering registry events before running
+# the rebuild they asked for. Long enough to swallow the burst a single
+# device move or bulk area edit produces, short enough to feel immediate.
+REBUILD_COALESCE_SECONDS = 0.5
+
+
+@callback
+def async_register_options_callback(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    options_callback: Callable[[], Awaitable[None]],
+) -> Callable[[], None]:
+    """
+    Register a platform's rebuild to run when the entry's exclusions change.
+
+    Returns the unregister function, for config_entry.async_on_unload().
+    """
+    callbacks: list[Callable[[], Awaitable[None]]] = (
+        hass.data
+        .setdefault(DOMAIN, {})
+        .setdefault(DATA_OPTIONS_CALLBACKS, {})
+        .setdefault(config_entry.entry_id, [])
+    )
+    callbacks.append(options_callback)
+
+    @callback
+    def _unregister() -> None:
+        if options_callback in callbacks:
+            callbacks.remove(options_callback)
+
+    return _unregister
+
+
+async def async_run_options_callbacks(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> None:
+    """
+    Run every registered platform rebuild for this entry, one at a time.
+
+    Each rebuild goes through its platform's idempotent factories, so
+    unchanged groups just get their (possibly unchanged) member list
+    re-applied, newly-excluded groups are removed and newly-included ones
+    added — no entity outside the affected set is torn down.
+
+    With the entry's RebuildScheduler set up, this runs as one of its
+    passes: never interleaved with a registry-triggered rebuild.
+    """
+    callbacks = (
+        hass.data
+        .get(DOMAIN, {})
+        .get(DATA_OPTIONS_CALLBACKS, {})
+        .get(config_entry.entry_id, [])
+    )
+
+    async def _run() -> None:
+        # One shared scan for every platform's rebuild (see hierarchy.py).
+        with async_get_hierarchy_builder(hass, config_entry).shared_pass():
+            for options_callback in list(callbacks):
+                await options_callback()
+
+    scheduler = async_get_rebuild_scheduler(hass, config_entry)
+    if scheduler is None:
+        await _run()
+    else:
+        await scheduler.async_run_exclusive(_run)
+
+
+def _is_area_move(event: Event) -> bool:
+    """Same filter the per-platform listeners always applied."""
+    if event.data.get("action") != "update":
+        return False
+    changes = event.data.get("changes", {})
+    return "area_id" in changes or "device_id" in changes
+
+
+class RebuildScheduler:
+    """
+    One rebuild queue per config entry, shared by every group platform.
+
+    Each PlatformGroupManager used to listen to entity_registry_updated
+    itself and fire its platform's full _rebuild for every matching event —
+    moving one device with 20 entities meant 20 rescans per platform. The
+    scheduler listens once instead (to registry_index.py's RegistryIndex,
+    which reports the areas each registry change moved entities out of and
+    into), and gathers requests for REBUILD_COALESCE_SECONDS before running
+    a single pass that rebuilds every platform asked for, one platform at a
+    time.
+
+    Each pending rebuild carries the union of the areas its requests
+    touched, and runs as a targeted rebuild of just those areas (see
+    entity_group.RebuildScope); a request without areas (startup) widens it
+    back to a full rebuild.
+
+    Single-flight: only one pass runs at a time. Requests arriving while a
+    pass runs are held for exactly one follow-up pass, started as soon as
+    the current one finishes — never a second concurrent one. An options
+    change's rebuild (async_run_options_callbacks) takes the same lock
+    through async_run_exclusive, so it runs between passes too.
+
+    Counters (exposed through diagnostics.py):
+    - requests: platform rebuilds asked for.
+    - coalesced: requests folded into a pending rebuild of the same platform
+      inside the open window.
+    - skipped: requests that arrived while a pass was running and the same
+      platform was already queued for the follow-up pass.
+    - passes / rebuilds: passes run, platform rebuilds actually executed
+      (targeted: how many of those were limited to some areas).
+    - exclusive_runs: options-change rebuilds run through
+      async_run_exclusive.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float = REBUILD_COALESCE_SECONDS,
+        hierarchy: HierarchyBuilder | None = None,
+    ) -> None:
+        self.hass = hass
+        self._window = window
+        self._hierarchy = hierarchy or HierarchyBuilder(hass)
+        # key -> (monitored domains, rebuild), in registration order.
+        self._platforms: dict[
+            str,
+            tuple[frozenset[str], Callable[[Collection[str] | None], Awaitable[None]]],
+        ] = {}
+        # key -> areas to rebuild (None: everything), waiting for the next pass.
+        self._pending: dict[str, set[str] | None] = {}
+        self._unsub_window: CALLBACK_TYPE | None = None
+        self._running = False
+        # Held by each pass and by async_run_exclusive.
+        self._lock = asyncio.Lock()
+        self._started = hass.is_running
+
+        self.requests = 0
+        self.coalesced = 0
+        self.skipped = 0
+        self.passes = 0
+        self.rebuilds = 0
+        self.targeted = 0
+        self.exclusive_runs = 0
+
+    @callback
+    def async_register(
+        self,
+        key: str,
+        monitored_domains: Iterable[str],
+        rebuild: Callable[[Collection[str] | None], Awaitable[None]],
+    ) -> Callable[[], None]:
+        """
+        Register a platform's rebuild, called with the areas to rebuild (or
+        None for everything); returns the unregister function.
+        """
+        self._platforms[key] = (frozenset(monitored_domains), rebuild)
+
+        @callback
+        def _unregister() -> None:
+            self._platforms.pop(key, None)
+            self._pending.pop(key, None)
+
+        return _unregister
+
+    @callback
+    def async_listen(self) -> list[Callable[[], None]]:
+        """Subscribe to the registry index's area changes."""
+        unsubs = [
+            async_get_registry_index(self.hass).async_add_listener(
+                self._async_areas_changed
+            )
+        ]
+        if not self._started:
+
+            @callback
+            def _ha_started(_event: Event) -> None:
+                self._started = True
+
+            unsubs.append(
+                self.hass.bus.async_listen_once(
+                    EVENT_HOMEASSISTANT_STARTED, _ha_started
+                )
+            )
+        return unsubs
+
+    @callback
+    def async_cancel(self) -> None:
+        if self._unsub_window:
+            self._unsub_window()
+            self._unsub_window = None
+        self._pending.clear()
+
+    @callback
+    def async_request(
+        self,
+        keys: Iterable[str] | None = None,
+        area_ids: Collection[str] | None = None,
+    ) -> None:
+        """
+        Ask for a rebuild of `keys` (every registered platform if None),
+        limited to `area_ids` when given.
+        """
+        for key in list(self._platforms) if keys is None else keys:
+            if key not in self._platforms:
+                continue
+            self.requests += 1
+            if key in self._pending:
+                if self._running:
+                    self.skipped += 1
+                else:
+                    self.coalesced += 1
+                pending_areas = self._pending[key]
+                if pending_areas is not None:
+                    if area_ids is None:
+                        self._pending[key] = None
+                    else:
+                        pending_areas.update(area_ids)
+                continue
+            self._pending[key] = None if area_ids is None else set(area_ids)
+
+        # While a pass runs, _async_run picks pending keys up as its one
+        # queued follow-up pass; otherwise open the gathering window.
+        if self._pending and not self._running and self._unsub_window is None:
+            self._unsub_window = async_call_later(
+                self.hass, self._window, self._async_window_closed
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "platforms": list(self._platforms),
+            "pending": {
+                key: None if areas is None else sorted(areas)
+                for key, areas in self._pending.items()
+            },
+            "running": self._running,
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "skipped": self.skipped,
+            "passes": self.passes,
+            "rebuilds": self.rebuilds,
+            "targeted": self.targeted,
+            "exclusive_runs": self.exclusive_runs,
+        }
+
+    async def async_run_exclusive(self, rebuild: Callable[[], Awaitable[None]]) -> None:
+        """Run `rebuild` once no pass is running, holding passes off meanwhile."""
+        async with self._lock:
+            self.exclusive_runs += 1
+            await rebuild()
+
+    @callback
+    def _async_window_closed(self, _now=None) -> None:
+        self._unsub_window = None
+        if self._pending and not self._running:
+            self._running = True
+            self.hass.async_create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        try:
+            while self._pending:
+                batch = dict(self._pending)
+                self._pending.clear()
+                self.passes += 1
+                # Every platform of the batch builds from one shared scan
+                # covering all the batch's areas (see hierarchy.py).
+                pass_area_ids = (
+                    None
+                    if any(area_ids is None for area_ids in batch.values())
+                    else set().union(*batch.values())
+                )
+                async with self._lock:
+                    await self._async_run_batch(batch, pass_area_ids)
+        finally:
+            self._running = False
+        _LOGGER.debug(
+            "RebuildScheduler: pass %d done (%d coalesced, %d skipped so far)",
+            self.passes,
+            self.coalesced,
+            self.skipped,
+        )
+
+    async def _async_run_batch(
+        self,
+        batch: dict[str, set[str] | None],
+        pass_area_ids: Collection[str] | None,
+    ) -> None:
+        with self._hierarchy.shared_pass(pass_area_ids):
+            for key, area_ids in batch.items():
+                platform = self._platforms.get(key)
+                if platform is None:
+                    continue
+                try:
+                    await platform[1](area_ids)
+                except Exception:
+                    _LOGGER.exception("RebuildScheduler: %s rebuild failed", key)
+                self.rebuilds += 1
+                if area_ids is not None:
+                    self.targeted += 1
+
+    @callback
+    def _async_areas_changed(self, domain: str, area_ids: frozenset[str]) -> None:
+        if not self._started:
+            return
+        self.async_request(
+            (
+                key
+                for key, (domains, _rebuild) in self._platforms.items()
+                if domain in domains
+            ),
+            area_ids,
+        )
+
+
+@callback
+def async_setup_rebuild_scheduler(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> RebuildScheduler:
+    """Create this entry's scheduler; torn down with the entry."""
+    scheduler = RebuildScheduler(
+        hass, hierarchy=async_get_hierarchy_builder(hass, config_entry)
+    )
+    schedulers = hass.data.setdefault(DOMAIN, {}).setdefault(
+        DATA_REBUILD_SCHEDULERS, {}
+    )
+    schedulers[config_entry.entry_id] = scheduler
+    for unsub in scheduler.async_listen():
+        config_entry.async_on_unload(unsub)
+
+    @callback
+    def _drop_scheduler() -> None:
+        scheduler.async_cancel()
+        if schedulers.get(config_entry.entry_id) is scheduler:
+            del schedulers[config_entry.entry_id]
+
+    config_entry.async_on_unload(_drop_scheduler)
+    return scheduler
+
+
+@callback
+def async_get_rebuild_scheduler(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> RebuildScheduler | None:
+    return (
+        hass.data
+        .get(DOMAIN, {})
+        .get(DATA_REBUILD_SCHEDULERS, {})
+        .get(config_entry.entry_id)
+    )
+
 
 class GroupManager:
     """
@@ -206,6 +567,7 @@ class PlatformGroupManager:
         hass: HomeAssistant,
         monitored_domains: list[str],
         startup_delay: float = 2.0,
+        config_entry: ConfigEntry | None = None,
     ) -> None:
         """
         Initialize the platform-level refresh manager.
@@ -214,10 +576,13 @@ class PlatformGroupManager:
             hass: Home Assistant instance
             monitored_domains: List of entity domains to monitor
             startup_delay: Seconds to wait after HA startup
+            config_entry: Entry whose options changes should also trigger
+                options_callback (see register_callbacks)
         """
         self.hass = hass
         self._monitored_domains = monitored_domains
         self._startup_delay = startup_delay
+        self._config_entry = config_entry
 
         # Startup state
         self._startup_complete = hass.is_running
@@ -225,23 +590,34 @@ class PlatformGroupManager:
         # Callbacks registered by platform
         self._startup_callback: Callable[[], Awaitable[None]] | None = None
         self._update_callback: (
-            Callable[[str, dict[str, Any]], Awaitable[None]] | None
+            Callable[[Collection[str] | None], Awaitable[None]] | None
         ) = None
+        self._options_callback: Callable[[], Awaitable[None]] | None = None
 
     def register_callbacks(
         self,
         startup_callback: Callable[[], Awaitable[None]],
-        update_callback: Callable[[str, dict[str, Any]], Awaitable[None]],
+        update_callback: Callable[[Collection[str] | None], Awaitable[None]],
+        options_callback: Callable[[], Awaitable[None]] | None = None,
     ) -> None:
         """
         Register callbacks for startup and updates.
 
         Args:
             startup_callback: Called after HA startup + delay
-            update_callback: Called when entity area changes (entity_id, changes)
+            update_callback: Called when entity areas change, with the
+                area_ids to rebuild (None when they aren't known: all)
+            options_callback: Called when the config entry's exclusion
+                options change (requires config_entry in the constructor)
+
+        With a config_entry whose RebuildScheduler is set up, startup and
+        registry-triggered refreshes go through the scheduler instead, which
+        runs update_callback once per coalesced burst, with the union of
+        the areas the burst touched.
         """
         self._startup_callback = startup_callback
         self._update_callback = update_callback
+        self._options_callback = options_callback
 
     def setup_listeners(self) -> tuple[Callable[[], None], ...]:
         """
@@ -251,6 +627,24 @@ class PlatformGroupManager:
             Tuple of unsubscribe functions to register with entry.async_on_unload()
         """
         unsubs = []
+        scheduler = (
+            async_get_rebuild_scheduler(self.hass, self._config_entry)
+            if self._config_entry is not None
+            else None
+        )
+        scheduler_key = "+".join(self._monitored_domains)
+        if self._config_entry is not None and self._options_callback:
+            unsubs.append(
+                async_register_options_callback(
+                    self.hass, self._config_entry, self._options_callback
+                )
+            )
+        if scheduler is not None and self._update_callback:
+            unsubs.append(
+                scheduler.async_register(
+                    scheduler_key, self._monitored_domains, self._update_callback
+                )
+            )
 
         # Startup handler
         if not self._startup_complete:
@@ -266,7 +660,11 @@ class PlatformGroupManager:
                 async def _delayed_refresh(_now):
                     """Execute refresh after delay."""
                     self._startup_complete = True
-                    if self._startup_callback:
+                    if scheduler is not None:
+                        # Every platform asks at about the same moment —
+                        # one coalesced pass rebuilds them all.
+                        scheduler.async_request([scheduler_key])
+                    elif self._startup_callback:
                         await self._startup_callback()
 
                 async_call_later(self.hass, self._startup_delay, _delayed_refresh)
@@ -279,6 +677,10 @@ class PlatformGroupManager:
         else:
             _LOGGER.debug("PlatformGroupManager: HA already running")
 
+        if scheduler is not None:
+            # Registry events are the scheduler's to listen to.
+            return tuple(unsubs)
+
         # Entity registry listener
         @callback
         def _entity_registry_updated(event: Event) -> None:
@@ -287,19 +689,13 @@ class PlatformGroupManager:
             if not self._startup_complete:
                 return
 
-            action = event.data.get("action")
-            if action != "update":
+            if not _is_area_move(event):
                 return
 
             entity_id = event.data.get("entity_id")
             if not entity_id:
                 return
 
-            # Check if area-related field changed
-            changes = event.data.get("changes", {})
-            if "area_id" not in changes and "device_id" not in changes:
-                return
-
             # Check if monitored domain
             domain = entity_id.split(".")[0]
             if domain not in self._monitored_domains:
@@ -311,8 +707,8 @@ class PlatformGroupManager:
                     "PlatformGroupManager: Entity %s area changed",
                     entity_id,
                 )
-                # Ensure we create a coroutine for async_create_task
-                coro = self._update_callback(entity_id, changes)
+                # The event only carries the old area; rebuild everything.
+                coro = self._update_callback(None)
                 self.hass.async_create_task(coro)  # type: ignore[arg-type]
 
         unsubs.append(
@@ -0,0 +1,200 @@
+"""
+Pure planning stage of the nested area/floor/global group hierarchy.
+
+entity_group.py's builders used to scan, nest, construct entities, place
+their devices and schedule member updates in one interleaved pass, so a
+rebuild could only be evaluated by running it. Here the hierarchy is
+computed first as plain data — a GroupPlan of (unique_id, scope, members)
+with upper tiers referring to their child groups by unique_id — from an
+already-scanned member slice and the TopologyCache, with no hass entity
+machinery involved: no entities, no device registry, no tasks.
+entity_group.apply_group_plan then diffs the plan against a platform's live
+groups and only touches what changed.
+
+Targeted rebuilds (see RebuildScope) plan just the tiers in scope; children
+out of scope are nested by unique_id when the platform already has them
+(`existing_ids`).
+"""
+
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, field
+
+from homeassistant.core import HomeAssistant
+
+from .registry_index import async_get_topology
+from .topology import TopologyCache
+
+# Where a nested group sits: ("area", area_id), ("floor", floor_id) or
+# ("global", None). Set on every group by the builders below.
+GroupScope = tuple[str, str | None]
+GLOBAL_SCOPE: GroupScope = ("global", None)
+
+
+@dataclass(frozen=True, slots=True)
+class RebuildScope:
+    """
+    What a targeted rebuild recomputes: the groups of these areas, of their
+    floors, and the global groups (see entity_group.py's module docstring).
+    """
+
+    area_ids: frozenset[str]
+    floor_ids: frozenset[str]
+
+    @classmethod
+    def for_areas(
+        cls, hass: HomeAssistant, area_ids: Iterable[str]
+    ) -> "RebuildScope | None":
+        """
+        Scope for the areas a registry change touched; None (rebuild
+        everything) for an area the topology no longer knows — its old
+        floor can't be resolved to recompute.
+        """
+        topology = async_get_topology(hass)
+        areas = frozenset(area_ids)
+        if not all(topology.area_exists(area_id) for area_id in areas):
+            return None
+        return cls(
+            area_ids=areas,
+            floor_ids=frozenset(
+                floor_id
+                for area_id in areas
+                if (floor_id := topology.area_floor_id(area_id))
+            ),
+        )
+
+    def covers(self, group_scope: GroupScope) -> bool:
+        tier, scope_id = group_scope
+        if tier == "area":
+            return scope_id in self.area_ids
+        if tier == "floor":
+            return scope_id in self.floor_ids
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedGroup:
+    """One group the hierarchy should contain."""
+
+    unique_id: str
+    scope: GroupScope
+    # Area or floor name (translation placeholder, device name); None for
+    # the global group.
+    name: str | None
+    # Raw member entity_ids at area scope; the child groups' unique_ids at
+    # floor and global scope.
+    members: tuple[str, ...]
+    # Set for the per-device_class hierarchies, None for flat ones.
+    device_class: str | None = None
+
+    @property
+    def nested(self) -> bool:
+        return self.scope[0] != "area"
+
+
+@dataclass(slots=True)
+class GroupPlan:
+    """Every group one platform build should contain, children first."""
+
+    groups: list[PlannedGroup] = field(default_factory=list)
+
+    def unique_ids(self) -> set[str]:
+        return {group.unique_id for group in self.groups}
+
+
+def plan_nested_groups(
+    topology: TopologyCache,
+    *,
+    unique_id_prefix: str,
+    area_entities: Mapping[str, list[str]],
+    area_names: Mapping[str, str],
+    floor_areas: Mapping[str, list[str]],
+    excluded_floor_ids: Collection[str] = (),
+    scope: RebuildScope | None = None,
+    existing_ids: Collection[str] = (),
+    device_class: str | None = None,
+) -> list[PlannedGroup]:
+    """
+    One area group per area with members (`area_entities`), one floor group
+    per floor over its area groups, one global group over the floor groups.
+    Unique ids follow `{unique_id_prefix}_area_/_floor_/_global`.
+
+    Without a scope, floors come from `floor_areas` (the full scan's). With
+    one, only the scope's floors are planned, over every area on them:
+    the freshly planned area groups for areas in scope, the existing ones
+    (`existing_ids`) for the rest. The global group likewise nests the
+    existing groups of floors out of scope. `device_class` is stamped on
+    every planned group.
+    """
+    planned: list[PlannedGroup] = []
+    area_group_ids: dict[str, str] = {}
+    for area_id, member_ids in area_entities.items():
+        # A shared scan (hierarchy.py) can cover more areas than the scope.
+        if not member_ids or (scope is not None and area_id not in scope.area_ids):
+            continue
+        unique_id = f"{unique_id_prefix}_area_{area_id}"
+        planned.append(
+            PlannedGroup(
+                unique_id=unique_id,
+                scope=("area", area_id),
+                name=area_names[area_id],
+                members=tuple(member_ids),
+                device_class=device_class,
+            )
+        )
+        area_group_ids[area_id] = unique_id
+
+    if scope is None:
+        floors = list(floor_areas.items())
+    else:
+        floors = [
+            (floor_id, topology.areas_on_floor(floor_id))
+            for floor_id in topology.floor_ids()
+            if floor_id in scope.floor_ids and floor_id not in excluded_floor_ids
+        ]
+
+    floor_group_ids: dict[str, str] = {}
+    for floor_id, areas_on_floor in floors:
+        children: list[str] = []
+        for area_id in areas_on_floor:
+            if area_id in area_group_ids:
+                children.append(area_group_ids[area_id])
+            elif scope is not None and area_id not in scope.area_ids:
+                unique_id = f"{unique_id_prefix}_area_{area_id}"
+                if unique_id in existing_ids:
+                    children.append(unique_id)
+        if not children:
+            continue
+        unique_id = f"{unique_id_prefix}_floor_{floor_id}"
+        planned.append(
+            PlannedGroup(
+                unique_id=unique_id,
+                scope=("floor", floor_id),
+                name=topology.floor_name(floor_id) or floor_id,
+                members=tuple(children),
+                device_class=device_class,
+            )
+        )
+        floor_group_ids[floor_id] = unique_id
+
+    global_children = list(floor_group_ids.values())
+    if scope is not None:
+        global_children = []
+        for floor_id in topology.floor_ids():
+            if floor_id in floor_group_ids:
+                global_children.append(floor_group_ids[floor_id])
+            elif floor_id not in scope.floor_ids:
+                unique_id = f"{unique_id_prefix}_floor_{floor_id}"
+                if unique_id in existing_ids:
+                    global_children.append(unique_id)
+
+    if global_children:
+        planned.append(
+            PlannedGroup(
+                unique_id=f"{unique_id_prefix}_global",
+                scope=GLOBAL_SCOPE,
+                name=None,
+                members=tuple(global_children),
+                device_class=device_class,
+            )
+        )
+    return planned
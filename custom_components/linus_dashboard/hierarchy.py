@@ -0,0 +1,149 @@
+"""
+One shared area/floor/global membership scan per build pass, for every platform.
+
+Each group platform (light, switch, fan, cover, siren, climate,
+media_player, binary_sensor, and sensor's numeric aggregates) used to scan
+its own domains for its own hierarchy, so a setup or a full rebuild walked
+the index once per platform. The HierarchyBuilder scans every domain and
+device_class once per pass — entry setup, an options change, one
+RebuildScheduler pass — and every platform reads its own slice of that
+single MemberBuckets, then plans and applies its hierarchy from it with
+its own entity factory (see group_plan.py / entity_group.apply_group_plan).
+
+Outside a pass (a lone rebuild) it simply scans what was asked for.
+"""
+
+import logging
+from collections.abc import Collection, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .entity_group import ExclusionConfig, MemberBuckets, scan_all_buckets
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_HIERARCHY_BUILDERS = "hierarchy_builders"
+
+
+class HierarchyBuilder:
+    """Per entry: the member scan every platform build of a pass shares."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._depth = 0
+        # Areas the current pass covers; None means every area.
+        self._pass_area_ids: frozenset[str] | None = None
+        self._shared: MemberBuckets | None = None
+        self._shared_exclusions: ExclusionConfig | None = None
+        self._shared_area_ids: frozenset[str] | None = None
+        # Diagnostics counters.
+        self.passes = 0
+        self.scans = 0
+        self.reused = 0
+
+    @contextmanager
+    def shared_pass(
+        self, area_ids: Collection[str] | None = None
+    ) -> Iterator["HierarchyBuilder"]:
+        """
+        Share one scan between every build inside the block. `area_ids`:
+        the areas a targeted pass may ask for, so one scan covers them all.
+        Nested blocks join the outer pass.
+        """
+        if self._depth == 0:
+            self.passes += 1
+            self._pass_area_ids = None if area_ids is None else frozenset(area_ids)
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                _LOGGER.debug(
+                    "Hierarchy pass %d done (%d scans, %d reused so far)",
+                    self.passes,
+                    self.scans,
+                    self.reused,
+                )
+                self._shared = None
+                self._shared_exclusions = None
+
+    def buckets(
+        self,
+        exclusions: ExclusionConfig,
+        *,
+        domains: Iterable[str],
+        area_ids: Collection[str] | None = None,
+    ) -> MemberBuckets:
+        """
+        The scan a platform build reads its slices from. Inside a pass this
+        is every domain of the pass' areas (or a superset of `area_ids`):
+        callers must only read their own domains, and a targeted build
+        must ignore areas outside its scope (plan_nested_groups does).
+        """
+        if self._depth == 0:
+            self.scans += 1
+            return scan_all_buckets(
+                self.hass, exclusions, domains=domains, area_ids=area_ids
+            )
+
+        wanted = None if area_ids is None else frozenset(area_ids)
+        if (
+            self._shared is not None
+            and self._shared_exclusions == exclusions
+            and (
+                self._shared_area_ids is None
+                or (wanted is not None and wanted <= self._shared_area_ids)
+            )
+        ):
+            self.reused += 1
+            return self._shared
+
+        if wanted is None or self._pass_area_ids is None:
+            scan_area_ids = None
+        else:
+            scan_area_ids = self._pass_area_ids | wanted
+        self.scans += 1
+        self._shared = scan_all_buckets(self.hass, exclusions, area_ids=scan_area_ids)
+        self._shared_exclusions = exclusions
+        self._shared_area_ids = scan_area_ids
+        return self._shared
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"passes": self.passes, "scans": self.scans, "reused": self.reused}
+
+
+@callback
+def async_setup_hierarchy_builder(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> HierarchyBuilder:
+    """Create this entry's builder; dropped with the entry."""
+    builder = HierarchyBuilder(hass)
+    builders = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_HIERARCHY_BUILDERS, {})
+    builders[config_entry.entry_id] = builder
+
+    @callback
+    def _drop_builder() -> None:
+        if builders.get(config_entry.entry_id) is builder:
+            del builders[config_entry.entry_id]
+
+    config_entry.async_on_unload(_drop_builder)
+    return builder
+
+
+@callback
+def async_get_hierarchy_builder(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> HierarchyBuilder:
+    """Return this entry's builder, or a throwaway pass-less one if it has none."""
+    builder = (
+        hass.data
+        .get(DOMAIN, {})
+        .get(DATA_HIERARCHY_BUILDERS, {})
+        .get(config_entry.entry_id)
+    )
+    return builder if builder is not None else HierarchyBuilder(hass)
@@ -22,6 +22,8 @@ hierarchy scanning/debounced-subscription plumbing every platform uses.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 from typing import Any
 
 from homeassistant.components.group.light import LightGroup as HALightGroup
@@ -40,12 +42,18 @@ from homeassistant.components.light import (
     LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON, STATE_UNAVAILABLE
+from homeassistant.const import STATE_ON
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity_group import ExclusionConfig, NestedGroupMixin, build_nested_domain_groups
+from .entity_group import (
+    ExclusionConfig,
+    NestedGroupMixin,
+    RebuildScope,
+    async_rebuild_groups,
+    build_nested_domain_groups,
+)
 from .group_manager import PlatformGroupManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -102,12 +110,7 @@ class LightGroup(NestedGroupMixin, HALightGroup):
     def _recompute(self) -> None:
         self._sync_ha_group_state(domain="light")
 
-        states = [
-            state
-            for entity_id in self._member_entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-            and state.state != STATE_UNAVAILABLE
-        ]
+        states = self._member_state_cache().available()
 
         # Narrower than HA's own union-based supported_features: a feature
         # this group exposes must actually work on every member, not just
@@ -243,14 +246,16 @@ def _make_light_group(
 ) -> LightGroup:
     """
     Idempotent factory: reuse the existing entity for this unique_id (and
-    schedule a member-list update on it) instead of constructing a duplicate.
+    hand it the new member list — a no-op when the member set is unchanged,
+    see NestedGroupMixin.async_set_members) instead of constructing a
+    duplicate.
     This is what lets `_rebuild` tell genuinely new groups (need
     async_add_entities) apart from ones that already exist (just need their
     member list refreshed in place).
     """
     existing = _LIGHT_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
 
     group = LightGroup(
@@ -274,7 +279,7 @@ async def async_setup_entry(
     exclusions = ExclusionConfig.from_config_entry(config_entry)
 
     # Module-level registry can hold stale entries from a previous load of
-    # this config entry (reload after an options change) — those entities
+    # this config entry (a manual reload) — those entities
     # were already torn down by HA, so start from a clean slate here rather
     # than in _rebuild.
     _LIGHT_GROUPS.clear()
@@ -294,40 +299,41 @@ async def async_setup_entry(
         async_add_entities(entities)
         _LOGGER.info("Created %d light group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        before_ids = set(_LIGHT_GROUPS.keys())
-
-        new_groups = await build_nested_domain_groups(
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        # Re-read every time: an options change is applied by re-running
+        # this (see group_manager.async_run_options_callbacks), not a reload.
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        # Only the areas a registry change touched, when the scheduler
+        # knows them (see entity_group.RebuildScope); everything otherwise.
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
             hass,
             config_entry,
-            exclusions,
-            domain="light",
-            unique_id_prefix=f"{DOMAIN}_all_lights",
-            translation_key="area_lights",
-            translation_key_global="area_lights_global",
-            entity_factory=_make_light_group,
+            async_add_entities,
+            (_LIGHT_GROUPS,),
+            partial(
+                build_nested_domain_groups,
+                hass,
+                config_entry,
+                exclusions,
+                domain="light",
+                unique_id_prefix=f"{DOMAIN}_all_lights",
+                translation_key="area_lights",
+                translation_key_global="area_lights_global",
+                entity_factory=_make_light_group,
+                scope=scope,
+                existing=_LIGHT_GROUPS,
+            ),
+            scope=scope,
         )
 
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
-
-        for uid in before_ids - after_ids:
-            stale = _LIGHT_GROUPS.pop(uid)
-            hass.async_create_task(stale.async_remove(force_remove=True))
-
-        if to_add:
-            async_add_entities(to_add)
-            # Entities created after initial setup (new area, entity moved
-            # in, ...) bypass the one-shot hide pass in async_setup_entry —
-            # without this they'd be exposed to voice assistants by default
-            # even with the option enabled.
-            from . import async_hide_group_entities_from_voice_assistants
-
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
-
-    platform_manager = PlatformGroupManager(hass, monitored_domains=["light"])
+    platform_manager = PlatformGroupManager(
+        hass, monitored_domains=["light"], config_entry=config_entry
+    )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
@@ -16,6 +16,8 @@ reasoning.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 
 from homeassistant.components.group.util import reduce_attribute
 from homeassistant.components.media_player import (
@@ -24,7 +26,6 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -33,12 +34,14 @@ from .const import DOMAIN
 from .entity_group import (
     ExclusionConfig,
     NestedGroupMixin,
+    RebuildScope,
+    async_rebuild_groups,
     build_nested_device_class_groups,
     build_nested_domain_groups,
-    compute_group_attributes,
     mean_float,
 )
 from .group_manager import PlatformGroupManager
+from .hierarchy import async_get_hierarchy_builder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,12 +104,7 @@ class MediaPlayerGroup(NestedGroupMixin, MediaPlayerEntity):
         )
 
     def _recompute(self) -> None:
-        states = [
-            state
-            for entity_id in self._member_entity_ids
-            if (state := self.hass.states.get(entity_id)) is not None
-            and state.state != STATE_UNAVAILABLE
-        ]
+        states = self._member_state_cache().available()
         # Not a group.util helper — those reduce *attributes*, and this is
         # the state itself, same reasoning as climate.py's hvac_mode.
         active_states = [
@@ -126,11 +124,8 @@ class MediaPlayerGroup(NestedGroupMixin, MediaPlayerEntity):
         else:
             self._attr_state = MediaPlayerState.IDLE
 
-        attrs = compute_group_attributes(
-            self.hass,
-            domain="media_player",
-            device_class=self.device_class,
-            member_entity_ids=self._member_entity_ids,
+        attrs = self._group_attributes(
+            domain="media_player", device_class=self.device_class
         )
         self._attr_extra_state_attributes = attrs
 
@@ -186,7 +181,7 @@ def _make_media_player_group(
     """
     existing = _MEDIA_PLAYER_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
 
     group = MediaPlayerGroup(
@@ -203,9 +198,18 @@ def _make_media_player_group(
 
 
 async def _build_all_media_player_groups(
-    hass: HomeAssistant, config_entry: ConfigEntry, exclusions: ExclusionConfig
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    exclusions: ExclusionConfig,
+    scope: RebuildScope | None = None,
 ) -> list[MediaPlayerGroup]:
     """Flat 'all media players' groups plus one set per device_class present (tv, speaker, receiver)."""
+    # One scan serves both the flat and the per-device_class groups.
+    buckets = async_get_hierarchy_builder(hass, config_entry).buckets(
+        exclusions,
+        domains=("media_player",),
+        area_ids=scope.area_ids if scope else None,
+    )
     entities: list[MediaPlayerGroup] = []
     entities.extend(
         await build_nested_domain_groups(
@@ -216,7 +220,10 @@ async def _build_all_media_player_groups(
             unique_id_prefix=f"{DOMAIN}_all_media_players",
             translation_key="media_player_group",
             translation_key_global="media_player_group_global",
+            buckets=buckets,
             entity_factory=_make_media_player_group,
+            scope=scope,
+            existing=_MEDIA_PLAYER_GROUPS,
         )
     )
     entities.extend(
@@ -226,7 +233,10 @@ async def _build_all_media_player_groups(
             exclusions,
             domain="media_player",
             unique_id_prefix=DOMAIN,
+            buckets=buckets,
             entity_factory=_make_media_player_group,
+            scope=scope,
+            existing=_MEDIA_PLAYER_GROUPS,
         )
     )
     return entities
@@ -246,27 +256,28 @@ async def async_setup_entry(
         async_add_entities(entities)
         _LOGGER.info("Created %d media_player group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        before_ids = set(_MEDIA_PLAYER_GROUPS.keys())
-        new_groups = await _build_all_media_player_groups(
-            hass, config_entry, exclusions
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        # See light.py's _rebuild for the scope.
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
+            hass,
+            config_entry,
+            async_add_entities,
+            (_MEDIA_PLAYER_GROUPS,),
+            partial(
+                _build_all_media_player_groups, hass, config_entry, exclusions, scope
+            ),
+            scope=scope,
         )
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
-
-        for uid in before_ids - after_ids:
-            stale = _MEDIA_PLAYER_GROUPS.pop(uid)
-            hass.async_create_task(stale.async_remove(force_remove=True))
-
-        if to_add:
-            async_add_entities(to_add)
-            from . import async_hide_group_entities_from_voice_assistants
 
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
-
-    platform_manager = PlatformGroupManager(hass, monitored_domains=["media_player"])
+    platform_manager = PlatformGroupManager(
+        hass, monitored_domains=["media_player"], config_entry=config_entry
+    )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
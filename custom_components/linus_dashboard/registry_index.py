@@ -0,0 +1,357 @@
+"""
+Incrementally maintained index over the entity/device/area/floor registries.
+
+Every group platform used to walk all of entity_registry.entities once per
+(domain, device_class) scan — a single binary_sensor rebuild alone did a
+full discover_device_classes pass, four presence scans and one scan per
+device_class, then cover, media_player, numeric sensors and health sensors
+repeated the same thing. On a multi-thousand-entity install that's dozens
+of full registry passes per rebuild, all to answer the same question: which
+entities of domain X (device_class Y) sit in which area.
+
+RegistryIndex answers that question directly:
+domain -> device_class -> area_id -> entity_ids, with device/area/floor
+facts held in the TopologyCache it owns (topology.py).
+It's built once per config entry (async_setup_registry_index, called from
+async_setup_entry before platforms are forwarded) and then kept current
+from the four *_registry_updated events — never rebuilt from scratch.
+
+Only registry-level facts live here. Anything that depends on the live
+state machine (does the entity have a state yet, is it a foreign group)
+or on the user's exclusion options is still checked by the caller at query
+time — those change far more often than registry entries do, and the
+index only ever hands back the per-domain candidates, not the whole
+registry, so those checks stay cheap.
+
+device_class is read from the registry (device_class, else
+original_device_class) — the same value HA itself writes into the state's
+device_class attribute, but available before the entity's first state
+lands, so a cold boot can't race bucket assignment (same reasoning as
+sensor.py's _build_aggregate_sensors).
+"""
+
+import logging
+from collections.abc import Callable, Collection, Iterator
+from dataclasses import dataclass
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+)
+from homeassistant.helpers import (
+    device_registry as dr,
+)
+from homeassistant.helpers import (
+    entity_registry as er,
+)
+from homeassistant.helpers import (
+    floor_registry as fr,
+)
+
+from .const import DOMAIN
+from .topology import TopologyCache
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_REGISTRY_INDEX = "registry_index"
+
+# listener(domain, area_ids): an entity of `domain` left, joined or changed
+# device_class within these areas (old and new, None dropped).
+BucketListener = Callable[[str, frozenset[str]], None]
+
+
+@dataclass(slots=True)
+class IndexedEntity:
+    """The registry facts about one entity that scans filter on."""
+
+    entity_id: str
+    domain: str
+    device_class: str | None
+    device_id: str | None
+    platform: str | None
+    # Resolved area: the entity's own, else its device's. None if neither.
+    area_id: str | None
+
+
+class RegistryIndex:
+    """
+    domain -> device_class -> area_id -> entity_ids.
+
+    Buckets are insertion-ordered dicts used as ordered sets, so members come
+    back in registry order — the same order the full-registry scans this
+    replaces produced. Entities created by this integration itself, and
+    hidden or disabled entities, are never indexed (see entity_group.py's
+    self-exclusion note); everything else is, including entities with no
+    area, so a later device/area move can place them without a rescan.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._entities: dict[str, IndexedEntity] = {}
+        self._buckets: dict[str, dict[str | None, dict[str, dict[str, None]]]] = {}
+        # device_id -> entity_ids attached to that device (whatever their
+        # own area), so a device area change only revisits its own entities.
+        self._device_entities: dict[str, dict[str, None]] = {}
+        # Device areas, area floors/names: see topology.py.
+        self.topology = TopologyCache(hass)
+        self._listeners: list[BucketListener] = []
+
+    @callback
+    def async_build(self) -> None:
+        """Full build from the current registries — once, at setup."""
+        self._entities.clear()
+        self._buckets.clear()
+        self._device_entities.clear()
+        self.topology.async_build()
+        for entity_entry in er.async_get(self.hass).entities.values():
+            self._add_entry(entity_entry)
+        _LOGGER.debug("Registry index built: %d entities", len(self._entities))
+
+    @callback
+    def async_listen(self) -> list[Callable[[], None]]:
+        """Subscribe to the four registry-updated events; returns unsubscribes."""
+        bus = self.hass.bus
+        return [
+            bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+            ),
+            bus.async_listen(
+                dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+            ),
+            bus.async_listen(
+                ar.EVENT_AREA_REGISTRY_UPDATED, self._async_area_registry_updated
+            ),
+            bus.async_listen(
+                fr.EVENT_FLOOR_REGISTRY_UPDATED, self._async_floor_registry_updated
+            ),
+        ]
+
+    @callback
+    def async_add_listener(self, listener: BucketListener) -> Callable[[], None]:
+        """
+        Be told which areas an incremental update touched, once the index
+        already reflects it — what a targeted rebuild needs, since the old
+        area is gone from the index by the time any registry event listener
+        registered after it could ask.
+        """
+        self._listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove_listener
+
+    # --- queries -----------------------------------------------------------
+
+    def get(self, entity_id: str) -> IndexedEntity | None:
+        """Indexed registry facts for one entity, if it's indexed at all."""
+        return self._entities.get(entity_id)
+
+    def device_classes(self, domain: str) -> set[str]:
+        """Every device_class with at least one placed entity of `domain`."""
+        return {
+            device_class
+            for device_class, areas in self._buckets.get(domain, {}).items()
+            if device_class is not None and any(areas.values())
+        }
+
+    def iter_area_entities(
+        self, domain: str, device_class: str | None = None
+    ) -> Iterator[tuple[str, list[str]]]:
+        """
+        Yield (area_id, entity_ids) for `domain`, restricted to one
+        device_class when given (None means every device_class, same
+        convention as scan_domain_members). Only entities placed in an area
+        that still exists are returned.
+        """
+        by_class = self._buckets.get(domain)
+        if not by_class:
+            return
+        if device_class is not None:
+            areas = by_class.get(device_class, {})
+            for area_id, entity_ids in areas.items():
+                if entity_ids and self.topology.area_exists(area_id):
+                    yield area_id, list(entity_ids)
+            return
+
+        merged: dict[str, list[str]] = {}
+        for areas in by_class.values():
+            for area_id, entity_ids in areas.items():
+                if entity_ids and self.topology.area_exists(area_id):
+                    merged.setdefault(area_id, []).extend(entity_ids)
+        yield from merged.items()
+
+    def iter_domain_buckets(
+        self, domain: str, area_ids: Collection[str] | None = None
+    ) -> Iterator[tuple[str | None, str, list[str]]]:
+        """
+        Yield (device_class, area_id, entity_ids) for every bucket of `domain`
+        in a single walk — what scan_all_buckets uses to fill every
+        device_class slice at once instead of one walk per device_class.
+        Same existing-area restriction as iter_area_entities. `area_ids`
+        restricts the walk to those areas (a targeted rebuild), looked up
+        directly rather than filtered.
+        """
+        for device_class, areas in self._buckets.get(domain, {}).items():
+            if area_ids is None:
+                items = areas.items()
+            else:
+                items = (
+                    (area_id, areas[area_id])
+                    for area_id in area_ids
+                    if area_id in areas
+                )
+            for area_id, entity_ids in items:
+                if entity_ids and self.topology.area_exists(area_id):
+                    yield device_class, area_id, list(entity_ids)
+
+    def domains(self) -> list[str]:
+        return list(self._buckets)
+
+    # --- maintenance -------------------------------------------------------
+
+    def _add_entry(self, entity_entry: er.RegistryEntry) -> None:
+        # Self-exclusion, hidden/disabled: see class docstring.
+        if entity_entry.platform == DOMAIN:
+            return
+        if entity_entry.hidden_by or entity_entry.disabled_by:
+            return
+
+        area_id = entity_entry.area_id
+        if not area_id and entity_entry.device_id:
+            area_id = self.topology.device_area_id(entity_entry.device_id)
+
+        indexed = IndexedEntity(
+            entity_id=entity_entry.entity_id,
+            domain=entity_entry.domain,
+            device_class=entity_entry.device_class
+            or entity_entry.original_device_class,
+            device_id=entity_entry.device_id,
+            platform=entity_entry.platform,
+            area_id=area_id,
+        )
+        self._entities[indexed.entity_id] = indexed
+        if indexed.device_id:
+            self._device_entities.setdefault(indexed.device_id, {})[
+                indexed.entity_id
+            ] = None
+        if area_id:
+            self._buckets.setdefault(indexed.domain, {}).setdefault(
+                indexed.device_class, {}
+            ).setdefault(area_id, {})[indexed.entity_id] = None
+
+    def _remove(self, entity_id: str) -> IndexedEntity | None:
+        indexed = self._entities.pop(entity_id, None)
+        if indexed is None:
+            return None
+        if indexed.device_id:
+            siblings = self._device_entities.get(indexed.device_id)
+            if siblings is not None:
+                siblings.pop(entity_id, None)
+                if not siblings:
+                    del self._device_entities[indexed.device_id]
+        if indexed.area_id:
+            areas = self._buckets.get(indexed.domain, {}).get(indexed.device_class, {})
+            members = areas.get(indexed.area_id)
+            if members is not None:
+                members.pop(entity_id, None)
+                if not members:
+                    del areas[indexed.area_id]
+        return indexed
+
+    def _reindex(self, entity_id: str, old_entity_id: str | None = None) -> None:
+        old = self._remove(old_entity_id or entity_id)
+        if old_entity_id and old_entity_id != entity_id:
+            self._remove(entity_id)
+        entity_entry = er.async_get(self.hass).async_get(entity_id)
+        if entity_entry is not None:
+            self._add_entry(entity_entry)
+        self._notify(old, self._entities.get(entity_id))
+
+    def _notify(self, old: IndexedEntity | None, new: IndexedEntity | None) -> None:
+        """Tell listeners which areas changed membership (see async_add_listener)."""
+        if not self._listeners or (old is None and new is None):
+            return
+        if old == new:
+            return
+        area_ids = frozenset(
+            e.area_id for e in (old, new) if e is not None and e.area_id
+        )
+        if not area_ids:
+            return
+        # entity_id renames keep the domain, so old and new always share it.
+        domain = (new or old).domain
+        for listener in list(self._listeners):
+            listener(domain, area_ids)
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        entity_id = event.data.get("entity_id")
+        if not entity_id:
+            return
+        if event.data.get("action") == "remove":
+            self._notify(self._remove(entity_id), None)
+            return
+        self._reindex(entity_id, event.data.get("old_entity_id"))
+
+    @callback
+    def _async_device_registry_updated(self, event: Event) -> None:
+        # Device removal clears/removes its entities through their own
+        # entity_registry_updated events; only an area move needs handling
+        # here — and only for the entities attached to that device.
+        if not self.topology.async_device_updated(event):
+            return
+        for entity_id in list(self._device_entities.get(event.data["device_id"], ())):
+            self._reindex(entity_id)
+
+    @callback
+    def _async_area_registry_updated(self, event: Event) -> None:
+        self.topology.async_area_updated(event)
+
+    @callback
+    def _async_floor_registry_updated(self, event: Event) -> None:
+        self.topology.async_floor_updated(event)
+
+
+@callback
+def async_get_registry_index(hass: HomeAssistant) -> RegistryIndex:
+    """
+    The shared index for this integration's config entry.
+
+    Normally created by async_setup_registry_index at entry setup. Built on
+    demand (without event listeners) if something asks before that — only
+    ever the case outside a real config entry setup.
+    """
+    data = hass.data.setdefault(DOMAIN, {})
+    index = data.get(DATA_REGISTRY_INDEX)
+    if index is None:
+        index = RegistryIndex(hass)
+        index.async_build()
+        data[DATA_REGISTRY_INDEX] = index
+    return index
+
+
+@callback
+def async_get_topology(hass: HomeAssistant) -> TopologyCache:
+    """The TopologyCache shared by every area/floor resolver (see topology.py)."""
+    return async_get_registry_index(hass).topology
+
+
+@callback
+def async_setup_registry_index(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Build the index once for this config entry and keep it event-driven."""
+    index = RegistryIndex(hass)
+    index.async_build()
+    hass.data.setdefault(DOMAIN, {})[DATA_REGISTRY_INDEX] = index
+    for unsub in index.async_listen():
+        entry.async_on_unload(unsub)
+
+    @callback
+    def _drop_index() -> None:
+        if hass.data.get(DOMAIN, {}).get(DATA_REGISTRY_INDEX) is index:
+            hass.data[DOMAIN].pop(DATA_REGISTRY_INDEX)
+
+    entry.async_on_unload(_drop_index)
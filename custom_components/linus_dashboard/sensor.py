@@ -34,32 +34,21 @@ See entity_group.py for the shared scanning/self-exclusion logic this reuses.
 """
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from functools import partial
+from typing import Any, TypeVar
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
-from homeassistant.helpers import (
-    area_registry as ar,
-)
-from homeassistant.helpers import (
-    device_registry as dr,
-)
-from homeassistant.helpers import (
-    entity_registry as er,
-)
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 
 from .aggregate import (
     DOMAIN_ACTIVE_STATES,
-    compute_active_count,
-    compute_active_entity_ids,
-    compute_color,
-    compute_icon,
-    compute_numeric_aggregate,
+    NumericPartials,
     resolve_numeric_aggregation_mode,
+    summarize_members,
 )
 from .const import (
     DOMAIN,
@@ -67,11 +56,47 @@ from .const import (
     get_floor_device_info,
     get_global_device_info,
 )
-from .entity_group import ExclusionConfig, resolve_floors_for_areas, scan_domain_members
+from .entity_group import (
+    GROUP_UNRECORDED_ATTRIBUTES,
+    AdaptiveDebounceMixin,
+    ExclusionConfig,
+    ExclusionReason,
+    MemberBuckets,
+    MemberStateCache,
+    MemberSubscriptions,
+    SkipUnchangedWriteMixin,
+    async_get_exclusion_predicate,
+    async_get_member_lists,
+    async_rebuild_groups,
+    compact_group_attributes,
+    domain_is_excluded,
+    member_fingerprint,
+    resolve_floors_for_areas,
+)
+from .group_manager import async_register_options_callback
+from .group_plan import GLOBAL_SCOPE
+from .hierarchy import async_get_hierarchy_builder
+from .registry_index import async_get_registry_index, async_get_topology
 
 _LOGGER = logging.getLogger(__name__)
 
-DEBOUNCE_SECONDS = 0.1
+
+class _SensorWriteMixin(SkipUnchangedWriteMixin):
+    """
+    Sensor signature: native_value rather than the rendered state, whose
+    unit/device_class handling is fixed per sensor here and far pricier.
+    """
+
+    def _state_signature(self) -> tuple:
+        return (
+            self.available,
+            self._attr_native_value,
+            dict(self._attr_extra_state_attributes),
+        )
+
+    def _aggregate_value(self) -> Any:
+        return self._attr_native_value
+
 
 # Domains whose domain-level (no device_class) bucket has no dedicated group
 # entity to fall back to instead — see module docstring, item 1. Every other
@@ -95,6 +120,37 @@ AREA_REGISTRY_SENSOR_ATTR = {
     "humidity": "humidity_entity_id",
 }
 
+# unique_id -> sensor, one registry per family — same role as light.py's
+# _LIGHT_GROUPS: lets _rebuild tell genuinely new sensors apart from ones
+# that only need their member list refreshed in place.
+_AGGREGATE_SENSORS: dict[str, "LinusDashboardAggregateSensor"] = {}
+_NUMERIC_SENSORS: dict[str, "LinusDashboardNumericAggregateSensor"] = {}
+_HEALTH_SENSORS: dict[str, "LinusDashboardHealthSensor"] = {}
+
+_SensorT = TypeVar("_SensorT", bound=SensorEntity)
+
+
+# Plain TypeVar rather than PEP 695 syntax: still importable on 3.11.
+def _get_or_create_sensor(  # noqa: UP047
+    registry: dict[str, _SensorT],
+    unique_id: str,
+    member_entity_ids: list[str],
+    create: Callable[[], _SensorT],
+) -> _SensorT:
+    """
+    Idempotent factory shared by the three families: reuse the existing
+    sensor for this unique_id (handing it the new member list, a no-op if
+    unchanged) instead of constructing a duplicate — same contract as
+    light.py's _make_light_group.
+    """
+    existing = registry.get(unique_id)
+    if existing is not None:
+        existing.async_set_members(member_entity_ids)
+        return existing
+    sensor = create()
+    registry[unique_id] = sensor
+    return sensor
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -102,15 +158,34 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Linus Dashboard sensors (generic counts, numeric aggregates, health)."""
-    sensors: list[SensorEntity] = []
-    sensors.extend(await _build_aggregate_sensors(hass, config_entry))
-    sensors.extend(await _build_numeric_sensors(hass, config_entry))
-    sensors.extend(await _build_health_sensors(hass, config_entry))
-
+    registries = (_AGGREGATE_SENSORS, _NUMERIC_SENSORS, _HEALTH_SENSORS)
+    # Stale entries from a previous load of this config entry were already
+    # torn down by HA — same clean-slate reasoning as light.py.
+    for registry in registries:
+        registry.clear()
+
+    async def _build_all() -> list[SensorEntity]:
+        sensors: list[SensorEntity] = []
+        sensors.extend(await _build_aggregate_sensors(hass, config_entry))
+        sensors.extend(await _build_numeric_sensors(hass, config_entry))
+        sensors.extend(await _build_health_sensors(hass, config_entry))
+        return sensors
+
+    sensors = await _build_all()
     if sensors:
         async_add_entities(sensors)
         _LOGGER.info("Created %d sensors", len(sensors))
 
+    async def _rebuild() -> None:
+        """Re-apply the entry's current exclusions (options change)."""
+        await async_rebuild_groups(
+            hass, config_entry, async_add_entities, registries, _build_all
+        )
+
+    config_entry.async_on_unload(
+        async_register_options_callback(hass, config_entry, _rebuild)
+    )
+
 
 async def _build_aggregate_sensors(
     hass: HomeAssistant,
@@ -130,19 +205,9 @@ async def _build_aggregate_sensors(
     AggregateChip never reads once a dedicated group exists — which it now
     always does for these domains.
     """
-    ent_reg = er.async_get(hass)
-    dev_reg = dr.async_get(hass)
-    area_reg = ar.async_get(hass)
-
-    options = config_entry.options
-    excluded_domains = set(options.get("excluded_domains") or [])
-    excluded_device_classes = set(options.get("excluded_device_classes") or [])
-    excluded_targets = options.get("excluded_targets") or {}
-    excluded_entity_ids = set(excluded_targets.get("entity_id") or [])
-    excluded_area_ids = set(excluded_targets.get("area_id") or [])
-    excluded_device_ids = set(excluded_targets.get("device_id") or [])
-    excluded_floor_ids = set(excluded_targets.get("floor_id") or [])
-    excluded_integrations = set(options.get("excluded_integrations") or [])
+    index = async_get_registry_index(hass)
+    exclusions = ExclusionConfig.from_config_entry(config_entry)
+    predicate = async_get_exclusion_predicate(hass, exclusions)
 
     # Domain-level buckets serve chips without a device_class — the only
     # remaining case, now that device_class buckets are covered by real
@@ -150,94 +215,91 @@ async def _build_aggregate_sensors(
     domain_entities: dict[str, list[str]] = {}
     floor_domain_entities: dict[tuple[str, str], list[str]] = {}
 
-    for entity_entry in ent_reg.entities.values():
-        if entity_entry.hidden_by or entity_entry.disabled_by:
-            continue
-
-        entity_id = entity_entry.entity_id
-
-        if entity_id in excluded_entity_ids:
-            continue
-        if entity_entry.device_id and entity_entry.device_id in excluded_device_ids:
-            continue
-        if entity_entry.platform and entity_entry.platform in excluded_integrations:
-            continue
-
-        domain = entity_id.split(".")[0]
-        if domain in excluded_domains:
-            continue
-        if domain not in DOMAIN_ACTIVE_STATES:
-            continue
-
-        # Determine device_class from the entity registry (populated and
-        # persistent very early in startup) rather than the live state. Gating
-        # membership on hass.states here races with entity/state restoration on
-        # a cold boot: entities whose state hasn't been posted yet get skipped,
-        # producing empty (or partially-populated) aggregates that never recover
-        # until a reload. Live states are read later in _update_state instead.
-        device_class = entity_entry.device_class or entity_entry.original_device_class
-        if device_class and device_class in excluded_device_classes:
-            continue
-
-        # Resolve area: entity's own or inherited from device
-        area_id = entity_entry.area_id
-        if not area_id and entity_entry.device_id:
-            device = dev_reg.async_get(entity_entry.device_id)
-            if device:
-                area_id = device.area_id
-
-        if area_id and area_id in excluded_area_ids:
+    # Only the GENERIC_DOMAIN_LEVEL_DOMAINS buckets of the shared registry
+    # index, not the whole entity registry. The index reads device_class
+    # from the registry (populated and persistent very early in startup)
+    # rather than the live state — gating membership on hass.states here
+    # would race with entity/state restoration on a cold boot: entities
+    # whose state hasn't been posted yet would get skipped, producing empty
+    # (or partially-populated) aggregates that never recover until a
+    # reload. Live states are read later in _update_state instead.
+    for domain in GENERIC_DOMAIN_LEVEL_DOMAINS:
+        if domain_is_excluded(domain, exclusions) or domain not in DOMAIN_ACTIVE_STATES:
             continue
-        if not area_id:
-            continue
-
-        # Resolve floor from area
-        floor_id = None
-        area = area_reg.async_get_area(area_id)
-        if area:
-            floor_id = area.floor_id
 
-        if floor_id and floor_id in excluded_floor_ids:
-            continue
-
-        if domain in GENERIC_DOMAIN_LEVEL_DOMAINS:
-            domain_entities.setdefault(domain, []).append(entity_id)
+        for area_id, entity_ids in index.iter_area_entities(domain):
+            floor_id = index.topology.area_floor_id(area_id)
+            for entity_id in entity_ids:
+                indexed = index.get(entity_id)
+                # Unlike the group scans, an excluded floor drops its areas'
+                # entities here entirely, not just the floor tier.
+                if indexed is None or predicate.excludes(
+                    indexed, ExclusionReason.SCAN | ExclusionReason.FLOOR
+                ):
+                    continue
 
-        if floor_id and domain in GENERIC_DOMAIN_LEVEL_DOMAINS:
-            floor_domain_entities.setdefault((domain, floor_id), []).append(entity_id)
+                domain_entities.setdefault(domain, []).append(entity_id)
+                if floor_id:
+                    floor_domain_entities.setdefault((domain, floor_id), []).append(
+                        entity_id
+                    )
 
     sensors: list[LinusDashboardAggregateSensor] = []
 
     for domain, entity_ids in domain_entities.items():
         if entity_ids:
             sensors.append(
-                LinusDashboardAggregateSensor(
-                    hass=hass,
-                    domain=domain,
-                    device_class_filter=None,
-                    scope_id=None,
-                    tracked_entity_ids=entity_ids,
-                    config_entry=config_entry,
+                _get_or_create_sensor(
+                    _AGGREGATE_SENSORS,
+                    _aggregate_unique_id(domain, None),
+                    entity_ids,
+                    partial(
+                        LinusDashboardAggregateSensor,
+                        hass=hass,
+                        domain=domain,
+                        device_class_filter=None,
+                        scope_id=None,
+                        tracked_entity_ids=entity_ids,
+                    ),
                 )
             )
 
     for (domain, floor_id), entity_ids in floor_domain_entities.items():
         if entity_ids:
             sensors.append(
-                LinusDashboardAggregateSensor(
-                    hass=hass,
-                    domain=domain,
-                    device_class_filter=None,
-                    scope_id=floor_id,
-                    tracked_entity_ids=entity_ids,
-                    config_entry=config_entry,
+                _get_or_create_sensor(
+                    _AGGREGATE_SENSORS,
+                    _aggregate_unique_id(domain, floor_id),
+                    entity_ids,
+                    partial(
+                        LinusDashboardAggregateSensor,
+                        hass=hass,
+                        domain=domain,
+                        device_class_filter=None,
+                        scope_id=floor_id,
+                        tracked_entity_ids=entity_ids,
+                    ),
                 )
             )
 
     return sensors
 
 
-class LinusDashboardAggregateSensor(SensorEntity):
+def _aggregate_unique_id(domain: str, scope_id: str | None) -> str:
+    return "_".join(_aggregate_id_parts(domain, scope_id))
+
+
+def _aggregate_id_parts(domain: str, scope_id: str | None) -> list[str]:
+    parts = ["linus_dashboard", domain]
+    if scope_id:
+        parts.append(scope_id)
+    parts.append("active")
+    return parts
+
+
+class LinusDashboardAggregateSensor(
+    AdaptiveDebounceMixin, _SensorWriteMixin, SensorEntity
+):
     """
     Visible sensor computing active count, icon, and color for a whole
     domain, regardless of device_class.
@@ -254,6 +316,7 @@ class LinusDashboardAggregateSensor(SensorEntity):
     _attr_has_entity_name = True
     _attr_entity_category = None
     _attr_entity_registry_visible_default = True
+    _unrecorded_attributes = GROUP_UNRECORDED_ATTRIBUTES
     _attr_should_poll = False
     _attr_native_unit_of_measurement = None
 
@@ -264,48 +327,69 @@ class LinusDashboardAggregateSensor(SensorEntity):
         device_class_filter: None,
         scope_id: str | None,
         tracked_entity_ids: list[str],
-        config_entry: ConfigEntry,
     ) -> None:
         """Initialize the aggregate sensor."""
         self.hass = hass
         self._domain = domain
         self._tracked_entities = frozenset(tracked_entity_ids)
-        self._config_entry = config_entry
         self._debounce_unsub: CALLBACK_TYPE | None = None
-        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self._subscriptions = MemberSubscriptions(hass, self._async_state_changed)
+        self._member_states = MemberStateCache()
+        self._active_entity_ids: list[str] = []
 
-        parts = ["linus_dashboard", domain]
-        if scope_id:
-            parts.append(scope_id)
-        parts.append("active")
+        parts = _aggregate_id_parts(domain, scope_id)
 
         self._attr_unique_id = "_".join(parts)
         self._attr_name = " ".join(p.replace("_", " ").title() for p in parts[1:])
         self._attr_native_value: int = 0
         self._attr_extra_state_attributes: dict[str, Any] = {}
+        if scope_id:
+            self.group_scope = ("floor", scope_id)
 
         # Explicit entity_id matching frontend's ID construction
         self.entity_id = f"sensor.{'_'.join(parts)}"
 
+    @property
+    def member_fingerprint(self) -> frozenset[str]:
+        return self._tracked_entities
+
+    def member_lists(self) -> dict[str, list[str]]:
+        return {
+            "members": sorted(self._tracked_entities),
+            "active": list(self._active_entity_ids),
+        }
+
     async def async_added_to_hass(self) -> None:
         """Subscribe to state changes when added to HA."""
         self._update_state()
+        self._subscriptions.async_set(self._tracked_entities)
 
-        self._unsub_state_changed = async_track_state_change_event(
-            self.hass,
-            list(self._tracked_entities),
-            self._async_state_changed,
-        )
+    @callback
+    def async_set_members(self, tracked_entity_ids: list[str]) -> bool:
+        """
+        Swap the tracked entity set in place (rebuild), resubscribing only
+        the diff; False (and nothing done) if it's the same set. Same
+        contract as NestedGroupMixin.async_set_members.
+        """
+        tracked = frozenset(tracked_entity_ids)
+        if tracked == self._tracked_entities:
+            return False
+        self._tracked_entities = tracked
+        self._member_states.invalidate()
+        if self._subscriptions.active:
+            self._subscriptions.async_set(tracked)
+            self._update_state()
+            self.async_write_ha_state()
+        return True
 
-        self.async_on_remove(
-            self._config_entry.add_update_listener(self._async_config_updated)
-        )
+    async def async_update_members(self, tracked_entity_ids: list[str]) -> None:
+        """Swap the tracked entity set in place (options change rebuild)."""
+        self.async_set_members(tracked_entity_ids)
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up subscriptions."""
-        if self._unsub_state_changed:
-            self._unsub_state_changed()
-            self._unsub_state_changed = None
+        await super().async_will_remove_from_hass()
+        self._subscriptions.async_clear()
         if self._debounce_unsub:
             self._debounce_unsub()
             self._debounce_unsub = None
@@ -317,49 +401,43 @@ class LinusDashboardAggregateSensor(SensorEntity):
         if entity_id not in self._tracked_entities:
             return
 
-        if self._debounce_unsub:
-            self._debounce_unsub()
-
-        self._debounce_unsub = async_call_later(
-            self.hass, DEBOUNCE_SECONDS, self._async_debounced_update
-        )
+        self._member_states.apply(event)
+        self._async_debounce()
 
     @callback
-    def _async_debounced_update(self, _now=None) -> None:
+    def _async_debounced_update(self) -> None:
         """Recompute aggregates after debounce period."""
         self._debounce_unsub = None
         self._update_state()
-        self.async_write_ha_state()
+        self.async_write_if_changed()
 
     @callback
     def _update_state(self) -> None:
         """Recompute all aggregate values from current HA state."""
-        entity_states: dict[str, str] = {}
-        for entity_id in self._tracked_entities:
-            state_obj = self.hass.states.get(entity_id)
-            if state_obj and state_obj.state not in ("unavailable", "unknown"):
-                entity_states[entity_id] = state_obj.state
-
-        active_count = compute_active_count(entity_states, self._domain)
-        active_ids = compute_active_entity_ids(entity_states, self._domain)
-        icon = compute_icon(self.hass, self._domain, entity_states, None)
-        color = compute_color(self._domain, None, entity_states)
-
-        self._attr_native_value = active_count
+        cache = self._member_states.current(
+            self.hass, self._tracked_entities, live=self._subscriptions.active
+        )
+        entity_states = {
+            state_obj.entity_id: state_obj.state
+            for state_obj in cache.states()
+            if state_obj.state not in ("unavailable", "unknown")
+        }
+        summary = summarize_members(self.hass, self._domain, entity_states)
+
+        self._attr_native_value = summary.active_count
+        self._active_entity_ids = summary.active_entity_ids
         self._attr_extra_state_attributes = {
             "total": len(self._tracked_entities),
-            "icon": icon,
-            "color": color,
-            ATTR_ENTITY_ID: sorted(self._tracked_entities),
-            "active_entity_ids": active_ids,
+            "icon": summary.icon,
+            "color": summary.color,
         }
-
-    @staticmethod
-    async def _async_config_updated(
-        hass: HomeAssistant, config_entry: ConfigEntry
-    ) -> None:
-        """Handle config entry update — reload the platform."""
-        await hass.config_entries.async_reload(config_entry.entry_id)
+        if not compact_group_attributes(self.hass):
+            self._attr_extra_state_attributes[ATTR_ENTITY_ID] = sorted(
+                self._tracked_entities
+            )
+            self._attr_extra_state_attributes["active_entity_ids"] = (
+                summary.active_entity_ids
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -367,12 +445,25 @@ class LinusDashboardAggregateSensor(SensorEntity):
 # ---------------------------------------------------------------------------
 
 
-class LinusDashboardNumericAggregateSensor(SensorEntity):
+# Numeric aggregates' mergeable NumericPartials, read by the tier above.
+ATTR_PARTIALS = "partials"
+
+
+class LinusDashboardNumericAggregateSensor(
+    AdaptiveDebounceMixin, _SensorWriteMixin, SensorEntity
+):
     """Sum/average/minimum of a sensor device_class across a zone/floor/global."""
 
     _attr_has_entity_name = True
     _attr_should_poll = False
     _attr_entity_registry_visible_default = True
+    _unrecorded_attributes = frozenset({
+        ATTR_ENTITY_ID,
+        "total",
+        "mode",
+        "source",
+        ATTR_PARTIALS,
+    })
 
     def __init__(
         self,
@@ -387,10 +478,17 @@ class LinusDashboardNumericAggregateSensor(SensorEntity):
         member_entity_ids: list[str],
         official_entity_id: str | None = None,
         unit_of_measurement: str | None = None,
+        nested: bool = False,
     ) -> None:
+        """
+        nested: members are this device_class's child aggregate sensors
+        (floor/global scope), whose published partials get merged rather
+        than their rounded states re-aggregated.
+        """
         self.hass = hass
         self._device_class = device_class
         self._mode = mode
+        self._nested = nested
         self._member_entity_ids = list(member_entity_ids)
         self._official_entity_id = official_entity_id
         self._attr_device_class = device_class
@@ -404,63 +502,87 @@ class LinusDashboardNumericAggregateSensor(SensorEntity):
         self.entity_id = f"sensor.{unique_id}"
         self._attr_native_value: float | None = None
         self._attr_extra_state_attributes: dict[str, Any] = {}
-        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self._subscriptions = MemberSubscriptions(hass, self._async_state_changed)
         self._debounce_unsub: CALLBACK_TYPE | None = None
+        self._member_states = MemberStateCache()
 
     def is_empty(self) -> bool:
         return not self._member_entity_ids and not self._official_entity_id
 
-    async def async_update_members(self, member_entity_ids: list[str]) -> None:
+    def _state_signature(self) -> tuple:
+        # The partials' unrounded floats move with every sub-display jitter
+        # of a member: only how many values they hold is compared, so the
+        # rounded state alone decides whether a recompute is written.
+        attributes = dict(self._attr_extra_state_attributes)
+        partials = attributes.pop(ATTR_PARTIALS, None)
+        return (
+            self.available,
+            self._attr_native_value,
+            attributes,
+            partials["count"] if partials else None,
+        )
+
+    @property
+    def member_fingerprint(self) -> frozenset[str]:
+        return member_fingerprint(self._member_entity_ids)
+
+    def member_lists(self) -> dict[str, list[str]]:
+        return {"members": list(self._tracked)}
+
+    @callback
+    def async_set_members(self, member_entity_ids: list[str]) -> bool:
+        """See LinusDashboardAggregateSensor.async_set_members."""
+        if member_fingerprint(member_entity_ids) == self.member_fingerprint:
+            return False
         self._member_entity_ids = list(member_entity_ids)
-        await self._async_resubscribe()
-        self._update_state()
-        if self.hass:
+        self._member_states.invalidate()
+        if self._subscriptions.active:
+            self._subscriptions.async_set(self._tracked)
+            self._update_state()
             self.async_write_ha_state()
+        return True
+
+    async def async_update_members(self, member_entity_ids: list[str]) -> None:
+        self.async_set_members(member_entity_ids)
 
-    async def _async_resubscribe(self) -> None:
-        if self._unsub_state_changed:
-            self._unsub_state_changed()
-        tracked = (
+    @property
+    def _tracked(self) -> list[str]:
+        return (
             [self._official_entity_id]
             if self._official_entity_id
             else self._member_entity_ids
         )
-        self._unsub_state_changed = async_track_state_change_event(
-            self.hass, tracked, self._async_state_changed
-        )
 
     @callback
-    def _async_state_changed(self, _event) -> None:
-        if self._debounce_unsub:
-            self._debounce_unsub()
-        self._debounce_unsub = async_call_later(
-            self.hass, DEBOUNCE_SECONDS, self._async_debounced_update
-        )
+    def _async_state_changed(self, event) -> None:
+        self._member_states.apply(event)
+        self._async_debounce()
 
     @callback
-    def _async_debounced_update(self, _now=None) -> None:
+    def _async_debounced_update(self) -> None:
         self._debounce_unsub = None
         self._update_state()
-        self.async_write_ha_state()
+        self.async_write_if_changed()
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
-        await self._async_resubscribe()
+        self._subscriptions.async_set(self._tracked)
         self._update_state()
 
     async def async_will_remove_from_hass(self) -> None:
         await super().async_will_remove_from_hass()
-        if self._unsub_state_changed:
-            self._unsub_state_changed()
-            self._unsub_state_changed = None
+        self._subscriptions.async_clear()
         if self._debounce_unsub:
             self._debounce_unsub()
             self._debounce_unsub = None
 
     @callback
     def _update_state(self) -> None:
+        cache = self._member_states.current(
+            self.hass, self._tracked, live=self._subscriptions.active
+        )
         if self._official_entity_id:
-            state_obj = self.hass.states.get(self._official_entity_id)
+            state_obj = cache.get(self._official_entity_id)
             try:
                 value = (
                     float(state_obj.state)
@@ -469,36 +591,48 @@ class LinusDashboardNumericAggregateSensor(SensorEntity):
                 )
             except (ValueError, TypeError):
                 value = None
+            partials = NumericPartials.from_values(() if value is None else (value,))
             self._attr_native_value = round(value, 1) if value is not None else None
             self._attr_extra_state_attributes = {
                 ATTR_ENTITY_ID: [self._official_entity_id],
                 "total": 1,
                 "source": "area_registry_configured_sensor",
+                ATTR_PARTIALS: partials.as_dict(),
             }
             return
 
-        values: list[float] = []
-        for entity_id in self._member_entity_ids:
-            state_obj = self.hass.states.get(entity_id)
-            if not state_obj or state_obj.state in ("unavailable", "unknown"):
+        partials = NumericPartials()
+        for state_obj in cache.states():
+            if self._nested:
+                child = NumericPartials.from_dict(
+                    state_obj.attributes.get(ATTR_PARTIALS)
+                )
+                if child is not None:
+                    partials.merge(child)
+                    continue
+            if state_obj.state in ("unavailable", "unknown"):
                 continue
             try:
-                values.append(float(state_obj.state))
+                partials.add(float(state_obj.state))
             except (ValueError, TypeError):
                 continue
 
-        value = compute_numeric_aggregate(values, self._mode)
+        value = partials.value(self._mode)
         self._attr_native_value = round(value, 1) if value is not None else None
         self._attr_extra_state_attributes = {
-            ATTR_ENTITY_ID: list(self._member_entity_ids),
             "total": len(self._member_entity_ids),
             "mode": self._mode,
+            ATTR_PARTIALS: partials.as_dict(),
         }
+        if not compact_group_attributes(self.hass):
+            self._attr_extra_state_attributes[ATTR_ENTITY_ID] = list(
+                self._member_entity_ids
+            )
 
 
 def _discover_numeric_device_classes(
-    hass: HomeAssistant, exclusions: ExclusionConfig
-) -> set[str]:
+    hass: HomeAssistant, buckets: MemberBuckets
+) -> list[str]:
     """
     Find sensor device_classes present with an actually-numeric state.
 
@@ -507,44 +641,49 @@ def _discover_numeric_device_classes(
     fixed short list — a device_class with a non-numeric state (enum,
     timestamp, date) is skipped since summing/averaging it is meaningless;
     see NUMERIC_DEVICE_CLASS_EXCLUSIONS for the ones excluded outright
-    without even checking the live value.
+    without even checking the live value. Reads the same shared scan
+    result _build_numeric_sensors then builds from.
     """
-    entity_reg = er.async_get(hass)
-    device_classes: set[str] = set()
-    for entity_entry in entity_reg.entities.values():
-        if entity_entry.domain != "sensor" or entity_entry.platform == DOMAIN:
-            continue
-        if entity_entry.hidden_by or entity_entry.disabled_by:
-            continue
-        device_class = entity_entry.device_class or entity_entry.original_device_class
-        if not device_class or device_class in NUMERIC_DEVICE_CLASS_EXCLUSIONS:
+    device_classes: list[str] = []
+    for device_class in buckets.device_classes("sensor"):
+        if device_class in NUMERIC_DEVICE_CLASS_EXCLUSIONS:
             continue
-        if device_class in exclusions.excluded_device_classes:
-            continue
-        state_obj = hass.states.get(entity_entry.entity_id)
-        if not state_obj:
-            continue
-        try:
-            float(state_obj.state)
-        except (ValueError, TypeError):
-            continue
-        device_classes.add(device_class)
+        # One actually-numeric member is enough to keep the device_class.
+        area_entities = buckets.get("sensor", device_class).area_entities
+        if any(
+            _has_numeric_state(hass, entity_id)
+            for entity_ids in area_entities.values()
+            for entity_id in entity_ids
+        ):
+            device_classes.append(device_class)
     return device_classes
 
 
+def _has_numeric_state(hass: HomeAssistant, entity_id: str) -> bool:
+    state_obj = hass.states.get(entity_id)
+    if not state_obj:
+        return False
+    try:
+        float(state_obj.state)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
 async def _build_numeric_sensors(
     hass: HomeAssistant, config_entry: ConfigEntry
 ) -> list[LinusDashboardNumericAggregateSensor]:
     """Build one numeric aggregate sensor per sensor device_class present, nested area/floor/global."""
     exclusions = ExclusionConfig.from_config_entry(config_entry)
     entry_id = config_entry.entry_id
-    area_reg = ar.async_get(hass)
+    topology = async_get_topology(hass)
     entities: list[LinusDashboardNumericAggregateSensor] = []
 
-    for device_class in _discover_numeric_device_classes(hass, exclusions):
-        scoped = scan_domain_members(
-            hass, domain="sensor", device_class=device_class, exclusions=exclusions
-        )
+    buckets = async_get_hierarchy_builder(hass, config_entry).buckets(
+        exclusions, domains=("sensor",)
+    )
+    for device_class in _discover_numeric_device_classes(hass, buckets):
+        scoped = buckets.get("sensor", device_class)
         area_group_ids: dict[str, str] = {}
         area_official: dict[str, str | None] = {}
 
@@ -573,36 +712,43 @@ async def _build_numeric_sensors(
             official_entity_id = None
             registry_attr = AREA_REGISTRY_SENSOR_ATTR.get(device_class)
             if registry_attr:
-                area = area_reg.async_get_area(area_id)
+                area = topology.area(area_id)
                 official_entity_id = (
                     getattr(area, registry_attr, None) if area else None
                 )
 
             unique_id = f"{DOMAIN}_{device_class}_area_{area_id}"
-            sensor = LinusDashboardNumericAggregateSensor(
-                hass,
-                unique_id=unique_id,
-                # No custom translation_key/placeholders — same reasoning as
-                # binary_sensor.py's per-device_class groups: with
-                # _attr_device_class set and no translation_key, HA falls
-                # back to its own core per-device_class sensor name
-                # (already localized for every standard device_class)
-                # combined with the device's own name for the area/floor
-                # distinction. A hand-written "numeric_{device_class}" key
-                # can't scale to a dynamically-discovered device_class list
-                # anyway — there's no way to pre-write a translation for a
-                # device_class we don't know about yet.
-                translation_key=None,
-                translation_placeholders=None,
-                device_info=get_area_device_info(
-                    entry_id, area_id, scoped.area_names[area_id]
+            sensor = _get_or_create_sensor(
+                _NUMERIC_SENSORS,
+                unique_id,
+                member_ids,
+                partial(
+                    LinusDashboardNumericAggregateSensor,
+                    hass,
+                    unique_id=unique_id,
+                    # No custom translation_key/placeholders — same reasoning as
+                    # binary_sensor.py's per-device_class groups: with
+                    # _attr_device_class set and no translation_key, HA falls
+                    # back to its own core per-device_class sensor name
+                    # (already localized for every standard device_class)
+                    # combined with the device's own name for the area/floor
+                    # distinction. A hand-written "numeric_{device_class}" key
+                    # can't scale to a dynamically-discovered device_class list
+                    # anyway — there's no way to pre-write a translation for a
+                    # device_class we don't know about yet.
+                    translation_key=None,
+                    translation_placeholders=None,
+                    device_info=get_area_device_info(
+                        entry_id, area_id, scoped.area_names[area_id]
+                    ),
+                    device_class=device_class,
+                    mode=mode,
+                    member_entity_ids=member_ids,
+                    official_entity_id=official_entity_id,
+                    unit_of_measurement=unit,
                 ),
-                device_class=device_class,
-                mode=mode,
-                member_entity_ids=member_ids,
-                official_entity_id=official_entity_id,
-                unit_of_measurement=unit,
             )
+            sensor.group_scope = ("area", area_id)
             entities.append(sensor)
             area_group_ids[area_id] = sensor.entity_id
             area_official[area_id] = official_entity_id
@@ -618,35 +764,51 @@ async def _build_numeric_sensors(
             if not member_ids:
                 continue
             unique_id = f"{DOMAIN}_{device_class}_floor_{floor_id}"
-            sensor = LinusDashboardNumericAggregateSensor(
-                hass,
-                unique_id=unique_id,
-                translation_key=None,
-                translation_placeholders=None,
-                device_info=get_floor_device_info(
-                    entry_id, floor_id, floor_names.get(floor_id, floor_id)
+            sensor = _get_or_create_sensor(
+                _NUMERIC_SENSORS,
+                unique_id,
+                member_ids,
+                partial(
+                    LinusDashboardNumericAggregateSensor,
+                    hass,
+                    unique_id=unique_id,
+                    translation_key=None,
+                    translation_placeholders=None,
+                    device_info=get_floor_device_info(
+                        entry_id, floor_id, floor_names.get(floor_id, floor_id)
+                    ),
+                    device_class=device_class,
+                    mode=mode,
+                    member_entity_ids=member_ids,
+                    unit_of_measurement=unit,
+                    nested=True,
                 ),
-                device_class=device_class,
-                mode=mode,
-                member_entity_ids=member_ids,
-                unit_of_measurement=unit,
             )
+            sensor.group_scope = ("floor", floor_id)
             entities.append(sensor)
             floor_group_ids.append(sensor.entity_id)
 
         if floor_group_ids:
             unique_id = f"{DOMAIN}_{device_class}_global"
-            sensor = LinusDashboardNumericAggregateSensor(
-                hass,
-                unique_id=unique_id,
-                translation_key=None,
-                translation_placeholders=None,
-                device_info=get_global_device_info(entry_id),
-                device_class=device_class,
-                mode=mode,
-                member_entity_ids=floor_group_ids,
-                unit_of_measurement=unit,
+            sensor = _get_or_create_sensor(
+                _NUMERIC_SENSORS,
+                unique_id,
+                floor_group_ids,
+                partial(
+                    LinusDashboardNumericAggregateSensor,
+                    hass,
+                    unique_id=unique_id,
+                    translation_key=None,
+                    translation_placeholders=None,
+                    device_info=get_global_device_info(entry_id),
+                    device_class=device_class,
+                    mode=mode,
+                    member_entity_ids=floor_group_ids,
+                    unit_of_measurement=unit,
+                    nested=True,
+                ),
             )
+            sensor.group_scope = GLOBAL_SCOPE
             entities.append(sensor)
 
     return entities
@@ -662,7 +824,9 @@ async def _build_numeric_sensors(
 MAX_UNAVAILABLE_ENTITY_IDS = 200
 
 
-class LinusDashboardHealthSensor(SensorEntity):
+class LinusDashboardHealthSensor(
+    AdaptiveDebounceMixin, _SensorWriteMixin, SensorEntity
+):
     """
     Count and list of unavailable/unknown entities in a zone/floor/global.
 
@@ -679,6 +843,7 @@ class LinusDashboardHealthSensor(SensorEntity):
     _attr_should_poll = False
     _attr_entity_registry_visible_default = True
     _attr_native_unit_of_measurement = None
+    _unrecorded_attributes = frozenset({ATTR_ENTITY_ID, "total"})
 
     def __init__(
         self,
@@ -711,64 +876,102 @@ class LinusDashboardHealthSensor(SensorEntity):
         self.entity_id = f"sensor.{unique_id}"
         self._attr_native_value: int = 0
         self._attr_extra_state_attributes: dict[str, Any] = {}
-        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        # Uncapped, unlike the entity_id attribute (see member_lists).
+        self._unavailable: list[str] = []
+        self._subscriptions = MemberSubscriptions(hass, self._async_state_changed)
         self._debounce_unsub: CALLBACK_TYPE | None = None
+        self._member_states = MemberStateCache()
 
     def _update_state(self) -> None:
+        cache = self._member_states.current(
+            self.hass, self._tracked_entity_ids, live=self._subscriptions.active
+        )
         if self._nested:
+            # Children's counts, not the length of their (capped, or in
+            # compact mode absent) lists.
             unavailable: list[str] = []
-            for child_id in self._tracked_entity_ids:
-                child_state = self.hass.states.get(child_id)
-                if not child_state:
-                    continue
-                unavailable.extend(child_state.attributes.get(ATTR_ENTITY_ID, []))
+            count = 0
+            for child_state in cache.states():
+                child_ids = child_state.attributes.get(ATTR_ENTITY_ID, [])
+                unavailable.extend(child_ids)
+                count += child_state.attributes.get("total", len(child_ids))
         else:
             unavailable = [
-                eid
-                for eid in self._tracked_entity_ids
-                if (state := self.hass.states.get(eid)) is not None
-                and state.state in ("unavailable", "unknown")
+                state.entity_id
+                for state in cache.states()
+                if state.state in ("unavailable", "unknown")
             ]
+            count = len(unavailable)
 
-        self._attr_native_value = len(unavailable)
-        self._attr_extra_state_attributes = {
+        self._unavailable = unavailable
+        self._attr_native_value = count
+        self._attr_extra_state_attributes = {"total": count}
+        if not compact_group_attributes(self.hass):
             # Nested tiers concatenate every child's list — on a real house
             # (hundreds of entities) with many entities down at once, this
             # flat list can exceed HA's 16KB state-attribute limit and get
             # silently dropped entirely. total stays the real, uncapped
             # count; only the list itself is capped since it's meant to help
             # pinpoint what's down, not be an exhaustive audit trail.
-            ATTR_ENTITY_ID: unavailable[:MAX_UNAVAILABLE_ENTITY_IDS],
-            "total": len(unavailable),
-        }
+            self._attr_extra_state_attributes[ATTR_ENTITY_ID] = unavailable[
+                :MAX_UNAVAILABLE_ENTITY_IDS
+            ]
+
+    @property
+    def member_fingerprint(self) -> frozenset[str]:
+        return member_fingerprint(self._tracked_entity_ids)
+
+    def member_lists(self) -> dict[str, list[str]]:
+        """Tracked entities and every unavailable one, uncapped."""
+        if not self._nested:
+            unavailable = list(self._unavailable)
+        else:
+            # Straight from each child: its attribute list is capped, or
+            # absent altogether with compact_group_attributes.
+            unavailable = []
+            for child_id in self._tracked_entity_ids:
+                child_lists = async_get_member_lists(self.hass, child_id)
+                if child_lists is not None:
+                    unavailable.extend(child_lists["unavailable"])
+        return {"members": list(self._tracked_entity_ids), "unavailable": unavailable}
 
     async def async_added_to_hass(self) -> None:
         self._update_state()
-        self._unsub_state_changed = async_track_state_change_event(
-            self.hass, self._tracked_entity_ids, self._async_state_changed
-        )
+        self._subscriptions.async_set(self._tracked_entity_ids)
+
+    @callback
+    def async_set_members(self, tracked_entity_ids: list[str]) -> bool:
+        """See LinusDashboardAggregateSensor.async_set_members."""
+        if member_fingerprint(tracked_entity_ids) == self.member_fingerprint:
+            return False
+        self._tracked_entity_ids = list(tracked_entity_ids)
+        self._member_states.invalidate()
+        if self._subscriptions.active:
+            self._subscriptions.async_set(self._tracked_entity_ids)
+            self._update_state()
+            self.async_write_ha_state()
+        return True
+
+    async def async_update_members(self, tracked_entity_ids: list[str]) -> None:
+        self.async_set_members(tracked_entity_ids)
 
     async def async_will_remove_from_hass(self) -> None:
-        if self._unsub_state_changed:
-            self._unsub_state_changed()
-            self._unsub_state_changed = None
+        await super().async_will_remove_from_hass()
+        self._subscriptions.async_clear()
         if self._debounce_unsub:
             self._debounce_unsub()
             self._debounce_unsub = None
 
     @callback
-    def _async_state_changed(self, _event: Event) -> None:
-        if self._debounce_unsub:
-            self._debounce_unsub()
-        self._debounce_unsub = async_call_later(
-            self.hass, DEBOUNCE_SECONDS, self._async_debounced_update
-        )
+    def _async_state_changed(self, event: Event) -> None:
+        self._member_states.apply(event)
+        self._async_debounce()
 
     @callback
-    def _async_debounced_update(self, _now=None) -> None:
+    def _async_debounced_update(self) -> None:
         self._debounce_unsub = None
         self._update_state()
-        self.async_write_ha_state()
+        self.async_write_if_changed()
 
 
 def _scan_all_entities_by_area(
@@ -779,46 +982,28 @@ def _scan_all_entities_by_area(
     the health sensor isn't limited to the domains this integration already
     groups; a dead sensor.* or climate.* entity should show up too.
     """
-    entity_reg = er.async_get(hass)
-    device_reg = dr.async_get(hass)
-    area_reg = ar.async_get(hass)
+    index = async_get_registry_index(hass)
+    predicate = async_get_exclusion_predicate(hass, exclusions)
+    # device_class exclusions don't apply: an unavailable entity is worth
+    # reporting whatever its device_class.
+    reasons = ExclusionReason.SCAN & ~ExclusionReason.DEVICE_CLASS
 
     area_entities: dict[str, list[str]] = {}
     area_names: dict[str, str] = {}
 
-    for entity_entry in entity_reg.entities.values():
-        if entity_entry.platform == DOMAIN:
-            continue
-        if entity_entry.hidden_by or entity_entry.disabled_by:
-            continue
-        entity_id = entity_entry.entity_id
-        if entity_id in exclusions.excluded_entity_ids:
-            continue
-        if (
-            entity_entry.device_id
-            and entity_entry.device_id in exclusions.excluded_device_ids
-        ):
-            continue
-        if (
-            entity_entry.platform
-            and entity_entry.platform in exclusions.excluded_integrations
-        ):
-            continue
-
-        area_id = entity_entry.area_id
-        if not area_id and entity_entry.device_id:
-            device = device_reg.async_get(entity_entry.device_id)
-            if device:
-                area_id = device.area_id
-        if not area_id or area_id in exclusions.excluded_area_ids:
-            continue
+    for domain in index.domains():
+        for area_id, entity_ids in index.iter_area_entities(domain):
+            area = index.topology.area(area_id)
+            if not area:
+                continue
 
-        area = area_reg.async_get_area(area_id)
-        if not area:
-            continue
+            for entity_id in entity_ids:
+                indexed = index.get(entity_id)
+                if indexed is None or predicate.excludes(indexed, reasons):
+                    continue
 
-        area_entities.setdefault(area_id, []).append(entity_id)
-        area_names[area_id] = area.name
+                area_entities.setdefault(area_id, []).append(entity_id)
+                area_names[area_id] = area.name
 
     return area_entities, area_names
 
@@ -836,15 +1021,24 @@ async def _build_health_sensors(
 
     for area_id, entity_ids in area_entities.items():
         unique_id = f"{DOMAIN}_unavailable_area_{area_id}"
-        sensor = LinusDashboardHealthSensor(
-            hass,
-            unique_id=unique_id,
-            translation_key="unavailable",
-            translation_placeholders={"name": area_names[area_id]},
-            device_info=get_area_device_info(entry_id, area_id, area_names[area_id]),
-            tracked_entity_ids=entity_ids,
-            nested=False,
+        sensor = _get_or_create_sensor(
+            _HEALTH_SENSORS,
+            unique_id,
+            entity_ids,
+            partial(
+                LinusDashboardHealthSensor,
+                hass,
+                unique_id=unique_id,
+                translation_key="unavailable",
+                translation_placeholders={"name": area_names[area_id]},
+                device_info=get_area_device_info(
+                    entry_id, area_id, area_names[area_id]
+                ),
+                tracked_entity_ids=entity_ids,
+                nested=False,
+            ),
         )
+        sensor.group_scope = ("area", area_id)
         entities.append(sensor)
         area_group_ids[area_id] = sensor.entity_id
 
@@ -857,31 +1051,45 @@ async def _build_health_sensors(
         if not member_ids:
             continue
         unique_id = f"{DOMAIN}_unavailable_floor_{floor_id}"
-        sensor = LinusDashboardHealthSensor(
-            hass,
-            unique_id=unique_id,
-            translation_key="unavailable",
-            translation_placeholders={"name": floor_names.get(floor_id, floor_id)},
-            device_info=get_floor_device_info(
-                entry_id, floor_id, floor_names.get(floor_id, floor_id)
+        sensor = _get_or_create_sensor(
+            _HEALTH_SENSORS,
+            unique_id,
+            member_ids,
+            partial(
+                LinusDashboardHealthSensor,
+                hass,
+                unique_id=unique_id,
+                translation_key="unavailable",
+                translation_placeholders={"name": floor_names.get(floor_id, floor_id)},
+                device_info=get_floor_device_info(
+                    entry_id, floor_id, floor_names.get(floor_id, floor_id)
+                ),
+                tracked_entity_ids=member_ids,
+                nested=True,
             ),
-            tracked_entity_ids=member_ids,
-            nested=True,
         )
+        sensor.group_scope = ("floor", floor_id)
         entities.append(sensor)
         floor_group_ids.append(sensor.entity_id)
 
     if floor_group_ids:
         unique_id = f"{DOMAIN}_unavailable_global"
-        sensor = LinusDashboardHealthSensor(
-            hass,
-            unique_id=unique_id,
-            translation_key="unavailable_global",
-            translation_placeholders=None,
-            device_info=get_global_device_info(entry_id),
-            tracked_entity_ids=floor_group_ids,
-            nested=True,
+        sensor = _get_or_create_sensor(
+            _HEALTH_SENSORS,
+            unique_id,
+            floor_group_ids,
+            partial(
+                LinusDashboardHealthSensor,
+                hass,
+                unique_id=unique_id,
+                translation_key="unavailable_global",
+                translation_placeholders=None,
+                device_info=get_global_device_info(entry_id),
+                tracked_entity_ids=floor_group_ids,
+                nested=True,
+            ),
         )
+        sensor.group_scope = GLOBAL_SCOPE
         entities.append(sensor)
 
     return entities
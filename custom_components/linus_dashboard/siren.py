@@ -12,11 +12,12 @@ through to every member, same as before.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 from typing import Any
 
 from homeassistant.components.siren import ATTR_TONE, SirenEntity, SirenEntityFeature
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -24,8 +25,9 @@ from .const import DOMAIN
 from .entity_group import (
     ExclusionConfig,
     NestedGroupMixin,
+    RebuildScope,
+    async_rebuild_groups,
     build_nested_domain_groups,
-    compute_group_attributes,
 )
 from .group_manager import PlatformGroupManager
 
@@ -64,10 +66,7 @@ class SirenGroup(NestedGroupMixin, SirenEntity):
         all_features: list[int] = []
         all_tones: list[str] = []
 
-        for entity_id in self._member_entity_ids:
-            state = self.hass.states.get(entity_id)
-            if not state or state.state == STATE_UNAVAILABLE:
-                continue
+        for state in self._member_state_cache().available():
             all_features.append(state.attributes.get("supported_features", 0))
             all_tones.extend(state.attributes.get("available_tones") or [])
 
@@ -84,12 +83,7 @@ class SirenGroup(NestedGroupMixin, SirenEntity):
 
     def _recompute(self) -> None:
         self._detect_features_from_members()
-        attrs = compute_group_attributes(
-            self.hass,
-            domain="siren",
-            device_class=None,
-            member_entity_ids=self._member_entity_ids,
-        )
+        attrs = self._group_attributes(domain="siren")
         self._attr_is_on = len(attrs["active_entity_ids"]) > 0
         self._attr_extra_state_attributes = attrs
 
@@ -132,7 +126,7 @@ def _make_siren_group(
     """Idempotent factory — see light.py's _make_light_group for the full rationale."""
     existing = _SIREN_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
     group = SirenGroup(
         hass,
@@ -170,28 +164,34 @@ async def async_setup_entry(
         async_add_entities(entities)
         _LOGGER.info("Created %d siren group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        before_ids = set(_SIREN_GROUPS.keys())
-        new_groups = await build_nested_domain_groups(
-            hass, config_entry, exclusions, **build_kwargs
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        # See light.py's _rebuild for the scope.
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
+            hass,
+            config_entry,
+            async_add_entities,
+            (_SIREN_GROUPS,),
+            partial(
+                build_nested_domain_groups,
+                hass,
+                config_entry,
+                exclusions,
+                **build_kwargs,
+                scope=scope,
+                existing=_SIREN_GROUPS,
+            ),
+            scope=scope,
         )
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
-
-        for uid in before_ids - after_ids:
-            stale = _SIREN_GROUPS.pop(uid)
-            hass.async_create_task(stale.async_remove(force_remove=True))
 
-        if to_add:
-            async_add_entities(to_add)
-            # See light.py's _rebuild for why this is needed here too.
-            from . import async_hide_group_entities_from_voice_assistants
-
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
-
-    platform_manager = PlatformGroupManager(hass, monitored_domains=["siren"])
+    platform_manager = PlatformGroupManager(
+        hass, monitored_domains=["siren"], config_entry=config_entry
+    )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
@@ -13,6 +13,8 @@ plumbing.
 """
 
 import logging
+from collections.abc import Collection
+from functools import partial
 
 from homeassistant.components.group.switch import SwitchGroup as HASwitchGroup
 from homeassistant.config_entries import ConfigEntry
@@ -20,7 +22,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity_group import ExclusionConfig, NestedGroupMixin, build_nested_domain_groups
+from .entity_group import (
+    ExclusionConfig,
+    NestedGroupMixin,
+    RebuildScope,
+    async_rebuild_groups,
+    build_nested_domain_groups,
+)
 from .group_manager import PlatformGroupManager
 
 _LOGGER = logging.getLogger(__name__)
@@ -67,7 +75,7 @@ def _make_switch_group(
     """Idempotent factory — see light.py's _make_light_group for the full rationale."""
     existing = _SWITCH_GROUPS.get(unique_id)
     if existing is not None:
-        hass.async_create_task(existing.async_update_members(member_entity_ids))
+        existing.async_set_members(member_entity_ids)
         return existing
     group = SwitchGroup(
         hass,
@@ -105,28 +113,34 @@ async def async_setup_entry(
         async_add_entities(entities)
         _LOGGER.info("Created %d switch group entities", len(entities))
 
-    async def _rebuild(*_args) -> None:
-        before_ids = set(_SWITCH_GROUPS.keys())
-        new_groups = await build_nested_domain_groups(
-            hass, config_entry, exclusions, **build_kwargs
+    async def _rebuild(area_ids: Collection[str] | None = None) -> None:
+        exclusions = ExclusionConfig.from_config_entry(config_entry)
+        # See light.py's _rebuild for the scope.
+        scope = RebuildScope.for_areas(hass, area_ids) if area_ids else None
+        await async_rebuild_groups(
+            hass,
+            config_entry,
+            async_add_entities,
+            (_SWITCH_GROUPS,),
+            partial(
+                build_nested_domain_groups,
+                hass,
+                config_entry,
+                exclusions,
+                **build_kwargs,
+                scope=scope,
+                existing=_SWITCH_GROUPS,
+            ),
+            scope=scope,
         )
-        after_ids = {group.unique_id for group in new_groups}
-        to_add = [group for group in new_groups if group.unique_id not in before_ids]
-
-        for uid in before_ids - after_ids:
-            stale = _SWITCH_GROUPS.pop(uid)
-            hass.async_create_task(stale.async_remove(force_remove=True))
-
-        if to_add:
-            async_add_entities(to_add)
-            # See light.py's _rebuild for why this is needed here too.
-            from . import async_hide_group_entities_from_voice_assistants
 
-            await async_hide_group_entities_from_voice_assistants(hass, config_entry)
-
-    platform_manager = PlatformGroupManager(hass, monitored_domains=["switch"])
+    platform_manager = PlatformGroupManager(
+        hass, monitored_domains=["switch"], config_entry=config_entry
+    )
     platform_manager.register_callbacks(
-        startup_callback=_rebuild, update_callback=_rebuild
+        startup_callback=_rebuild,
+        update_callback=_rebuild,
+        options_callback=_rebuild,
     )
     unsubs = platform_manager.setup_listeners()
     for unsub in unsubs:
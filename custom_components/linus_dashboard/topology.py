@@ -0,0 +1,155 @@
+"""
+Cached device -> area, area -> (name, floor) and floor -> name topology.
+
+Every resolver used to go back to the device/area/floor registries for the
+same handful of facts on every scan: the device's area for each
+area-less entity, then the area's name and floor, then the floor's name —
+once per (domain, device_class) scan, again in every sensor.py builder.
+Those facts only change when the user edits a device, an area or a floor,
+so they're cached here and only ever invalidated by the matching
+*_registry_updated event, one entry at a time.
+
+Owned by registry_index.py's RegistryIndex (which needs device areas to
+place entities, and must see a device's new area before re-placing its
+entities) and shared by every resolver through async_get_topology().
+"""
+
+from dataclasses import dataclass, replace
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+)
+from homeassistant.helpers import (
+    device_registry as dr,
+)
+from homeassistant.helpers import (
+    floor_registry as fr,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AreaTopology:
+    """The area registry facts resolvers read."""
+
+    name: str
+    floor_id: str | None
+    # The area's configured "official" sensors, if any (see sensor.py's
+    # AREA_REGISTRY_SENSOR_ATTR) — same attribute names as AreaEntry's.
+    temperature_entity_id: str | None = None
+    humidity_entity_id: str | None = None
+
+    @classmethod
+    def from_area_entry(cls, area: ar.AreaEntry) -> "AreaTopology":
+        return cls(
+            name=area.name,
+            floor_id=area.floor_id,
+            temperature_entity_id=getattr(area, "temperature_entity_id", None),
+            humidity_entity_id=getattr(area, "humidity_entity_id", None),
+        )
+
+
+class TopologyCache:
+    """device_id -> area_id, area_id -> AreaTopology, floor_id -> name."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._device_areas: dict[str, str | None] = {}
+        self._areas: dict[str, AreaTopology] = {}
+        self._floors: dict[str, str] = {}
+        # Bumped on every area/floor change, so derived per-area caches
+        # (entity_group.py's ExclusionPredicate) know to drop theirs.
+        self.generation = 0
+
+    @callback
+    def async_build(self) -> None:
+        """Full build from the current registries — once, at setup."""
+        self._device_areas = {
+            device.id: device.area_id
+            for device in dr.async_get(self.hass).devices.values()
+        }
+        self._areas = {
+            area.id: AreaTopology.from_area_entry(area)
+            for area in ar.async_get(self.hass).async_list_areas()
+        }
+        self._floors = {
+            floor.floor_id: floor.name
+            for floor in fr.async_get(self.hass).async_list_floors()
+        }
+
+    # --- queries -----------------------------------------------------------
+
+    def device_area_id(self, device_id: str) -> str | None:
+        return self._device_areas.get(device_id)
+
+    def area(self, area_id: str) -> AreaTopology | None:
+        return self._areas.get(area_id)
+
+    def area_exists(self, area_id: str) -> bool:
+        return area_id in self._areas
+
+    def area_floor_id(self, area_id: str) -> str | None:
+        area = self._areas.get(area_id)
+        return area.floor_id if area else None
+
+    def floor_name(self, floor_id: str) -> str | None:
+        return self._floors.get(floor_id)
+
+    def floor_ids(self) -> list[str]:
+        return list(self._floors)
+
+    def areas_on_floor(self, floor_id: str) -> list[str]:
+        return [
+            area_id
+            for area_id, area in self._areas.items()
+            if area.floor_id == floor_id
+        ]
+
+    # --- invalidation ------------------------------------------------------
+
+    @callback
+    def async_device_updated(self, event: Event) -> bool:
+        """Apply a device_registry_updated event; True if its area changed."""
+        device_id = event.data.get("device_id")
+        if not device_id:
+            return False
+        old_area_id = self._device_areas.get(device_id)
+        if event.data.get("action") == "remove":
+            self._device_areas.pop(device_id, None)
+            return old_area_id is not None
+        device = dr.async_get(self.hass).async_get(device_id)
+        new_area_id = device.area_id if device else None
+        self._device_areas[device_id] = new_area_id
+        return new_area_id != old_area_id
+
+    @callback
+    def async_area_updated(self, event: Event) -> None:
+        area_id = event.data.get("area_id")
+        if not area_id:
+            return
+        self.generation += 1
+        if event.data.get("action") == "remove":
+            self._areas.pop(area_id, None)
+            return
+        area = ar.async_get(self.hass).async_get_area(area_id)
+        if area is not None:
+            self._areas[area_id] = AreaTopology.from_area_entry(area)
+
+    @callback
+    def async_floor_updated(self, event: Event) -> None:
+        floor_id = event.data.get("floor_id")
+        if floor_id is None:
+            return
+        self.generation += 1
+        if event.data.get("action") != "remove":
+            floor = fr.async_get(self.hass).async_get_floor(floor_id)
+            if floor is not None:
+                self._floors[floor_id] = floor.name
+            return
+        self._floors.pop(floor_id, None)
+        # HA clears floor_id on the floor's areas itself (each firing its own
+        # area_registry_updated), but dropping it here too keeps the cache
+        # consistent regardless of event ordering.
+        for area_id, area in self._areas.items():
+            if area.floor_id == floor_id:
+                self._areas[area_id] = replace(area, floor_id=None)
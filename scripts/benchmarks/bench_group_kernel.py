@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the fused group attribute kernel (aggregate.py).
+
+Times summarize_members — total, active members, winning state, icon and
+color in one pass — against the separate passes it replaced
+(compute_active_entity_ids, then compute_icon's observed set and
+temporary lists, then compute_color's walk over the members), for groups
+of 10, 100 and 1,000 members with roughly a third of them active.
+
+No Home Assistant instance is started: the kernel only reads the icon
+cache from hass.data, so a bare namespace stands in for hass.
+
+Usage (from the repository root, in the dev environment):
+    python3 scripts/benchmarks/bench_group_kernel.py [--number N]
+"""
+
+import argparse
+import sys
+import timeit
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from custom_components.linus_dashboard.aggregate import (  # noqa: E402
+    BINARY_SENSOR_COLORS,
+    DOMAIN_ACTIVE_STATES,
+    FALLBACK_ICON,
+    summarize_members,
+)
+from custom_components.linus_dashboard.const import DOMAIN  # noqa: E402
+
+SIZES = (10, 100, 1000)
+ICONS = {
+    "binary_sensor": {
+        "motion": {
+            "default": "mdi:motion-sensor-off",
+            "state": {"on": "mdi:motion-sensor"},
+        }
+    }
+}
+
+
+def separate_passes(hass, domain, entity_states, device_class):
+    """The pre-kernel sequence: one pass per attribute."""
+    active_states = DOMAIN_ACTIVE_STATES.get(domain, ["on"])
+    active_ids = [e for e, state in entity_states.items() if state in active_states]
+
+    observed = set(entity_states.values())
+    domain_icons = hass.data[DOMAIN]["icons"].get(domain, {})
+    dc_data = domain_icons.get(device_class or "_") or domain_icons.get("_") or {}
+    state_icons = dc_data.get("state", {})
+    default_icon = dc_data.get("default", FALLBACK_ICON)
+    active_observed = [s for s in active_states if s in observed]
+    if active_observed:
+        target = active_observed[0]
+    else:
+        inactive_observed = [s for s in observed if s not in active_states]
+        target = next((s for s in inactive_observed if s in state_icons), None)
+    icon = state_icons.get(target, default_icon) if target else default_icon
+
+    color_map = BINARY_SENSOR_COLORS.get(device_class, {"on": "grey"})
+    color = next(
+        (
+            color_map[state]
+            for state in entity_states.values()
+            if state in active_states and state in color_map
+        ),
+        "grey",
+    )
+    return len(entity_states), active_ids, icon, color
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing")
+    number = parser.parse_args().number
+
+    hass = SimpleNamespace(data={DOMAIN: {"icons": ICONS}})
+    print(f"{'members':>8} {'separate µs':>12} {'fused µs':>10} {'speedup':>8}")
+    for size in SIZES:
+        states = {
+            f"binary_sensor.m{i}": "on" if i % 3 == 0 else "off" for i in range(size)
+        }
+        args = (hass, "binary_sensor", states, "motion")
+        summary = summarize_members(*args)
+        assert (
+            summary.total,
+            summary.active_entity_ids,
+            summary.icon,
+            summary.color,
+        ) == (separate_passes(*args))
+        separate = min(
+            timeit.repeat(partial(separate_passes, *args), number=number, repeat=5)
+        )
+        fused = min(
+            timeit.repeat(partial(summarize_members, *args), number=number, repeat=5)
+        )
+        print(
+            f"{size:>8} {separate / number * 1e6:>12.2f} "
+            f"{fused / number * 1e6:>10.2f} {separate / fused:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
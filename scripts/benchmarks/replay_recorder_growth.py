@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Replay a synthetic day of group writes and measure recorder growth.
+
+Drives a global occupancy group (a binary_sensor device_class group over
+every motion/door sensor of the house) and the global health sensor
+through a day of member changes, and serializes every resulting state the
+way the recorder does (StateAttributes.shared_attrs_bytes_from_event):
+once recording every attribute, once leaving out the unrecorded ones the
+entity classes declare (GROUP_UNRECORDED_ATTRIBUTES, the health sensor's
+_unrecorded_attributes). Like the recorder, an attribute blob identical to
+one already stored is counted once.
+
+Usage (from the repository root, in the dev environment):
+    python3 scripts/benchmarks/replay_recorder_growth.py [--members N] [--seed S]
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from homeassistant.components.recorder.db_schema import (  # noqa: E402
+    StateAttributes,
+)
+from homeassistant.core import Event, State  # noqa: E402
+
+from custom_components.linus_dashboard.entity_group import (  # noqa: E402
+    GROUP_UNRECORDED_ATTRIBUTES,
+)
+from custom_components.linus_dashboard.sensor import (  # noqa: E402
+    MAX_UNAVAILABLE_ENTITY_IDS,
+    LinusDashboardHealthSensor,
+)
+
+DAY_SECONDS = 24 * 3600
+# Mean seconds between two changes of one motion/door sensor, by day/night.
+DAY_PERIOD, NIGHT_PERIOD = 600, 3600
+# Health: entities flapping to "unavailable" and back, per hour.
+FLAPS_PER_HOUR = 30
+HEALTH_TRACKED = 600
+
+
+class Recorder:
+    """States rows and deduplicated state_attributes bytes."""
+
+    def __init__(self, unrecorded: frozenset[str]) -> None:
+        self.unrecorded = unrecorded
+        self.rows = 0
+        self.attribute_bytes = 0
+        self._seen: set[bytes] = set()
+
+    def record(self, entity_id: str, state: str, attributes: dict) -> None:
+        new_state = State(
+            entity_id,
+            state,
+            attributes,
+            state_info={"unrecorded_attributes": self.unrecorded},
+        )
+        shared = StateAttributes.shared_attrs_bytes_from_event(
+            Event("state_changed", {"entity_id": entity_id, "new_state": new_state}),
+            None,
+        )
+        self.rows += 1
+        if shared not in self._seen:
+            self._seen.add(shared)
+            self.attribute_bytes += len(shared)
+
+
+def replay(members: int, seed: int) -> dict[str, tuple[Recorder, Recorder]]:
+    rng = random.Random(seed)  # noqa: S311
+    group_ids = [f"binary_sensor.motion_{i}" for i in range(members)]
+    health_ids = [f"sensor.entity_{i}" for i in range(HEALTH_TRACKED)]
+    events: list[tuple[float, str, str]] = []
+    for entity_id in group_ids:
+        now = 0.0
+        while True:
+            daytime = 7 * 3600 <= now % DAY_SECONDS < 23 * 3600
+            now += rng.expovariate(1 / (DAY_PERIOD if daytime else NIGHT_PERIOD))
+            if now >= DAY_SECONDS:
+                break
+            events.append((now, "group", entity_id))
+    for _ in range(24 * FLAPS_PER_HOUR):
+        events.append((rng.uniform(0, DAY_SECONDS), "health", rng.choice(health_ids)))
+    events.sort()
+
+    results = {
+        "group": (Recorder(frozenset()), Recorder(GROUP_UNRECORDED_ATTRIBUTES)),
+        "health": (
+            Recorder(frozenset()),
+            Recorder(LinusDashboardHealthSensor._unrecorded_attributes),
+        ),
+    }
+    active: dict[str, None] = {}
+    unavailable: dict[str, None] = {}
+    for _, target, entity_id in events:
+        if target == "group":
+            if entity_id in active:
+                del active[entity_id]
+            else:
+                active[entity_id] = None
+            state = "on" if active else "off"
+            attributes = {
+                "entity_id": group_ids,
+                "total": len(group_ids),
+                "active_entity_ids": list(active),
+                "icon": "mdi:motion-sensor" if active else "mdi:motion-sensor-off",
+                "color": "red" if active else "grey",
+                "device_class": "motion",
+                "friendly_name": "Maison Mouvement",
+            }
+            entity = "binary_sensor.linus_dashboard_motion_global"
+        else:
+            if entity_id in unavailable:
+                del unavailable[entity_id]
+            else:
+                unavailable[entity_id] = None
+            state = str(len(unavailable))
+            attributes = {
+                "entity_id": list(unavailable)[:MAX_UNAVAILABLE_ENTITY_IDS],
+                "total": len(unavailable),
+                "friendly_name": "Maison Indisponibles",
+            }
+            entity = "sensor.linus_dashboard_unavailable_global"
+        for recorder in results[target]:
+            recorder.record(entity, state, attributes)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--members", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    results = replay(args.members, args.seed)
+    print(f"{'entity':>8} {'rows':>7} {'all attrs KiB':>14} {'unrecorded KiB':>15}")
+    for name, (everything, trimmed) in results.items():
+        print(
+            f"{name:>8} {everything.rows:>7} "
+            f"{everything.attribute_bytes / 1024:>14.1f} "
+            f"{trimmed.attribute_bytes / 1024:>15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-device_class registry scans vs. one scan_all_buckets pass.
+
+Before scan_all_buckets, every platform discovered a domain's device_classes
+with one full entity-registry pass and then ran one more full pass per
+device_class (binary_sensor also ran four presence scans on top, cover and
+media_player a flat scan, sensor repeated the discover+scan pattern for its
+numeric aggregates). That's reproduced here as `legacy_*`, a faithful copy
+of the baseline full-registry walk, driven by the same call pattern the
+platforms used. `bucketed` is the current code: one scan_all_buckets call
+per platform, reading the shared RegistryIndex.
+
+Reported per entity count: registry passes (full walks of the entity
+registry for legacy, per-domain bucket walks for bucketed), candidate
+entities visited, and wall time for one full rebuild's worth of scans.
+
+Uses the test suite's FakeRegistries, so it needs the same environment as
+`pytest` (homeassistant installed), nothing more.
+
+Usage:
+    python3 scripts/benchmarks/scan_buckets.py [--sizes 500 2000 8000]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+from homeassistant.const import ATTR_ENTITY_ID  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import (  # noqa: E402
+    area_registry as ar,
+)
+from homeassistant.helpers import (  # noqa: E402
+    device_registry as dr,
+)
+from homeassistant.helpers import (  # noqa: E402
+    entity_registry as er,
+)
+from homeassistant.helpers import (  # noqa: E402
+    floor_registry as fr,
+)
+
+from custom_components.linus_dashboard.const import DOMAIN  # noqa: E402
+from custom_components.linus_dashboard.entity_group import (  # noqa: E402
+    ExclusionConfig,
+    scan_all_buckets,
+)
+from custom_components.linus_dashboard.registry_index import (  # noqa: E402
+    DATA_REGISTRY_INDEX,
+    RegistryIndex,
+)
+from tests.python.conftest import FakeRegistries, FakeStates  # noqa: E402
+
+DEVICE_CLASSES = {
+    "binary_sensor": [
+        "motion",
+        "presence",
+        "occupancy",
+        "door",
+        "window",
+        "smoke",
+        "moisture",
+    ],
+    "cover": ["shutter", "garage", "gate", "blind"],
+    "media_player": ["tv", "speaker", "receiver"],
+    "sensor": ["temperature", "humidity", "power", "energy", "illuminance"],
+    "light": [None],
+    "switch": [None],
+}
+
+
+class Counters:
+    """Registry scan passes and entities visited during one measurement."""
+
+    def __init__(self) -> None:
+        self.passes = 0
+        self.visits = 0
+
+
+def populate(size: int, seed: int = 0) -> tuple[FakeRegistries, FakeStates]:
+    rng = random.Random(seed)  # noqa: S311
+    registries = FakeRegistries()
+    states = FakeStates()
+    for floor in range(3):
+        registries.add_floor(f"floor_{floor}", f"Floor {floor}")
+    area_ids = [f"area_{n}" for n in range(max(4, size // 40))]
+    for n, area_id in enumerate(area_ids):
+        registries.add_area(area_id, area_id, floor_id=f"floor_{n % 3}")
+    domains = list(DEVICE_CLASSES)
+    for n in range(size):
+        domain = rng.choice(domains)
+        entity_id = f"{domain}.e{n}"
+        registries.add_entity(
+            entity_id,
+            area_id=rng.choice(area_ids),
+            device_class=rng.choice(DEVICE_CLASSES[domain]),
+        )
+        states.set(entity_id, "21.5" if domain == "sensor" else "off")
+    return registries, states
+
+
+# --- baseline: one full entity-registry walk per scan ---------------------
+
+
+def legacy_scan(hass, domain, device_class, exclusions, counters) -> dict:
+    entity_reg = er.async_get(hass)
+    device_reg = dr.async_get(hass)
+    area_reg = ar.async_get(hass)
+    fr.async_get(hass)
+    area_entities: dict[str, list[str]] = {}
+    counters.passes += 1
+    for entity in entity_reg.entities.values():
+        counters.visits += 1
+        if entity.platform == DOMAIN or entity.domain != domain:
+            continue
+        if entity.disabled_by or entity.hidden_by:
+            continue
+        if entity.entity_id in exclusions.excluded_entity_ids:
+            continue
+        state_obj = hass.states.get(entity.entity_id)
+        if not state_obj or ATTR_ENTITY_ID in state_obj.attributes:
+            continue
+        entity_dc = entity.device_class or entity.original_device_class
+        if device_class is not None and entity_dc != device_class:
+            continue
+        area_id = entity.area_id
+        if not area_id and entity.device_id:
+            device = device_reg.async_get(entity.device_id)
+            area_id = device.area_id if device else None
+        if not area_id or not area_reg.async_get_area(area_id):
+            continue
+        area_entities.setdefault(area_id, []).append(entity.entity_id)
+    return area_entities
+
+
+def legacy_discover(hass, domain, counters) -> set[str]:
+    counters.passes += 1
+    found = set()
+    for entity in er.async_get(hass).entities.values():
+        counters.visits += 1
+        if entity.domain == domain and entity.platform != DOMAIN:
+            device_class = entity.device_class or entity.original_device_class
+            if device_class:
+                found.add(device_class)
+    return found
+
+
+def legacy_rebuild(hass, exclusions, counters) -> None:
+    """The scan calls one full rebuild of every platform used to make."""
+    # binary_sensor: four presence scans, then discover + one per class.
+    for device_class in ("motion", "presence", "occupancy"):
+        legacy_scan(hass, "binary_sensor", device_class, exclusions, counters)
+    legacy_scan(hass, "media_player", None, exclusions, counters)
+    for device_class in legacy_discover(hass, "binary_sensor", counters):
+        legacy_scan(hass, "binary_sensor", device_class, exclusions, counters)
+    # cover/media_player: flat scan, then discover + one per class.
+    for domain in ("cover", "media_player"):
+        legacy_scan(hass, domain, None, exclusions, counters)
+        for device_class in legacy_discover(hass, domain, counters):
+            legacy_scan(hass, domain, device_class, exclusions, counters)
+    # sensor numeric aggregates: discover + one per class.
+    for device_class in legacy_discover(hass, "sensor", counters):
+        legacy_scan(hass, "sensor", device_class, exclusions, counters)
+    # light/switch: one flat scan each.
+    for domain in ("light", "switch"):
+        legacy_scan(hass, domain, None, exclusions, counters)
+
+
+# --- current: one scan_all_buckets call per platform ----------------------
+
+
+def bucketed_rebuild(hass, exclusions, counters) -> None:
+    index: RegistryIndex = hass.data[DOMAIN][DATA_REGISTRY_INDEX]
+    walk = index.iter_domain_buckets
+
+    def counting_walk(domain, area_ids=None):
+        counters.passes += 1
+        for bucket in walk(domain, area_ids):
+            counters.visits += len(bucket[2])
+            yield bucket
+
+    index.iter_domain_buckets = counting_walk
+    try:
+        for domains in (
+            ("binary_sensor", "media_player"),
+            ("cover",),
+            ("media_player",),
+            ("sensor",),
+            ("light",),
+            ("switch",),
+        ):
+            scan_all_buckets(hass, exclusions, domains=domains)
+    finally:
+        index.iter_domain_buckets = walk
+
+
+def measure(rebuild, hass, exclusions, repeat: int) -> tuple[Counters, float]:
+    counters = Counters()
+    rebuild(hass, exclusions, counters)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rebuild(hass, exclusions, Counters())
+    return counters, (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    exclusions = ExclusionConfig()
+    print(
+        f"{'entities':>8}  {'variant':<9} {'passes':>6} {'visits':>9} {'ms/rebuild':>11}"
+    )
+    for size in args.sizes:
+        registries, states = populate(size)
+        er.async_get = lambda _hass, r=registries: r.entity_registry()
+        dr.async_get = lambda _hass, r=registries: r.device_registry()
+        ar.async_get = lambda _hass, r=registries: r.area_registry()
+        fr.async_get = lambda _hass, r=registries: r.floor_registry()
+
+        hass = MagicMock(spec=HomeAssistant)
+        hass.states = states
+        hass.loop = loop
+        index = RegistryIndex(hass)
+        index.async_build()
+        hass.data = {DOMAIN: {DATA_REGISTRY_INDEX: index}}
+
+        for name, rebuild in (
+            ("legacy", legacy_rebuild),
+            ("bucketed", bucketed_rebuild),
+        ):
+            counters, ms = measure(rebuild, hass, exclusions, args.repeat)
+            print(
+                f"{size:>8}  {name:<9} {counters.passes:>6} "
+                f"{counters.visits:>9} {ms:>11.2f}"
+            )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import { DEVICE_CLASSES, LINUS_BRAIN_DOMAIN, LINUS_DASHBOARD_DOMAIN, MAGIC_AREAS
 import { getEntityDomain, getGlobalEntitiesExceptUndisclosed, getMAEntity, getMagicAreaSlug, groupEntitiesByDomain, slugify } from "./utils";
 import { createDomainTag } from "./utils/domainTagHelper";
 import { IconResources } from "./types/homeassistant/data/frontend";
+import { HomeAssistant } from "./types/homeassistant/types";
 import { LinusDashboardConfig } from "./types/homeassistant/data/linus_dashboard";
 import { LabelRegistryEntry } from "./types/homeassistant/data/label_registry";
 import { PerformanceProfiler } from "./utils/performanceProfiler";
@@ -189,6 +190,16 @@ class Helper {
    */
   static #linus_dashboard_config: LinusDashboardConfig;
 
+  /**
+   * Member lists of Linus Dashboard groups, fetched from
+   * linus_dashboard/group_members when compact_group_attributes leaves them
+   * out of the groups' state.
+   *
+   * @type {Record<string, string[]>}
+   * @private
+   */
+  static #groupMembers: Record<string, string[]> = {};
+
   /**
    * Per-domain active-state configuration used by getIcon() Path B.
    * Defines which states count as "active" (show on-icon) for aggregate chips.
@@ -1057,6 +1068,15 @@ class Helper {
       }
     })();
 
+    // Compact groups publish counts only: fetch the member lists the
+    // strategy reads (area presence groups) while building.
+    if (linus_dashboard_config.compact_group_attributes) {
+      await this.#fetchGroupMembers(
+        info.hass,
+        Object.keys(this.#areas).map(slug => `binary_sensor.linus_dashboard_presence_detection_area_${slug}`)
+      );
+    }
+
     this.#initialized = true;
 
     PerformanceProfiler.end(perfKey);
@@ -1429,6 +1449,40 @@ class Helper {
     return this.#hassStates[entity_id]!;
   }
 
+  /**
+   * Get a group's member entity ids: its entity_id attribute, or the list
+   * fetched from linus_dashboard/group_members when the group is compact.
+   *
+   * @return {string[]}
+   */
+  static getGroupMembers(entity_id: string): string[] {
+    const members = this.#hassStates[entity_id]?.attributes?.entity_id;
+    if (Array.isArray(members)) return members;
+    return this.#groupMembers[entity_id] ?? [];
+  }
+
+  /**
+   * Fetch the member lists of the given groups (those that exist) from
+   * linus_dashboard/group_members.
+   *
+   * @private
+   */
+  static async #fetchGroupMembers(hass: HomeAssistant, entityIds: string[]): Promise<void> {
+    const existing = entityIds.filter(entity_id => this.#hassStates[entity_id]);
+    try {
+      const pages = await Promise.all(existing.map(entity_id => hass.callWS<{ members: { entity_id: string }[] }>({
+        type: "linus_dashboard/group_members",
+        entity_id,
+        limit: 1000,
+      })));
+      existing.forEach((entity_id, index) => {
+        this.#groupMembers[entity_id] = pages[index]!.members.map(member => member.entity_id);
+      });
+    } catch (e) {
+      Helper.logError('Fetching group members failed', e);
+    }
+  }
+
   /**
    * Whether a light entity currently reports a color mode beyond plain
    * on/off (brightness, color, color temp, ...). A light-brightness tile
@@ -117,8 +117,9 @@ class AggregateChip extends AbstractChip {
     if (aggregateSource) {
       // Server-side aggregate: trivial single-entity template reads.
       // Dedicated group entities (light.py/switch.py/.../binary_sensor.py)
-      // report the count via the active_entity_ids attribute (their own
-      // state is on/off, not a number) — the generic hidden counting
+      // report the count via the active_count attribute (their own state
+      // is on/off, not a number), or active_entity_ids on backends
+      // predating it — the generic hidden counting
       // sensor's own state IS the count. Same icon/color attribute either
       // way (both come from aggregate.py's compute_group_attributes /
       // compute_icon / compute_color).
@@ -129,7 +130,7 @@ class AggregateChip extends AbstractChip {
 
       if (config.show_content) {
         const countExpr = isDedicatedGroup
-          ? `state_attr('${sensorId}', 'active_entity_ids') | count`
+          ? `(state_attr('${sensorId}', 'active_count') or (state_attr('${sensorId}', 'active_entity_ids') or []) | count)`
           : `states('${sensorId}') | int(0)`;
         this.#defaultConfig.content = `{% set count = ${countExpr} %}{% if count > 0 %}{{ count }}{% endif %}`;
       }
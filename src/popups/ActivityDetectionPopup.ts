@@ -187,16 +187,9 @@ class ActivityDetectionPopup extends AbstractPopup {
         // safety net this always relied on: entities that don't match the
         // standard device_class filters above but still feed presence).
         const presenceGroupEntity = `binary_sensor.linus_dashboard_presence_detection_area_${area_slug}`;
-        const presenceGroupState = Helper.getEntityState(presenceGroupEntity);
-        const groupMemberEntities: string[] = [];
-
-        if (presenceGroupState?.attributes?.entity_id) {
-            // Add group members to the list
-            const members = presenceGroupState.attributes.entity_id;
-            if (Array.isArray(members)) {
-                groupMemberEntities.push(...members);
-            }
-        }
+        // (Its entity_id attribute, or the members fetched over websocket
+        // when compact_group_attributes leaves that out.)
+        const groupMemberEntities = Helper.getGroupMembers(presenceGroupEntity);
 
         // Combine all entities and remove duplicates
         // Group members are included to ensure all presence sensors appear
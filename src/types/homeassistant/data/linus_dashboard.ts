@@ -22,5 +22,6 @@ export interface LinusDashboardConfig {
     excluded_device_classes?: string[];
     excluded_integrations?: string[];
     embedded_dashboards?: EmbeddedDashboardConfig[];
+    compact_group_attributes?: boolean; // member lists via linus_dashboard/group_members
     debug?: boolean;
 }
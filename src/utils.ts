@@ -747,10 +747,10 @@ export function addLightGroupsToEntities(area: generic.StrategyArea, entities: g
 
     for (const lightGroup of lightGroups) {
         if (!lightGroup) continue;
-        const lightGroupState = Helper.getEntityState(lightGroup.entity_id);
-        if (lightGroupState.attributes.entity_id?.length) {
+        const members = Helper.getGroupMembers(lightGroup.entity_id);
+        if (members.length) {
             entities.unshift(lightGroup as generic.StrategyEntity);
-            lightGroupState.attributes.entity_id.forEach((entity_id: string) => {
+            members.forEach((entity_id: string) => {
                 const index = entities.findIndex(entity => entity.entity_id === entity_id);
                 if (index !== -1) {
                     entities.splice(index, 1);
@@ -13,6 +13,7 @@ by manual live testing against the ha-test fixture.
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -63,3 +64,102 @@ def mock_config_entry():
     entry.entry_id = "test_entry"
     entry.options = {}
     return entry
+
+
+class FakeRegistries:
+    """
+    Minimal stand-ins for the entity/device/area/floor registries.
+
+    Entries are plain SimpleNamespace objects carrying only the fields the
+    scanning code reads — the real RegistryEntry/DeviceEntry/AreaEntry
+    classes need far more constructor arguments than these tests care about.
+    Installed over each registry module's own async_get() by the
+    `fake_registries` fixture, so production code calling er.async_get(hass)
+    etc. transparently gets these.
+    """
+
+    def __init__(self) -> None:
+        self.entities: dict[str, SimpleNamespace] = {}
+        self.devices: dict[str, SimpleNamespace] = {}
+        self.areas: dict[str, SimpleNamespace] = {}
+        self.floors: dict[str, SimpleNamespace] = {}
+
+    def add_entity(
+        self,
+        entity_id: str,
+        *,
+        area_id: str | None = None,
+        device_id: str | None = None,
+        device_class: str | None = None,
+        platform: str = "demo",
+        hidden_by: str | None = None,
+        disabled_by: str | None = None,
+    ) -> SimpleNamespace:
+        entry = SimpleNamespace(
+            entity_id=entity_id,
+            domain=entity_id.split(".", maxsplit=1)[0],
+            area_id=area_id,
+            device_id=device_id,
+            device_class=None,
+            original_device_class=device_class,
+            platform=platform,
+            hidden_by=hidden_by,
+            disabled_by=disabled_by,
+        )
+        self.entities[entity_id] = entry
+        return entry
+
+    def add_device(self, device_id: str, *, area_id: str | None = None) -> None:
+        self.devices[device_id] = SimpleNamespace(id=device_id, area_id=area_id)
+
+    def add_area(self, area_id: str, name: str, floor_id: str | None = None) -> None:
+        self.areas[area_id] = SimpleNamespace(id=area_id, name=name, floor_id=floor_id)
+
+    def add_floor(self, floor_id: str, name: str) -> None:
+        self.floors[floor_id] = SimpleNamespace(floor_id=floor_id, name=name)
+
+    # --- registry-shaped accessors -----------------------------------------
+
+    def entity_registry(self) -> SimpleNamespace:
+        return SimpleNamespace(entities=self.entities, async_get=self.entities.get)
+
+    def device_registry(self) -> SimpleNamespace:
+        return SimpleNamespace(devices=self.devices, async_get=self.devices.get)
+
+    def area_registry(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            areas=self.areas,
+            async_get_area=self.areas.get,
+            async_list_areas=lambda: list(self.areas.values()),
+        )
+
+    def floor_registry(self) -> SimpleNamespace:
+        return SimpleNamespace(
+            floors=self.floors,
+            async_get_floor=self.floors.get,
+            async_list_floors=lambda: list(self.floors.values()),
+        )
+
+
+@pytest.fixture
+def fake_registries(monkeypatch) -> FakeRegistries:
+    """Route er/dr/ar/fr.async_get(hass) to one shared FakeRegistries."""
+    from homeassistant.helpers import (
+        area_registry as ar,
+    )
+    from homeassistant.helpers import (
+        device_registry as dr,
+    )
+    from homeassistant.helpers import (
+        entity_registry as er,
+    )
+    from homeassistant.helpers import (
+        floor_registry as fr,
+    )
+
+    registries = FakeRegistries()
+    monkeypatch.setattr(er, "async_get", lambda _hass: registries.entity_registry())
+    monkeypatch.setattr(dr, "async_get", lambda _hass: registries.device_registry())
+    monkeypatch.setattr(ar, "async_get", lambda _hass: registries.area_registry())
+    monkeypatch.setattr(fr, "async_get", lambda _hass: registries.floor_registry())
+    return registries
@@ -10,13 +10,18 @@ icons.json files use.
 """
 
 from custom_components.linus_dashboard.aggregate import (
+    ActiveMemberTracker,
+    NumericPartials,
     compute_active_count,
     compute_active_entity_ids,
     compute_color,
     compute_icon,
+    compute_icon_for_states,
     compute_numeric_aggregate,
+    domain_profiles,
     resolve_device_class_name,
     resolve_numeric_aggregation_mode,
+    summarize_members,
 )
 from custom_components.linus_dashboard.const import DOMAIN
 
@@ -208,6 +213,55 @@ def test_compute_color_picks_first_matching_active_state():
     assert compute_color("climate", None, states) == "deep-orange"
 
 
+def test_domain_profiles_compile_once_per_icon_cache(mock_hass):
+    set_icon_cache(
+        mock_hass,
+        {"climate": {"_": {"default": "mdi:thermostat", "state": {"off": "mdi:off"}}}},
+    )
+    profiles = domain_profiles(mock_hass)
+    assert domain_profiles(mock_hass) is profiles
+
+    assert compute_icon_for_states(mock_hass, "climate", {"off"}) == "mdi:off"
+
+    # A refreshed icon cache recompiles the tables.
+    set_icon_cache(mock_hass, {"climate": {"_": {"default": "mdi:hvac"}}})
+    assert domain_profiles(mock_hass) is not profiles
+    assert compute_icon_for_states(mock_hass, "climate", {"off"}) == "mdi:hvac"
+
+
+def test_color_follows_the_first_active_member_not_the_icons_winner(mock_hass):
+    states = {"climate.a": "off", "climate.b": "cool", "climate.c": "heat"}
+
+    summary = summarize_members(mock_hass, "climate", states)
+
+    # heat outranks cool for the icon; the color is the first active member's.
+    assert summary.winner == "heat"
+    assert summary.color == compute_color("climate", None, states) == "blue"
+
+
+def test_summarize_members_agrees_with_each_helper(mock_hass):
+    set_icon_cache(
+        mock_hass,
+        {"media_player": {"_": {"default": "mdi:cast", "state": {"off": "mdi:off"}}}},
+    )
+    states = {
+        "media_player.a": "off",
+        "media_player.b": "paused",
+        "media_player.c": "on",
+    }
+
+    summary = summarize_members(mock_hass, "media_player", states)
+
+    assert summary.total == 3
+    assert summary.active_entity_ids == compute_active_entity_ids(
+        states, "media_player"
+    )
+    assert summary.active_count == compute_active_count(states, "media_player")
+    assert summary.winner == "paused"
+    assert summary.icon == compute_icon(mock_hass, "media_player", states)
+    assert summary.color == compute_color("media_player", None, states) == "grey"
+
+
 def test_compute_color_defaults_to_grey_when_nothing_active():
     states = {"light.a": "off"}
     assert compute_color("light", None, states) == "grey"
@@ -246,3 +300,81 @@ def test_compute_numeric_aggregate_average():
 
 def test_compute_numeric_aggregate_empty_list_returns_none():
     assert compute_numeric_aggregate([], "sum") is None
+
+
+def test_merged_partials_weight_the_average_by_underlying_sensors():
+    salon = NumericPartials.from_values([19.0, 21.0, 23.0])
+    cuisine = NumericPartials.from_values([25.0])
+    floor = NumericPartials()
+    for child in (salon, NumericPartials(), cuisine):
+        floor.merge(NumericPartials.from_dict(child.as_dict()))
+
+    # Not (21 + 25) / 2: the average of all four sensors.
+    assert floor.value("average") == 22.0
+    assert floor.value("sum") == 88.0
+    assert (floor.value("min"), floor.maximum) == (19.0, 25.0)
+    assert floor.sumsq == 19.0**2 + 21.0**2 + 23.0**2 + 25.0**2
+    assert NumericPartials().value("average") is None
+    assert NumericPartials.from_dict({"sum": 1.0}) is None
+
+
+def test_partials_with_bad_min_or_max_merge_as_empty():
+    floor = NumericPartials.from_values([20.0])
+    for data in (
+        {"sum": 5.0, "count": 1, "min": None, "max": None, "sumsq": 25.0},
+        {"sum": 5.0, "count": 1, "min": "low", "max": 5.0, "sumsq": 25.0},
+        {"sum": 5.0, "count": 1, "min": 5.0, "max": [5.0], "sumsq": 25.0},
+    ):
+        child = NumericPartials.from_dict(data)
+        assert child == NumericPartials()
+        floor.merge(child)
+
+    child = NumericPartials.from_dict({
+        "sum": 30.0,
+        "count": 2,
+        "min": "10",
+        "max": 20,
+        "sumsq": 500.0,
+    })
+    assert (child.minimum, child.maximum) == (10.0, 20.0)
+    floor.merge(child)
+    assert floor.count == 3
+    assert (floor.minimum, floor.maximum) == (10.0, 20.0)
+
+
+def test_tracker_applies_events_incrementally_in_member_order():
+    states = {"climate.a": "heat", "climate.b": "off", "climate.c": "unavailable"}
+    tracker = ActiveMemberTracker("climate")
+    tracker.recount(["climate.a", "climate.b", "climate.c"], states)
+    assert tracker.active_entity_ids() == ["climate.a"]
+    assert set(tracker.observed_states) == {"heat", "off"}
+
+    assert tracker.update("climate.c", "cool")
+    assert tracker.update("climate.a", "off")
+    assert tracker.update("climate.b", "cool")
+    assert not tracker.update("climate.elsewhere", "heat")
+
+    assert tracker.active_entity_ids() == ["climate.b", "climate.c"]
+    assert set(tracker.observed_states) == {"off", "cool"}
+    assert tracker.active_states_by_id() == {"climate.b": "cool", "climate.c": "cool"}
+
+    tracker.update("climate.b", None)
+    tracker.update("climate.c", "unknown")
+    assert tracker.active_count == 0
+    assert set(tracker.observed_states) == {"off"}
+
+
+def test_tracker_matches_a_full_recompute():
+    members = [f"light.l{i}" for i in range(6)]
+    final = {"light.l0": "on", "light.l2": "on", "light.l3": "off", "light.l5": "on"}
+    tracker = ActiveMemberTracker("light")
+    tracker.recount(members, {})
+    for entity_id in reversed(members):
+        tracker.update(entity_id, "on")
+    for entity_id in members:
+        tracker.update(entity_id, final.get(entity_id))
+
+    assert tracker.active_entity_ids() == compute_active_entity_ids(final, "light")
+    assert compute_color("light", None, tracker.active_states_by_id()) == (
+        compute_color("light", None, final)
+    )
@@ -1,11 +1,26 @@
-"""Unit tests for entity_group.py's exclusion parsing and group-attribute helpers."""
+"""Unit tests for entity_group.py's exclusion parsing, scanning and group-attribute helpers."""
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.linus_dashboard import entity_group
 from custom_components.linus_dashboard.const import DOMAIN
 from custom_components.linus_dashboard.entity_group import (
+    GLOBAL_SCOPE,
     ExclusionConfig,
+    ExclusionReason,
+    RebuildScope,
+    async_get_exclusion_predicate,
+    build_nested_device_class_groups,
     compute_group_attributes,
     domain_is_excluded,
     mean_float,
+    scan_all_buckets,
+)
+from custom_components.linus_dashboard.registry_index import (
+    DATA_REGISTRY_INDEX,
+    RegistryIndex,
 )
 
 
@@ -105,3 +120,515 @@ def test_compute_group_attributes_missing_member_state_is_skipped_not_errored(
     )
     assert attrs["active_entity_ids"] == []
     assert attrs["total"] == 1
+
+
+def _house(mock_hass, fake_registries, fake_states) -> None:
+    """Two floors, three areas, binary_sensors of two device_classes plus lights."""
+    fake_registries.add_floor("rdc", "Rez-de-chaussée")
+    fake_registries.add_floor("etage", "Étage")
+    fake_registries.add_area("salon", "Salon", floor_id="rdc")
+    fake_registries.add_area("cuisine", "Cuisine", floor_id="rdc")
+    fake_registries.add_area("chambre", "Chambre", floor_id="etage")
+    for entity_id, area_id, device_class in (
+        ("binary_sensor.salon_motion", "salon", "motion"),
+        ("binary_sensor.salon_door", "salon", "door"),
+        ("binary_sensor.cuisine_motion", "cuisine", "motion"),
+        ("binary_sensor.chambre_window", "chambre", "window"),
+        ("light.salon", "salon", None),
+    ):
+        fake_registries.add_entity(
+            entity_id, area_id=area_id, device_class=device_class
+        )
+        fake_states.set(entity_id, "off")
+    index = RegistryIndex(mock_hass)
+    index.async_build()
+    mock_hass.data[DOMAIN] = {DATA_REGISTRY_INDEX: index}
+
+
+def test_scan_all_buckets_returns_every_device_class_slice_and_flat_bucket(
+    mock_hass, fake_registries, fake_states
+):
+    _house(mock_hass, fake_registries, fake_states)
+
+    buckets = scan_all_buckets(
+        mock_hass, ExclusionConfig(), domains=("binary_sensor", "light")
+    )
+
+    assert sorted(buckets.device_classes("binary_sensor")) == [
+        "door",
+        "motion",
+        "window",
+    ]
+    motion = buckets.get("binary_sensor", "motion")
+    assert motion.area_entities == {
+        "salon": ["binary_sensor.salon_motion"],
+        "cuisine": ["binary_sensor.cuisine_motion"],
+    }
+    assert motion.floor_areas == {"rdc": ["salon", "cuisine"]}
+    assert motion.floor_names == {"rdc": "Rez-de-chaussée"}
+
+    flat = buckets.get("binary_sensor")
+    assert sorted(flat.area_entities["salon"]) == [
+        "binary_sensor.salon_door",
+        "binary_sensor.salon_motion",
+    ]
+    assert set(flat.floor_areas) == {"rdc", "etage"}
+    assert buckets.get("light").area_entities == {"salon": ["light.salon"]}
+    # Domains not asked for aren't scanned at all.
+    assert buckets.get("switch").area_entities == {}
+
+
+def test_scan_all_buckets_applies_exclusions_once_across_slices(
+    mock_hass, fake_registries, fake_states
+):
+    _house(mock_hass, fake_registries, fake_states)
+
+    buckets = scan_all_buckets(
+        mock_hass,
+        ExclusionConfig(
+            excluded_device_classes={"door"},
+            excluded_area_ids={"cuisine"},
+            excluded_floor_ids={"etage"},
+        ),
+        domains=("binary_sensor",),
+    )
+
+    assert "door" not in buckets.device_classes("binary_sensor")
+    assert buckets.get("binary_sensor", "door").area_entities == {}
+    assert buckets.get("binary_sensor").area_entities == {
+        "salon": ["binary_sensor.salon_motion"],
+        "chambre": ["binary_sensor.chambre_window"],
+    }
+    # An excluded floor only drops the floor tier, not its areas.
+    window = buckets.get("binary_sensor", "window")
+    assert window.area_entities == {"chambre": ["binary_sensor.chambre_window"]}
+    assert window.floor_areas == {}
+
+
+def test_exclusion_predicate_caches_verdicts_and_reuses_them(
+    mock_hass, fake_registries, fake_states
+):
+    _house(mock_hass, fake_registries, fake_states)
+    index = mock_hass.data[DOMAIN][DATA_REGISTRY_INDEX]
+    exclusions = ExclusionConfig(excluded_entity_ids={"light.salon"})
+    predicate = async_get_exclusion_predicate(mock_hass, exclusions)
+
+    assert predicate.verdict(index.get("light.salon")) == ExclusionReason.ENTITY
+    assert predicate.excludes(index.get("binary_sensor.salon_door")) is False
+
+    # Same options from another platform: same predicate, warm cache.
+    same = ExclusionConfig(excluded_entity_ids={"light.salon"})
+    assert async_get_exclusion_predicate(mock_hass, same) is predicate
+    assert set(predicate._entity_verdicts) == {
+        "light.salon",
+        "binary_sensor.salon_door",
+    }
+
+
+def test_exclusion_predicate_options_change_drops_only_affected_verdicts(
+    mock_hass, fake_registries, fake_states
+):
+    _house(mock_hass, fake_registries, fake_states)
+    index = mock_hass.data[DOMAIN][DATA_REGISTRY_INDEX]
+    predicate = async_get_exclusion_predicate(mock_hass, ExclusionConfig())
+    for entity_id in ("light.salon", "binary_sensor.salon_door"):
+        predicate.verdict(index.get(entity_id))
+    door_verdict = predicate._entity_verdicts["binary_sensor.salon_door"]
+
+    async_get_exclusion_predicate(
+        mock_hass, ExclusionConfig(excluded_entity_ids={"light.salon"})
+    )
+
+    assert "light.salon" not in predicate._entity_verdicts
+    assert predicate._entity_verdicts["binary_sensor.salon_door"] is door_verdict
+    assert predicate.excludes(index.get("light.salon")) is True
+
+
+def test_exclusion_predicate_follows_registry_and_floor_changes(
+    mock_hass, fake_registries, fake_states
+):
+    _house(mock_hass, fake_registries, fake_states)
+    index = mock_hass.data[DOMAIN][DATA_REGISTRY_INDEX]
+    predicate = async_get_exclusion_predicate(
+        mock_hass,
+        ExclusionConfig(excluded_device_ids={"dev1"}, excluded_floor_ids={"etage"}),
+    )
+    assert predicate.excludes(index.get("light.salon")) is False
+
+    # Registry edit: the entity gets attached to an excluded device.
+    fake_registries.entities["light.salon"].device_id = "dev1"
+    index._async_entity_registry_updated(
+        SimpleNamespace(data={"action": "update", "entity_id": "light.salon"})
+    )
+    assert predicate.verdict(index.get("light.salon")) == ExclusionReason.DEVICE
+
+    # Area moved onto an excluded floor: FLOOR only, so scans keep it.
+    fake_registries.areas["cuisine"].floor_id = "etage"
+    index._async_area_registry_updated(
+        SimpleNamespace(data={"action": "update", "area_id": "cuisine"})
+    )
+    motion = index.get("binary_sensor.cuisine_motion")
+    assert predicate.verdict(motion) == ExclusionReason.FLOOR
+    assert predicate.excludes(motion) is False
+
+
+class _FakeGroup:
+    """Just the surface apply_group_plan and async_rebuild_groups read."""
+
+    def __init__(self, unique_id: str, members: list[str]) -> None:
+        self.unique_id = unique_id
+        self.entity_id = f"binary_sensor.{unique_id}"
+        self.group_scope = GLOBAL_SCOPE
+        self.members = list(members)
+
+    @property
+    def member_fingerprint(self) -> frozenset[str]:
+        return frozenset(self.members)
+
+    def async_set_members(self, members: list[str]) -> bool:
+        self.members = list(members)
+        return True
+
+
+def _recording_factory(registry: dict, calls: list):
+    def _factory(hass, unique_id, _key, _placeholders, _info, members, _dc):
+        calls.append(unique_id)
+        registry[unique_id] = _FakeGroup(unique_id, members)
+        return registry[unique_id]
+
+    return _factory
+
+
+def test_targeted_rebuild_only_touches_moved_areas_their_floors_and_global(
+    mock_hass, mock_config_entry, fake_registries, fake_states, monkeypatch
+):
+    _house(mock_hass, fake_registries, fake_states)
+    monkeypatch.setattr(entity_group, "ensure_area_device_placed", lambda *a: None)
+    index = mock_hass.data[DOMAIN][DATA_REGISTRY_INDEX]
+    moves = []
+    index.async_add_listener(lambda domain, areas: moves.append((domain, areas)))
+    registry: dict = {}
+    calls: list[str] = []
+    factory = _recording_factory(registry, calls)
+
+    def build(scope=None):
+        return asyncio.run(
+            build_nested_device_class_groups(
+                mock_hass,
+                mock_config_entry,
+                ExclusionConfig(),
+                domain="binary_sensor",
+                unique_id_prefix="ld",
+                entity_factory=factory,
+                scope=scope,
+                existing=registry,
+            )
+        )
+
+    build()
+    fake_registries.entities["binary_sensor.cuisine_motion"].area_id = "chambre"
+    index._async_entity_registry_updated(
+        SimpleNamespace(
+            data={"action": "update", "entity_id": "binary_sensor.cuisine_motion"}
+        )
+    )
+    assert moves == [("binary_sensor", frozenset({"cuisine", "chambre"}))]
+
+    calls.clear()
+    scope = RebuildScope.for_areas(mock_hass, moves[0][1])
+    rebuilt = {group.unique_id for group in build(scope)}
+
+    # Nothing in the salon was rebuilt, but the floor still nests it.
+    assert not [uid for uid in calls if "_area_salon" in uid]
+    assert registry["ld_motion_floor_rdc"].members == [
+        "binary_sensor.ld_motion_area_salon"
+    ]
+    assert registry["ld_motion_floor_etage"].members == [
+        "binary_sensor.ld_motion_area_chambre"
+    ]
+    # The emptied cuisine group is in scope but no longer built: stale.
+    assert scope.covers(("area", "cuisine"))
+    assert "ld_motion_area_cuisine" not in rebuilt
+    assert scope.covers(registry["ld_motion_area_cuisine"].group_scope)
+
+
+def test_set_members_skips_unchanged_set_and_resubscribes_only_the_diff(
+    mock_hass, fake_states, monkeypatch
+):
+    from custom_components.linus_dashboard.switch import SwitchGroup
+
+    unsubs: dict[str, MagicMock] = {}
+
+    def subscribe(entity_id, _action):
+        unsubs[entity_id] = MagicMock()
+        return unsubs[entity_id]
+
+    dispatcher = SimpleNamespace(async_subscribe=subscribe)
+    monkeypatch.setattr(
+        entity_group, "async_get_state_dispatcher", lambda _hass: dispatcher
+    )
+    fake_states.set("switch.a", "on")
+    fake_states.set("switch.b", "off")
+    fake_states.set("switch.c", "on")
+    group = SwitchGroup(mock_hass, "test_switches", None, None, {}, ["switch.a"])
+    group.async_write_ha_state = MagicMock()
+    # Not added to hass yet: the member list changes, nothing is subscribed.
+    assert group.async_set_members(["switch.a", "switch.b"])
+    assert unsubs == {}
+
+    asyncio.run(group.async_added_to_hass())
+    assert set(unsubs) == {"switch.a", "switch.b"}
+
+    # Same set, different order: nothing to do at all.
+    assert not group.async_set_members(["switch.b", "switch.a"])
+    group.async_write_ha_state.assert_not_called()
+
+    assert group.async_set_members(["switch.b", "switch.c"])
+    unsubs["switch.a"].assert_called_once()
+    unsubs["switch.b"].assert_not_called()
+    assert set(unsubs) == {"switch.a", "switch.b", "switch.c"}
+    assert group.extra_state_attributes["entity_id"] == ["switch.b", "switch.c"]
+    group.async_write_ha_state.assert_called_once()
+
+
+def test_flush_skips_identical_writes_until_another_write_happens(
+    mock_hass, fake_states, monkeypatch
+):
+    from homeassistant.helpers.entity import Entity
+
+    from custom_components.linus_dashboard.switch import SwitchGroup
+
+    written = MagicMock()
+    monkeypatch.setattr(Entity, "async_write_ha_state", written)
+    fake_states.set("switch.a", "on")
+    group = SwitchGroup(mock_hass, "test_switches", None, None, {}, ["switch.a"])
+
+    group.async_flush_update()
+    group.async_flush_update()
+    assert written.call_count == 1
+
+    fake_states.set("switch.a", "off")
+    group.async_flush_update()
+    assert written.call_count == 2
+
+    # Any write outside the filter (a service call, a member change) may
+    # have put something else in the state machine: the next flush writes.
+    group.async_write_ha_state()
+    group.async_flush_update()
+    assert written.call_count == 4
+
+
+def test_member_events_update_attributes_without_rereading_members(
+    mock_hass, fake_states, monkeypatch
+):
+    from custom_components.linus_dashboard.switch import SwitchGroup
+
+    monkeypatch.setattr(
+        entity_group,
+        "async_get_state_dispatcher",
+        lambda _hass: SimpleNamespace(async_subscribe=lambda *_: MagicMock()),
+    )
+    fake_states.set("switch.a", "on")
+    fake_states.set("switch.b", "off")
+    group = SwitchGroup(
+        mock_hass, "test_switches", None, None, {}, ["switch.a", "switch.b"]
+    )
+    asyncio.run(group.async_added_to_hass())
+    assert group.extra_state_attributes["active_entity_ids"] == ["switch.a"]
+
+    # The tracker only learns from events; a recompute doesn't rescan.
+    fake_states.set("switch.b", "on")
+    group._async_state_changed(
+        SimpleNamespace(
+            data={"entity_id": "switch.b", "new_state": fake_states.get("switch.b")}
+        )
+    )
+    fake_states.set("switch.a", "off")
+    group._recompute()
+    assert group.extra_state_attributes["active_entity_ids"] == [
+        "switch.a",
+        "switch.b",
+    ]
+
+    # A membership change recounts from hass.states.
+    group.async_write_ha_state = MagicMock()
+    group.async_set_members(["switch.a", "switch.b", "switch.c"])
+    assert group.extra_state_attributes["active_entity_ids"] == ["switch.b"]
+
+
+def test_member_lists_are_served_on_demand(mock_hass, fake_states, monkeypatch):
+    from custom_components.linus_dashboard.switch import SwitchGroup
+
+    monkeypatch.setattr(
+        entity_group,
+        "async_get_state_dispatcher",
+        lambda _hass: SimpleNamespace(async_subscribe=lambda *_: MagicMock()),
+    )
+    fake_states.set("switch.a", "on")
+    fake_states.set("switch.b", "off")
+    group = SwitchGroup(
+        mock_hass, "test_switches", None, None, {}, ["switch.a", "switch.b"]
+    )
+    asyncio.run(group.async_added_to_hass())
+    monkeypatch.setattr(
+        entity_group.entity_platform,
+        "async_get_platforms",
+        lambda _hass, _domain: [SimpleNamespace(entities={group.entity_id: group})],
+    )
+
+    assert entity_group.async_get_member_lists(mock_hass, group.entity_id) == {
+        "members": ["switch.a", "switch.b"],
+        "active": ["switch.a"],
+    }
+    assert entity_group.async_get_member_lists(mock_hass, "switch.other") is None
+    assert {"entity_id", "active_entity_ids"} <= SwitchGroup._unrecorded_attributes
+
+
+def test_presence_breakdown_lists_are_not_recorded():
+    from custom_components.linus_dashboard.binary_sensor import PresenceGroup
+
+    assert {
+        "entity_id",
+        "active_entity_ids",
+        "motion_entity_ids",
+        "presence_entity_ids",
+        "occupancy_entity_ids",
+        "media_entity_ids",
+    } <= PresenceGroup._unrecorded_attributes
+
+
+def test_compact_presence_groups_serve_their_breakdown_on_demand(
+    mock_hass, fake_states
+):
+    from custom_components.linus_dashboard.binary_sensor import PresenceGroup
+
+    fake_states.set("binary_sensor.motion", "on")
+    fake_states.set("media_player.tv", "off")
+    breakdown = {"motion": ["binary_sensor.motion"], "media": ["media_player.tv"]}
+    group = PresenceGroup(
+        mock_hass,
+        unique_id="test_presence",
+        translation_key="presence",
+        translation_placeholders=None,
+        device_info={},
+        member_entity_ids=["binary_sensor.motion", "media_player.tv"],
+        breakdown=breakdown,
+    )
+    group._recompute()
+    assert group.extra_state_attributes["motion_entity_ids"] == breakdown["motion"]
+
+    mock_hass.data[DOMAIN] = {entity_group.DATA_COMPACT_GROUP_ATTRIBUTES: True}
+    group._recompute()
+    assert group.is_on
+    assert "motion_entity_ids" not in group.extra_state_attributes
+    assert "entity_id" not in group.extra_state_attributes
+
+    lists = group.member_lists()
+    assert lists["media"] == ["media_player.tv"]
+    page = entity_group.member_page(mock_hass, lists, member_filter="motion")
+    assert [m["entity_id"] for m in page["members"]] == ["binary_sensor.motion"]
+    assert (
+        entity_group.member_page(mock_hass, lists, member_filter="presence")["members"]
+        == []
+    )
+
+
+def test_rebuilt_presence_group_takes_the_new_breakdown(
+    mock_hass, fake_states, monkeypatch
+):
+    from custom_components.linus_dashboard import binary_sensor
+
+    monkeypatch.setattr(binary_sensor, "_PRESENCE_GROUPS", {})
+    monkeypatch.setattr(
+        entity_group,
+        "async_get_state_dispatcher",
+        lambda _hass: SimpleNamespace(async_subscribe=lambda *_: MagicMock()),
+    )
+    fake_states.set("binary_sensor.motion", "on")
+    fake_states.set("binary_sensor.radar", "off")
+    members = ["binary_sensor.motion", "media_player.tv"]
+
+    def rebuild(breakdown):
+        return binary_sensor._get_or_create_presence_group(
+            mock_hass, "test_presence", "presence", None, {}, members, breakdown
+        )
+
+    group = rebuild({"motion": ["binary_sensor.motion"], "media": ["media_player.tv"]})
+    group.async_write_ha_state = MagicMock()
+    asyncio.run(group.async_added_to_hass())
+    group.async_write_ha_state.reset_mock()
+
+    # The motion sensor replaced by a presence one.
+    members = ["binary_sensor.radar", "media_player.tv"]
+    assert rebuild({"presence": ["binary_sensor.radar"]}) is group
+    assert rebuild({"presence": ["binary_sensor.radar"]}) is group
+    group.async_write_ha_state.assert_called_once()
+    assert group.extra_state_attributes["presence_entity_ids"] == [
+        "binary_sensor.radar"
+    ]
+    assert "motion_entity_ids" not in group.extra_state_attributes
+
+    lists = group.member_lists()
+    assert "media" not in lists
+    page = entity_group.member_page(mock_hass, lists, member_filter="presence")
+    assert [m["entity_id"] for m in page["members"]] == ["binary_sensor.radar"]
+    assert (
+        entity_group.member_page(mock_hass, lists, member_filter="motion")["members"]
+        == []
+    )
+
+    # A breakdown-only change (member set unchanged) is written too.
+    group.async_write_ha_state.reset_mock()
+    rebuild({"presence": ["binary_sensor.radar"], "media": ["media_player.tv"]})
+    group.async_write_ha_state.assert_called_once()
+    assert group.member_lists()["media"] == ["media_player.tv"]
+
+
+def test_member_page_filters_searches_and_pages(mock_hass, fake_states):
+    for i in range(5):
+        fake_states.set(f"light.salon_{i}", "on" if i % 2 else "off")
+    fake_states.set("light.cuisine", "unavailable")
+    lists = {
+        "members": [*(f"light.salon_{i}" for i in range(5)), "light.cuisine"],
+        "active": ["light.salon_1", "light.salon_3"],
+    }
+
+    page = entity_group.member_page(mock_hass, lists, offset=2, limit=3)
+    assert (page["total"], page["count"], page["active_count"]) == (6, 6, 2)
+    assert [m["entity_id"] for m in page["members"]] == [
+        "light.salon_2",
+        "light.salon_3",
+        "light.salon_4",
+    ]
+    assert page["members"][1] == {
+        "entity_id": "light.salon_3",
+        "name": "salon 3",
+        "state": "on",
+        "active": True,
+    }
+
+    active = entity_group.member_page(mock_hass, lists, member_filter="active")
+    assert [m["entity_id"] for m in active["members"]] == lists["active"]
+    down = entity_group.member_page(mock_hass, lists, member_filter="unavailable")
+    assert [m["entity_id"] for m in down["members"]] == ["light.cuisine"]
+    found = entity_group.member_page(mock_hass, lists, search="CUISINE")
+    assert found["count"] == 1
+    by_id = entity_group.member_page(mock_hass, lists, search="LIGHT.SALON_2")
+    assert [m["entity_id"] for m in by_id["members"]] == ["light.salon_2"]
+
+
+def test_compact_attributes_publish_counts_only(mock_hass, fake_states):
+    fake_states.set("light.a", "on")
+    fake_states.set("light.b", "off")
+    mock_hass.data[DOMAIN] = {entity_group.DATA_COMPACT_GROUP_ATTRIBUTES: True}
+
+    attributes = entity_group.compute_group_attributes(
+        mock_hass,
+        domain="light",
+        device_class=None,
+        member_entity_ids=["light.a", "light.b"],
+    )
+
+    assert "entity_id" not in attributes
+    assert "active_entity_ids" not in attributes
+    assert (attributes["total"], attributes["active_count"]) == (2, 1)
@@ -0,0 +1,321 @@
+"""Unit tests for group_engine.py's dispatcher, debounce wheel and propagation."""
+
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.linus_dashboard.group_engine import (
+    AggregateFeed,
+    DebounceWheel,
+    PropagationEngine,
+    StateDispatcher,
+)
+
+
+def state_event(entity_id: str) -> SimpleNamespace:
+    return SimpleNamespace(data={"entity_id": entity_id})
+
+
+def test_one_bus_listener_fans_out_only_to_dependents(mock_hass):
+    mock_hass.bus = MagicMock()
+    dispatcher = StateDispatcher(mock_hass)
+    area_group, presence_group, other_group = MagicMock(), MagicMock(), MagicMock()
+
+    dispatcher.async_subscribe("light.a", area_group)
+    dispatcher.async_track(["light.a", "binary_sensor.m"], presence_group)
+    dispatcher.async_subscribe("light.b", other_group)
+
+    # However many groups subscribe, one state_changed listener.
+    mock_hass.bus.async_listen.assert_called_once()
+    event_filter = mock_hass.bus.async_listen.call_args.kwargs["event_filter"]
+    assert event_filter({"entity_id": "light.a"})
+    assert not event_filter({"entity_id": "light.unrelated"})
+
+    event = state_event("light.a")
+    dispatcher._async_dispatch(event)
+
+    area_group.assert_called_once_with(event)
+    presence_group.assert_called_once_with(event)
+    other_group.assert_not_called()
+    assert dispatcher.as_dict()["subscriptions"] == 4
+
+
+def test_unsubscribing_everything_drops_the_bus_listener(mock_hass):
+    mock_hass.bus = MagicMock()
+    dispatcher = StateDispatcher(mock_hass)
+    action = MagicMock()
+
+    unsub_a = dispatcher.async_subscribe("light.a", action)
+    unsub_both = dispatcher.async_track(["light.a", "light.b"], MagicMock())
+
+    unsub_both()
+    dispatcher._async_dispatch(state_event("light.b"))
+    assert not mock_hass.bus.async_listen.return_value.called
+
+    unsub_a()
+    mock_hass.bus.async_listen.return_value.assert_called_once()
+    assert dispatcher.as_dict()["entities"] == 0
+    action.assert_not_called()
+
+
+def test_wheel_arms_one_timer_per_tick_at_an_aligned_boundary(mock_hass):
+    wheel = DebounceWheel(mock_hass, tick=0.1)
+    fired: list[str] = []
+    actions = {name: (lambda name=name: fired.append(name)) for name in "abc"}
+
+    cancel_a = wheel.async_schedule(actions["a"])
+    timer = wheel._timer
+    for _ in range(100):
+        wheel.async_schedule(actions["b"])
+    wheel.async_schedule(actions["c"])
+    cancel_a()
+
+    # However many events and groups, one timer until the tick fires...
+    assert wheel._timer is timer
+    assert 0 < timer.when() - mock_hass.loop.time() <= 0.1
+    assert round(timer.when() / 0.1, 6).is_integer()
+    wheel._async_tick()
+    # ...which runs every pending action once, then disarms.
+    assert fired == ["b", "c"]
+    assert wheel._timer is None
+    assert wheel.as_dict()["pending"] == 0
+
+
+def test_cancelling_the_last_pending_action_disarms_the_wheel(mock_hass):
+    wheel = DebounceWheel(mock_hass)
+    cancel = wheel.async_schedule(MagicMock())
+    timer = wheel._timer
+
+    cancel()
+
+    assert timer.cancelled()
+    assert wheel._timer is None
+
+
+def test_busy_groups_get_wider_windows_up_to_the_hard_maximum(mock_hass):
+    wheel = DebounceWheel(mock_hass, min_window=0.1, max_window=2.0)
+    power = wheel.async_event_rate("sensor.power")
+    wheel.async_event_rate("light.quiet").observe(mock_hass.loop.time() - 600)
+    start = mock_hass.loop.time() - 10
+    for i in range(40):  # 4 events/s for the last 10 seconds
+        power.observe(start + i * 0.25)
+
+    busy = wheel.window(power.per_second(mock_hass.loop.time()))
+    assert wheel.window(0.0) == 0.1
+    assert 0.5 < busy < 2.0
+    assert wheel.window(1000.0) == 2.0
+    assert list(wheel.as_dict()["widened_windows"]) == ["sensor.power"]
+
+
+def test_each_window_fires_in_its_own_slot(mock_hass):
+    wheel = DebounceWheel(mock_hass, min_window=0.1, max_window=2.0)
+    fired: list[str] = []
+    wheel.async_schedule(lambda: fired.append("quiet"))
+    cancel_busy = wheel.async_schedule(lambda: fired.append("busy"), rate=100.0)
+    first_when = wheel._timer.when()
+
+    wheel._async_tick()
+    assert fired == ["quiet"]
+    # Re-armed for the busy group's own, later boundary, within the maximum.
+    assert 0 < wheel._timer.when() - first_when <= 2.0
+    cancel_busy()
+    assert wheel._timer is None
+    assert wheel.as_dict()["pending"] == 0
+
+
+class _Group:
+    def __init__(self, engine, flushed, entity_id, tier):
+        self.entity_id = entity_id
+        self.group_scope = (tier, None)
+        self._engine = engine
+        self._flushed = flushed
+        self.saw_in_flush = None
+
+    def async_flush_update(self):
+        self.saw_in_flush = self._engine.in_flush(self)
+        self._flushed.append(self.entity_id)
+
+
+def test_dirty_areas_flush_with_their_floor_and_global_in_one_tick(mock_hass):
+    engine = PropagationEngine(mock_hass)
+    flushed: list[str] = []
+    salon, cuisine, chambre = (
+        _Group(engine, flushed, f"light.{area}", "area")
+        for area in ("salon", "cuisine", "chambre")
+    )
+    rdc = _Group(engine, flushed, "light.rdc", "floor")
+    etage = _Group(engine, flushed, "light.etage", "floor")
+    house = _Group(engine, flushed, "light.global", "global")
+    engine.async_set_children(rdc, (), ["light.salon", "light.cuisine"])
+    engine.async_set_children(etage, (), ["light.chambre"])
+    engine.async_set_children(house, (), ["light.rdc", "light.etage"])
+
+    # Marked in this order, but flushed bottom-up — and rdc/global once.
+    engine.async_mark_dirty(house)
+    engine.async_mark_dirty(salon)
+    engine.async_mark_dirty(cuisine)
+    engine._async_flush()
+
+    assert sorted(flushed[:2]) == ["light.cuisine", "light.salon"]
+    assert flushed[2:] == ["light.rdc", "light.global"]
+    assert rdc.saw_in_flush
+    assert house.saw_in_flush
+    assert not engine.in_flush(house)
+    assert chambre.saw_in_flush is None
+    assert etage.saw_in_flush is None
+    assert engine.as_dict()["recomputes"] == 4
+
+
+def test_removed_children_no_longer_propagate(mock_hass):
+    engine = PropagationEngine(mock_hass)
+    flushed: list[str] = []
+    salon = _Group(engine, flushed, "light.salon", "area")
+    rdc = _Group(engine, flushed, "light.rdc", "floor")
+    engine.async_set_children(rdc, (), ["light.salon"])
+    engine.async_set_children(rdc, ["light.salon"], ())
+
+    engine.async_mark_dirty(salon)
+    engine._async_flush()
+
+    assert flushed == ["light.salon"]
+
+
+def test_priority_lane_propagates_at_once_ahead_of_the_batch(mock_hass):
+    engine = PropagationEngine(mock_hass)
+    flushed: list[str] = []
+    smoke = _Group(engine, flushed, "binary_sensor.smoke_cuisine", "area")
+    lights = _Group(engine, flushed, "light.salon", "area")
+    rdc = _Group(engine, flushed, "binary_sensor.smoke_rdc", "floor")
+    house = _Group(engine, flushed, "binary_sensor.smoke", "global")
+    engine.async_set_children(rdc, (), ["binary_sensor.smoke_cuisine"])
+    engine.async_set_children(house, (), ["binary_sensor.smoke_rdc"])
+
+    engine.async_mark_dirty(lights, since=time.time())
+    engine.async_propagate_now(smoke, since=time.time() - 0.01)
+
+    # Area, floor and global written synchronously; the batch still waits.
+    assert flushed == [
+        "binary_sensor.smoke_cuisine",
+        "binary_sensor.smoke_rdc",
+        "binary_sensor.smoke",
+    ]
+    assert rdc.saw_in_flush
+    assert not engine.in_flush(house)
+    engine._async_flush()
+    assert flushed[-1] == "light.salon"
+
+    latency = engine.as_dict()["latency"]
+    assert latency["priority"]["propagations"] == 1
+    assert latency["priority"]["max_ms"] >= 10
+    assert latency["batched"]["propagations"] == 1
+
+
+def test_nested_priority_run_keeps_the_outer_runs_ancestors_in_flush(mock_hass):
+    engine = PropagationEngine(mock_hass)
+    flushed: list[str] = []
+    smoke = _Group(engine, flushed, "binary_sensor.smoke_cuisine", "area")
+    salon = _Group(engine, flushed, "binary_sensor.smoke_salon", "area")
+    rdc = _Group(engine, flushed, "binary_sensor.smoke_rdc", "floor")
+    house = _Group(engine, flushed, "binary_sensor.smoke", "global")
+    engine.async_set_children(
+        rdc, (), ["binary_sensor.smoke_cuisine", "binary_sensor.smoke_salon"]
+    )
+    engine.async_set_children(house, (), ["binary_sensor.smoke_rdc"])
+    after_nested: list[bool] = []
+
+    def _flush_salon():
+        flushed.append(salon.entity_id)
+        # A priority event lands while the batched flush is running.
+        engine.async_propagate_now(smoke)
+        after_nested.append(engine.in_flush(rdc))
+        after_nested.append(engine.in_flush(house))
+
+    salon.async_flush_update = _flush_salon
+    engine.async_mark_dirty(salon)
+    engine._async_flush()
+
+    # The outer run's floor and global were still pending after the nested
+    # run, and were recomputed by it once more.
+    assert after_nested == [True, True]
+    assert flushed[-2:] == ["binary_sensor.smoke_rdc", "binary_sensor.smoke"]
+    assert not engine.in_flush(rdc)
+    assert not engine.in_flush(house)
+
+
+def test_storm_defers_updates_then_recomputes_each_group_once(mock_hass, monkeypatch):
+    mock_hass.bus = MagicMock()
+    # A frozen clock, so the burst can't straddle two whole seconds.
+    monkeypatch.setattr(mock_hass.loop, "time", lambda: 1000.5)
+    dispatcher = StateDispatcher(mock_hass)
+    storm = dispatcher.storm
+    storm.start_rate = 10
+    ran: list[str] = []
+    group_a, group_b = (lambda: ran.append("a")), (lambda: ran.append("b"))
+
+    for i in range(10):
+        dispatcher.async_subscribe(f"light.{i}", MagicMock())
+        dispatcher._async_dispatch(state_event(f"light.{i}"))
+    assert storm.active
+
+    for _ in range(50):
+        storm.async_defer(group_a)
+    cancel_b = storm.async_defer(group_b)
+    storm.async_defer(group_b)
+    # Still stormy: nothing runs yet.
+    storm._window_events = 100
+    storm._async_tick()
+    assert storm.active
+    assert not ran
+
+    cancel_b()
+    storm.async_defer(group_b)
+    storm._async_tick()
+    assert not storm.active
+    assert ran == ["a", "b"]
+    assert storm.as_dict()["recomputes_saved"] == 51
+
+
+def test_feed_pushes_only_changed_fields_once_per_tick_per_scope(mock_hass):
+    feed = AggregateFeed(mock_hass)
+    everything: list[dict] = []
+    rdc: list[dict] = []
+    snapshot = [
+        ("light.salon", ("area", "salon"), {"value": "off", "active_count": 0}),
+        ("light.rdc", ("floor", "rdc"), {"value": "off", "active_count": 0}),
+    ]
+    unsub_all = feed.async_subscribe(everything.append, snapshot)
+    unsub_rdc = feed.async_subscribe(rdc.append, snapshot, tier="floor", scope_id="rdc")
+    assert rdc == [{"light.rdc": {"value": "off", "active_count": 0}}]
+    assert len(everything[0]) == 2
+
+    feed.async_publish(
+        "light.salon", ("area", "salon"), {"value": "on", "active_count": 1}
+    )
+    feed.async_publish(
+        "light.salon", ("area", "salon"), {"value": "on", "active_count": 2}
+    )
+    feed.async_publish(
+        "light.rdc", ("floor", "rdc"), {"value": "off", "active_count": 0}
+    )
+    feed.async_publish(
+        "light.rdc", ("floor", "rdc"), {"value": "on", "active_count": 2}
+    )
+    timer = feed._timer
+    feed.async_remove("light.salon")
+    # However many writes, one timer until the tick...
+    assert feed._timer is timer
+    feed._async_flush()
+
+    # ...then one push per subscriber with what changed in its scope.
+    assert everything[1:] == [
+        {"light.salon": None, "light.rdc": {"value": "on", "active_count": 2}}
+    ]
+    assert rdc[1:] == [{"light.rdc": {"value": "on", "active_count": 2}}]
+    assert feed.as_dict()["unchanged_writes"] == 1
+
+    unsub_all()
+    unsub_rdc()
+    # Nobody subscribed: nothing tracked.
+    feed.async_publish("light.rdc", ("floor", "rdc"), {"value": "off"})
+    assert feed._timer is None
+    assert not feed._current
@@ -0,0 +1,150 @@
+"""Tests for group_manager.py's options-change registry and RebuildScheduler."""
+
+import asyncio
+
+from custom_components.linus_dashboard.const import DOMAIN
+from custom_components.linus_dashboard.group_manager import (
+    DATA_REBUILD_SCHEDULERS,
+    RebuildScheduler,
+    async_register_options_callback,
+    async_run_options_callbacks,
+)
+
+
+def test_options_callbacks_run_per_entry_until_unregistered(
+    mock_hass, mock_config_entry
+):
+    calls: list[str] = []
+
+    async def _rebuild_light() -> None:
+        calls.append("light")
+
+    async def _rebuild_cover() -> None:
+        calls.append("cover")
+
+    unregister_light = async_register_options_callback(
+        mock_hass, mock_config_entry, _rebuild_light
+    )
+    async_register_options_callback(mock_hass, mock_config_entry, _rebuild_cover)
+
+    asyncio.run(async_run_options_callbacks(mock_hass, mock_config_entry))
+    assert calls == ["light", "cover"]
+
+    unregister_light()
+    calls.clear()
+    asyncio.run(async_run_options_callbacks(mock_hass, mock_config_entry))
+    assert calls == ["cover"]
+
+
+def test_options_callbacks_without_registrations_is_a_no_op(
+    mock_hass, mock_config_entry
+):
+    asyncio.run(async_run_options_callbacks(mock_hass, mock_config_entry))
+
+
+def _scheduler(mock_hass, calls, keys=("light", "binary_sensor+media_player")):
+    mock_hass.is_running = True
+    scheduler = RebuildScheduler(mock_hass)
+    for key in keys:
+
+        async def _rebuild(area_ids, key=key) -> None:
+            calls.append((key, None if area_ids is None else sorted(area_ids)))
+
+        scheduler.async_register(key, key.split("+"), _rebuild)
+    return scheduler
+
+
+def test_scheduler_coalesces_a_burst_into_one_rebuild_per_platform(mock_hass):
+    calls: list = []
+    scheduler = _scheduler(mock_hass, calls)
+
+    for _ in range(20):
+        scheduler.async_request(["light"], {"salon"})
+    scheduler.async_request(["light"], {"cuisine"})
+    scheduler.async_request(["binary_sensor+media_player"])
+    asyncio.run(scheduler._async_run())
+
+    assert calls == [
+        ("light", ["cuisine", "salon"]),
+        ("binary_sensor+media_player", None),
+    ]
+    assert scheduler.requests == 22
+    assert scheduler.coalesced == 20
+    assert scheduler.passes == 1
+    assert scheduler.targeted == 1
+
+
+def test_scheduler_full_request_widens_a_pending_targeted_one(mock_hass):
+    calls: list = []
+    scheduler = _scheduler(mock_hass, calls, keys=("light",))
+
+    scheduler.async_request(["light"], {"salon"})
+    scheduler.async_request()
+    asyncio.run(scheduler._async_run())
+
+    assert calls == [("light", None)]
+
+
+def test_scheduler_queues_at_most_one_pass_behind_a_running_one(mock_hass):
+    calls: list = []
+    scheduler = _scheduler(mock_hass, calls, keys=())
+
+    async def _rebuild(area_ids) -> None:
+        calls.append(sorted(area_ids))
+        if len(calls) == 1:
+            # Registry events landing mid-rebuild.
+            for area_id in ("bureau", "garage", "bureau", "entree", "garage"):
+                scheduler.async_request(["light"], {area_id})
+
+    scheduler.async_register("light", ["light"], _rebuild)
+    scheduler.async_request(["light"], {"salon"})
+    scheduler._running = True
+    asyncio.run(scheduler._async_run())
+
+    assert calls == [["salon"], ["bureau", "entree", "garage"]]
+    assert scheduler.passes == 2
+    assert scheduler.skipped == 4
+    assert not scheduler._running
+
+
+def test_options_rebuild_waits_for_a_running_pass(mock_hass, mock_config_entry):
+    calls: list = []
+    scheduler = _scheduler(mock_hass, calls, keys=())
+    mock_hass.data.setdefault(DOMAIN, {}).setdefault(DATA_REBUILD_SCHEDULERS, {})[
+        mock_config_entry.entry_id
+    ] = scheduler
+
+    async def _rebuild(area_ids) -> None:
+        calls.append("pass start")
+        await asyncio.sleep(0)
+        calls.append("pass end")
+
+    async def _rebuild_options() -> None:
+        calls.append("options")
+
+    scheduler.async_register("light", ["light"], _rebuild)
+    async_register_options_callback(mock_hass, mock_config_entry, _rebuild_options)
+
+    async def _race() -> None:
+        scheduler.async_request(["light"], {"salon"})
+        scheduler._running = True
+        run = asyncio.ensure_future(scheduler._async_run())
+        await asyncio.sleep(0)
+        await async_run_options_callbacks(mock_hass, mock_config_entry)
+        await run
+
+    asyncio.run(_race())
+
+    assert calls == ["pass start", "pass end", "options"]
+    assert scheduler.exclusive_runs == 1
+
+
+def test_scheduler_routes_area_changes_to_platforms_monitoring_the_domain(
+    mock_hass,
+):
+    scheduler = _scheduler(mock_hass, [])
+
+    scheduler._async_areas_changed("media_player", frozenset({"salon", "cuisine"}))
+
+    assert scheduler._pending == {"binary_sensor+media_player": {"salon", "cuisine"}}
+    scheduler.async_cancel()
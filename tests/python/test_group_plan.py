@@ -0,0 +1,76 @@
+"""
+Unit tests for group_plan.py's pure hierarchy planning.
+
+No entities, no hass entity machinery: only a TopologyCache built from the
+fake registries and plain member dicts in, PlannedGroups out.
+"""
+
+from custom_components.linus_dashboard.group_plan import (
+    GLOBAL_SCOPE,
+    RebuildScope,
+    plan_nested_groups,
+)
+from custom_components.linus_dashboard.topology import TopologyCache
+
+
+def _topology(mock_hass, fake_registries) -> TopologyCache:
+    fake_registries.add_floor("rdc", "Rez-de-chaussée")
+    fake_registries.add_floor("etage", "Étage")
+    fake_registries.add_area("salon", "Salon", floor_id="rdc")
+    fake_registries.add_area("cuisine", "Cuisine", floor_id="rdc")
+    fake_registries.add_area("chambre", "Chambre", floor_id="etage")
+    topology = TopologyCache(mock_hass)
+    topology.async_build()
+    return topology
+
+
+def test_plan_nests_areas_into_floors_into_global_by_unique_id(
+    mock_hass, fake_registries
+):
+    topology = _topology(mock_hass, fake_registries)
+
+    planned = plan_nested_groups(
+        topology,
+        unique_id_prefix="ld",
+        area_entities={"salon": ["light.a"], "chambre": ["light.b"], "cuisine": []},
+        area_names={"salon": "Salon", "chambre": "Chambre", "cuisine": "Cuisine"},
+        floor_areas={"rdc": ["salon"], "etage": ["chambre"]},
+    )
+
+    by_id = {group.unique_id: group for group in planned}
+    # Children always come before the groups nesting them.
+    assert list(by_id) == [
+        "ld_area_salon",
+        "ld_area_chambre",
+        "ld_floor_rdc",
+        "ld_floor_etage",
+        "ld_global",
+    ]
+    assert by_id["ld_area_salon"].members == ("light.a",)
+    assert not by_id["ld_area_salon"].nested
+    assert by_id["ld_floor_rdc"].members == ("ld_area_salon",)
+    assert by_id["ld_floor_rdc"].name == "Rez-de-chaussée"
+    assert by_id["ld_global"].members == ("ld_floor_rdc", "ld_floor_etage")
+    assert by_id["ld_global"].scope == GLOBAL_SCOPE
+
+
+def test_scoped_plan_only_covers_scope_and_nests_existing_children(
+    mock_hass, fake_registries
+):
+    topology = _topology(mock_hass, fake_registries)
+    scope = RebuildScope(area_ids=frozenset({"cuisine"}), floor_ids=frozenset({"rdc"}))
+
+    planned = plan_nested_groups(
+        topology,
+        unique_id_prefix="ld",
+        area_entities={"cuisine": ["light.c"]},
+        area_names={"cuisine": "Cuisine"},
+        floor_areas={"rdc": ["cuisine"]},
+        scope=scope,
+        existing_ids={"ld_area_salon", "ld_area_chambre", "ld_floor_etage"},
+    )
+
+    by_id = {group.unique_id: group for group in planned}
+    assert list(by_id) == ["ld_area_cuisine", "ld_floor_rdc", "ld_global"]
+    assert by_id["ld_floor_rdc"].members == ("ld_area_salon", "ld_area_cuisine")
+    assert by_id["ld_global"].members == ("ld_floor_rdc", "ld_floor_etage")
@@ -17,11 +17,18 @@ construction-time count forever.
 """
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+from custom_components.linus_dashboard import entity_group
+from custom_components.linus_dashboard.group_engine import (
+    async_get_debounce_wheel,
+    async_get_write_stats,
+)
 from custom_components.linus_dashboard.sensor import (
     MAX_UNAVAILABLE_ENTITY_IDS,
     LinusDashboardHealthSensor,
+    LinusDashboardNumericAggregateSensor,
 )
 
 
@@ -87,6 +94,9 @@ def test_entity_id_list_is_capped_but_total_stays_the_real_count(
         len(sensor._attr_extra_state_attributes["entity_id"])
         == MAX_UNAVAILABLE_ENTITY_IDS
     )
+    # The full list is still served on demand, and never recorded.
+    assert sensor.member_lists()["unavailable"] == entity_ids
+    assert "entity_id" in sensor._unrecorded_attributes
 
 
 def test_area_scope_missing_state_entirely_is_not_counted_as_unavailable(
@@ -160,7 +170,7 @@ def test_debounced_update_reflects_state_that_changed_after_construction(
     fake_states.set("light.salon_principal", "off")
 
     # Simulate the debounced recompute that a state_changed event schedules
-    # (bypassing the real async_call_later timer, which needs a live loop).
+    # (bypassing the shared debounce wheel's timer, which needs a live loop).
     sensor.async_write_ha_state = MagicMock()
     sensor._async_debounced_update()
 
@@ -175,42 +185,156 @@ def test_async_state_changed_schedules_a_debounced_update(mock_hass, fake_states
 
     sensor._async_state_changed(MagicMock())
 
-    # async_call_later returns an unsubscribe callable; a mock hass makes it
-    # a MagicMock rather than a real timer handle, but the important part is
+    # The shared wheel hands back a cancel callable: the important part is
     # that a debounce was actually scheduled, not silently dropped.
     assert sensor._debounce_unsub is not None
+    assert async_get_debounce_wheel(mock_hass).as_dict()["pending"] == 1
 
 
-def test_async_state_changed_cancels_previous_pending_debounce(mock_hass, fake_states):
-    # _debounce_unsub is `TimerHandle.cancel` (a real bound method, not a
-    # mock — async_call_later schedules on the fixture's real, never-run
-    # event loop), so assert on the underlying TimerHandle's own cancelled
-    # flag via __self__ rather than a call count.
+def test_async_state_changed_joins_the_pending_tick(mock_hass, fake_states):
+    # A burst of events no longer cancels and re-creates a timer per event:
+    # every event before the wheel's next tick rides on the one pending
+    # slot, and the sensor recomputes once when that tick fires.
     sensor = make_sensor(mock_hass, ["light.a"], nested=False)
+    sensor.async_write_ha_state = MagicMock()
     sensor._async_state_changed(MagicMock())
-    first_handle = sensor._debounce_unsub.__self__
+    first_unsub = sensor._debounce_unsub
 
+    sensor._async_state_changed(MagicMock())
     sensor._async_state_changed(MagicMock())
 
-    assert first_handle.cancelled()
-    assert sensor._debounce_unsub is not None
-    assert sensor._debounce_unsub.__self__ is not first_handle
+    assert sensor._debounce_unsub is first_unsub
+    wheel = async_get_debounce_wheel(mock_hass)
+    assert wheel.as_dict()["scheduled"] == 1
+    wheel._async_tick()
+    sensor.async_write_ha_state.assert_called_once()
+    assert sensor._debounce_unsub is None
 
 
 def test_async_will_remove_from_hass_unsubscribes_both_listeners(
     mock_hass, fake_states
 ):
     sensor = make_sensor(mock_hass, ["light.a"], nested=False)
-    sensor._unsub_state_changed = MagicMock()
+    sensor._subscriptions = MagicMock()
     sensor._debounce_unsub = MagicMock()
-    unsub_state, debounce_unsub = sensor._unsub_state_changed, sensor._debounce_unsub
+    subscriptions, debounce_unsub = sensor._subscriptions, sensor._debounce_unsub
 
     # No real await needed — async_will_remove_from_hass has no I/O of its
     # own, so run it via asyncio.run rather than pulling in pytest-asyncio
     # for one coroutine.
     asyncio.run(sensor.async_will_remove_from_hass())
 
-    unsub_state.assert_called_once()
+    subscriptions.async_clear.assert_called_once()
     debounce_unsub.assert_called_once()
-    assert sensor._unsub_state_changed is None
     assert sensor._debounce_unsub is None
+
+
+def test_set_members_swaps_tracked_entities_in_place_by_diff(
+    mock_hass, fake_states, monkeypatch
+):
+    # A rebuild hands existing sensors their new member list instead of
+    # re-creating them, synchronously, (un)subscribing only the diff.
+    fake_states.set("light.a", "unavailable")
+    fake_states.set("light.b", "unknown")
+    unsubs: dict[str, MagicMock] = {}
+
+    def subscribe(entity_id, _action):
+        unsubs[entity_id] = MagicMock()
+        return unsubs[entity_id]
+
+    monkeypatch.setattr(
+        entity_group,
+        "async_get_state_dispatcher",
+        lambda _hass: SimpleNamespace(async_subscribe=subscribe),
+    )
+    sensor = make_sensor(mock_hass, ["light.a"], nested=False)
+    sensor.async_write_ha_state = MagicMock()
+    asyncio.run(sensor.async_added_to_hass())
+
+    assert not sensor.async_set_members(["light.a"])
+    sensor.async_write_ha_state.assert_not_called()
+
+    assert sensor.async_set_members(["light.a", "light.b"])
+    assert sensor.async_set_members(["light.b"])
+    unsubs["light.a"].assert_called_once()
+    unsubs["light.b"].assert_not_called()
+    assert sensor.member_fingerprint == {"light.b"}
+    assert sensor._attr_extra_state_attributes["entity_id"] == ["light.b"]
+    assert sensor.async_write_ha_state.call_count == 2
+
+
+def test_debounced_update_skips_the_write_when_nothing_changed(mock_hass, fake_states):
+    fake_states.set("light.a", "unavailable")
+    sensor = make_sensor(mock_hass, ["light.a"], nested=False)
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._async_debounced_update()
+    # light.a flapped back to the same value before the next tick.
+    sensor._async_debounced_update()
+    sensor.async_write_ha_state.assert_called_once()
+
+    fake_states.set("light.a", "on")
+    sensor._async_debounced_update()
+    assert sensor.async_write_ha_state.call_count == 2
+    assert async_get_write_stats(mock_hass).as_dict() == {
+        "written": 2,
+        "suppressed": 1,
+    }
+
+
+def test_subscribed_sensor_recomputes_from_event_payloads(mock_hass, fake_states):
+    fake_states.set("light.a", "on")
+    fake_states.set("light.b", "on")
+    sensor = make_sensor(mock_hass, ["light.a", "light.b"], nested=False)
+    mock_hass.bus = MagicMock()
+    sensor._subscriptions.async_set(["light.a", "light.b"])  # the cache is live
+    sensor._update_state()
+    assert sensor._attr_native_value == 0
+
+    # Only the event's payload counts now, not a re-read of hass.states.
+    fake_states.set("light.a", "unavailable")
+    fake_states.set("light.b", "unavailable")
+    sensor._async_state_changed(
+        SimpleNamespace(
+            data={"entity_id": "light.b", "new_state": fake_states.get("light.b")}
+        )
+    )
+    sensor._update_state()
+    assert sensor._attr_extra_state_attributes["entity_id"] == ["light.b"]
+
+    # A membership change re-reads everything.
+    sensor.async_write_ha_state = MagicMock()
+    sensor.async_set_members(["light.a", "light.b", "light.c"])
+    assert sensor._attr_native_value == 2
+
+
+def test_numeric_sensor_skips_writes_for_jitter_below_its_precision(
+    mock_hass, fake_states
+):
+    fake_states.set("sensor.a", "1234.51")
+    fake_states.set("sensor.b", "10")
+    sensor = LinusDashboardNumericAggregateSensor(
+        mock_hass,
+        unique_id="linus_dashboard_power_area_test",
+        translation_key=None,
+        translation_placeholders=None,
+        device_info={},
+        device_class="power",
+        mode="sum",
+        member_entity_ids=["sensor.a", "sensor.b"],
+    )
+    sensor.async_write_ha_state = MagicMock()
+    sensor._async_debounced_update()
+
+    # Same rounded state, different raw partials: nothing written.
+    fake_states.set("sensor.a", "1234.53")
+    sensor._async_debounced_update()
+    sensor.async_write_ha_state.assert_called_once()
+    assert sensor._attr_extra_state_attributes["partials"]["sum"] == 1244.53
+
+    # One value fewer behind the same rounded state: written.
+    fake_states.set("sensor.a", "1244.53")
+    fake_states.set("sensor.b", "unavailable")
+    sensor._async_debounced_update()
+    assert sensor.async_write_ha_state.call_count == 2
+    assert sensor._attr_native_value == 1244.5
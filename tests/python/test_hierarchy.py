@@ -0,0 +1,75 @@
+"""Unit tests for hierarchy.py's per-pass shared member scan."""
+
+from custom_components.linus_dashboard.const import DOMAIN
+from custom_components.linus_dashboard.entity_group import ExclusionConfig
+from custom_components.linus_dashboard.hierarchy import HierarchyBuilder
+from custom_components.linus_dashboard.registry_index import (
+    DATA_REGISTRY_INDEX,
+    RegistryIndex,
+)
+
+
+def _house(mock_hass, fake_registries, fake_states) -> None:
+    fake_registries.add_floor("rdc", "Rez-de-chaussée")
+    fake_registries.add_area("salon", "Salon", floor_id="rdc")
+    fake_registries.add_area("cuisine", "Cuisine", floor_id="rdc")
+    for entity_id, area_id in (
+        ("light.salon", "salon"),
+        ("switch.salon", "salon"),
+        ("light.cuisine", "cuisine"),
+    ):
+        fake_registries.add_entity(entity_id, area_id=area_id)
+        fake_states.set(entity_id, "off")
+    index = RegistryIndex(mock_hass)
+    index.async_build()
+    mock_hass.data[DOMAIN] = {DATA_REGISTRY_INDEX: index}
+
+
+def test_every_platform_of_a_pass_reads_one_scan(
+    mock_hass, fake_registries, fake_states
+):
+    _house(mock_hass, fake_registries, fake_states)
+    builder = HierarchyBuilder(mock_hass)
+
+    with builder.shared_pass():
+        lights = builder.buckets(ExclusionConfig(), domains=("light",))
+        switches = builder.buckets(ExclusionConfig(), domains=("switch",))
+
+    assert lights is switches
+    assert lights.get("light").area_entities == {
+        "salon": ["light.salon"],
+        "cuisine": ["light.cuisine"],
+    }
+    assert switches.get("switch").area_entities == {"salon": ["switch.salon"]}
+    assert (builder.scans, builder.reused) == (1, 1)
+
+    # Outside a pass nothing is kept: each build scans for itself.
+    builder.buckets(ExclusionConfig(), domains=("light",))
+    assert builder.scans == 2
+
+
+def test_targeted_pass_scans_its_areas_once_and_rescans_for_wider_asks(
+    mock_hass, fake_registries, fake_states
+):
+    _house(mock_hass, fake_registries, fake_states)
+    builder = HierarchyBuilder(mock_hass)
+
+    with builder.shared_pass({"salon", "cuisine"}):
+        first = builder.buckets(
+            ExclusionConfig(), domains=("light",), area_ids={"salon"}
+        )
+        # The scan already covers every area of the pass.
+        assert "cuisine" in first.get("light").area_entities
+        assert (
+            builder.buckets(
+                ExclusionConfig(), domains=("switch",), area_ids={"cuisine"}
+            )
+            is first
+        )
+        # A full build, or other exclusions, can't reuse a targeted scan.
+        builder.buckets(ExclusionConfig(), domains=("light",))
+        builder.buckets(
+            ExclusionConfig(excluded_domains={"switch"}), domains=("light",)
+        )
+
+    assert (builder.scans, builder.reused) == (3, 1)
@@ -0,0 +1,195 @@
+"""
+Unit tests for registry_index.py's RegistryIndex and its topology.py cache.
+
+The index replaces every full entity-registry pass the scanners used to do,
+so these check the two things that matter: a fresh build buckets entities
+the same way the old scans filtered them (self-exclusion, hidden/disabled,
+device area fallback), and registry-updated events keep it current without
+a rebuild.
+"""
+
+from types import SimpleNamespace
+
+from custom_components.linus_dashboard.const import DOMAIN
+from custom_components.linus_dashboard.entity_group import (
+    ExclusionConfig,
+    scan_domain_members,
+)
+from custom_components.linus_dashboard.registry_index import (
+    DATA_REGISTRY_INDEX,
+    RegistryIndex,
+)
+
+
+def event(**data) -> SimpleNamespace:
+    return SimpleNamespace(data=data)
+
+
+def build_index(mock_hass) -> RegistryIndex:
+    index = RegistryIndex(mock_hass)
+    index.async_build()
+    mock_hass.data[DOMAIN] = {DATA_REGISTRY_INDEX: index}
+    return index
+
+
+def test_build_buckets_by_domain_device_class_and_area(mock_hass, fake_registries):
+    fake_registries.add_area("salon", "Salon", floor_id="rdc")
+    fake_registries.add_entity(
+        "binary_sensor.door", area_id="salon", device_class="door"
+    )
+    fake_registries.add_entity("light.a", area_id="salon")
+
+    index = build_index(mock_hass)
+
+    assert dict(index.iter_area_entities("binary_sensor", "door")) == {
+        "salon": ["binary_sensor.door"]
+    }
+    assert dict(index.iter_area_entities("light")) == {"salon": ["light.a"]}
+    assert index.device_classes("binary_sensor") == {"door"}
+    assert index.topology.area_floor_id("salon") == "rdc"
+
+
+def test_build_skips_own_hidden_and_disabled_entities(mock_hass, fake_registries):
+    fake_registries.add_area("salon", "Salon")
+    fake_registries.add_entity("light.own_group", area_id="salon", platform=DOMAIN)
+    fake_registries.add_entity("light.hidden", area_id="salon", hidden_by="user")
+    fake_registries.add_entity("light.disabled", area_id="salon", disabled_by="user")
+    fake_registries.add_entity("light.real", area_id="salon")
+
+    index = build_index(mock_hass)
+
+    assert dict(index.iter_area_entities("light")) == {"salon": ["light.real"]}
+
+
+def test_entity_inherits_device_area(mock_hass, fake_registries):
+    fake_registries.add_area("cuisine", "Cuisine")
+    fake_registries.add_device("dev1", area_id="cuisine")
+    fake_registries.add_entity("light.a", device_id="dev1")
+
+    index = build_index(mock_hass)
+
+    assert dict(index.iter_area_entities("light")) == {"cuisine": ["light.a"]}
+
+
+def test_entity_registry_update_moves_entity_between_areas(mock_hass, fake_registries):
+    fake_registries.add_area("salon", "Salon")
+    fake_registries.add_area("cuisine", "Cuisine")
+    entry = fake_registries.add_entity("light.a", area_id="salon")
+    index = build_index(mock_hass)
+
+    entry.area_id = "cuisine"
+    index._async_entity_registry_updated(
+        event(action="update", entity_id="light.a", changes={"area_id": "salon"})
+    )
+
+    assert dict(index.iter_area_entities("light")) == {"cuisine": ["light.a"]}
+
+
+def test_entity_registry_create_and_remove(mock_hass, fake_registries):
+    fake_registries.add_area("salon", "Salon")
+    index = build_index(mock_hass)
+
+    fake_registries.add_entity("switch.new", area_id="salon")
+    index._async_entity_registry_updated(event(action="create", entity_id="switch.new"))
+    assert dict(index.iter_area_entities("switch")) == {"salon": ["switch.new"]}
+
+    del fake_registries.entities["switch.new"]
+    index._async_entity_registry_updated(event(action="remove", entity_id="switch.new"))
+    assert dict(index.iter_area_entities("switch")) == {}
+
+
+def test_device_area_change_reindexes_its_entities(mock_hass, fake_registries):
+    fake_registries.add_area("salon", "Salon")
+    fake_registries.add_area("cuisine", "Cuisine")
+    fake_registries.add_device("dev1", area_id="salon")
+    fake_registries.add_entity("light.a", device_id="dev1")
+    fake_registries.add_entity("light.b", device_id="dev1")
+    index = build_index(mock_hass)
+
+    fake_registries.devices["dev1"].area_id = "cuisine"
+    index._async_device_registry_updated(
+        event(action="update", device_id="dev1", changes={"area_id": "salon"})
+    )
+
+    assert dict(index.iter_area_entities("light")) == {
+        "cuisine": ["light.a", "light.b"]
+    }
+
+
+def test_area_floor_change_and_removal(mock_hass, fake_registries):
+    fake_registries.add_area("salon", "Salon", floor_id="rdc")
+    fake_registries.add_entity("light.a", area_id="salon")
+    index = build_index(mock_hass)
+
+    fake_registries.areas["salon"].floor_id = "etage"
+    index._async_area_registry_updated(event(action="update", area_id="salon"))
+    assert index.topology.area_floor_id("salon") == "etage"
+
+    index._async_area_registry_updated(event(action="remove", area_id="salon"))
+    assert dict(index.iter_area_entities("light")) == {}
+
+
+def test_scan_domain_members_reads_from_index_and_applies_live_filters(
+    mock_hass, fake_registries, fake_states
+):
+    fake_registries.add_floor("rdc", "Rez-de-chaussée")
+    fake_registries.add_area("salon", "Salon", floor_id="rdc")
+    fake_registries.add_entity("light.a", area_id="salon")
+    fake_registries.add_entity("light.no_state", area_id="salon")
+    fake_registries.add_entity("light.foreign_group", area_id="salon")
+    fake_registries.add_entity("light.excluded", area_id="salon")
+    fake_states.set("light.a", "on")
+    fake_states.set("light.foreign_group", "on", {"entity_id": ["light.x"]})
+    fake_states.set("light.excluded", "on")
+    build_index(mock_hass)
+
+    scoped = scan_domain_members(
+        mock_hass,
+        domain="light",
+        device_class=None,
+        exclusions=ExclusionConfig(excluded_entity_ids={"light.excluded"}),
+    )
+
+    assert scoped.area_entities == {"salon": ["light.a"]}
+    assert scoped.area_names == {"salon": "Salon"}
+    assert scoped.floor_areas == {"rdc": ["salon"]}
+    assert scoped.floor_names == {"rdc": "Rez-de-chaussée"}
+
+
+def test_topology_caches_names_and_follows_floor_events(mock_hass, fake_registries):
+    fake_registries.add_floor("rdc", "RDC")
+    fake_registries.add_area("salon", "Salon", floor_id="rdc")
+    index = build_index(mock_hass)
+    topology = index.topology
+
+    assert topology.area("salon").name == "Salon"
+    assert topology.floor_name("rdc") == "RDC"
+
+    # Cached: a registry edit isn't seen until its event arrives.
+    fake_registries.floors["rdc"].name = "Rez-de-chaussée"
+    assert topology.floor_name("rdc") == "RDC"
+    index._async_floor_registry_updated(event(action="update", floor_id="rdc"))
+    assert topology.floor_name("rdc") == "Rez-de-chaussée"
+
+    index._async_floor_registry_updated(event(action="remove", floor_id="rdc"))
+    assert topology.floor_name("rdc") is None
+    assert topology.area_floor_id("salon") is None
+
+
+def test_device_update_without_area_change_leaves_entities_alone(
+    mock_hass, fake_registries, monkeypatch
+):
+    fake_registries.add_area("salon", "Salon")
+    fake_registries.add_device("dev1", area_id="salon")
+    fake_registries.add_entity("light.a", device_id="dev1")
+    index = build_index(mock_hass)
+    reindexed: list[str] = []
+    monkeypatch.setattr(index, "_reindex", reindexed.append)
+
+    # e.g. a firmware/name update: same area, nothing to re-place.
+    index._async_device_registry_updated(
+        event(action="update", device_id="dev1", changes={"sw_version": "1"})
+    )
+
+    assert reindexed == []
+    assert index.topology.device_area_id("dev1") == "salon"